@@ -0,0 +1,55 @@
+"""
+Measure ``set`` for fields that notify an
+``IBeforeSchemaFieldAssignedEvent``, when no subscriber handles the
+event, and inside ``suppressed_assignment_events``.
+
+Run with ``python bench_field_set.py``. The ``nti.schema``
+configuration is loaded, so its dispatcher is subscribed to these
+events.
+"""
+from __future__ import print_function, absolute_import
+import pyperf
+
+from zope.configuration import xmlconfig
+
+import nti.schema
+from nti.schema.field import ListOrTuple
+from nti.schema.field import ValidTextLine
+from nti.schema.field import Variant
+from nti.schema.field import suppressed_assignment_events
+
+
+class Context(object):
+    pass
+
+
+def bench_set(loops, field, value):
+    context = Context()
+    set_ = field.set
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        set_(context, value)
+    return pyperf.perf_counter() - t0
+
+
+def bench_set_suppressed(loops, field, value):
+    with suppressed_assignment_events():
+        return bench_set(loops, field, value)
+
+
+def main():
+    runner = pyperf.Runner()
+    xmlconfig.file('configure.zcml', nti.schema)
+    fields = (
+        ('ValidTextLine', ValidTextLine(__name__='name'), u'value'),
+        ('ListOrTuple', ListOrTuple(__name__='items'), [1, 2]),
+        ('Variant', Variant((ValidTextLine(), ListOrTuple()), __name__='var'), u'value'),
+    )
+    for name, field, value in fields:
+        runner.bench_time_func('set ' + name, bench_set, field, value)
+        runner.bench_time_func('set suppressed ' + name, bench_set_suppressed,
+                               field, value)
+
+
+if __name__ == '__main__':
+    main()
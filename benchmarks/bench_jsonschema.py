@@ -0,0 +1,167 @@
+"""
+Measure producing a JSON schema with ``JsonSchemafier`` for an
+interface with a mix of fields, and the helpers it uses for each
+field, including the choices of a vocabulary and translating
+messages.
+
+Run with ``python bench_jsonschema.py``.
+"""
+from __future__ import print_function, absolute_import
+import pyperf
+
+from zope import component
+from zope.i18n.interfaces import INegotiator
+from zope.i18n.interfaces import ITranslationDomain
+from zope.i18n.interfaces import IUserPreferredLanguages
+from zope.i18n.negotiator import negotiator
+from zope.i18n.simpletranslationdomain import SimpleTranslationDomain
+from zope.i18nmessageid import MessageFactory
+from zope.interface import Interface
+from zope.interface.interface import InterfaceClass
+from zope.interface import implementer
+from zope.schema import Dict
+from zope.schema import Choice
+from zope.schema import interfaces as sch_interfaces
+from zope.schema.vocabulary import SimpleTerm
+from zope.schema.vocabulary import SimpleVocabulary
+
+from nti.schema.field import Bool
+from nti.schema.field import Float
+from nti.schema.field import Int
+from nti.schema.field import ListOrTuple
+from nti.schema.field import Object
+from nti.schema.field import ValidChoice
+from nti.schema.field import ValidText
+from nti.schema.field import ValidTextLine
+from nti.schema.field import Variant
+from nti.schema.interfaces import find_most_derived_interface
+from nti.schema.jsonschema import JsonSchemafier
+from nti.schema.jsonschema import TranslationCache
+from nti.schema.jsonschema import get_data_from_choice_field
+
+
+class IAddress(Interface):
+    street = ValidTextLine(title=u'Street')
+    city = ValidTextLine(title=u'City')
+    postal_code = ValidTextLine(title=u'Postal code', required=False)
+
+
+class IProfile(Interface):
+    name = ValidTextLine(title=u'Name', description=u'The full name', max_length=100)
+    about = ValidText(title=u'About', required=False)
+    age = Int(title=u'Age', min=0, max=150)
+    score = Float(title=u'Score', required=False)
+    active = Bool(title=u'Active', default=True)
+    role = ValidChoice(title=u'Role', values=(u'admin', u'editor', u'viewer'))
+    tags = ListOrTuple(ValidTextLine(), title=u'Tags', required=False)
+    extra = Dict(key_type=ValidTextLine(), value_type=ValidTextLine(),
+                 title=u'Extra', required=False)
+    address = Object(IAddress, title=u'Address', required=False)
+    value = Variant((Int(), ValidTextLine()), title=u'Value', required=False)
+
+
+# A wide schema, with many fields of a few kinds.
+IWide = InterfaceClass('IWide', (Interface,), {
+    'field%d' % i: kind(title=u'Field %d' % i, required=False)
+    for i, kind in enumerate([ValidTextLine, Int, Float, Bool] * 25)
+})
+
+_ = MessageFactory('bench')
+
+
+class ITranslated(Interface):
+    first = ValidTextLine(title=_(u'name', default=u'Name'),
+                          description=_(u'name_desc', default=u'The full name'))
+    last = ValidTextLine(title=_(u'name', default=u'Name'),
+                         description=_(u'name_desc', default=u'The full name'))
+    city = ValidTextLine(title=_(u'city', default=u'City'))
+    age = Int(title=_(u'age', default=u'Age'))
+
+
+@implementer(IUserPreferredLanguages)
+class Request(object):
+
+    def getPreferredLanguages(self):
+        return ['de', 'en']
+
+
+class CachingJsonSchemafier(JsonSchemafier):
+    cache_schemas = True
+
+
+class TranslationCachingJsonSchemafier(JsonSchemafier):
+    translation_cache = TranslationCache()
+
+
+def bench_make_schema(loops, schema, kind=JsonSchemafier, context=None):
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        kind(schema, context=context).make_schema()
+    return pyperf.perf_counter() - t0
+
+
+def bench_translate(loops, schemafier, message):
+    translate = schemafier._translate
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        translate(message)
+    return pyperf.perf_counter() - t0
+
+
+def bench_find_most_derived(loops, fields):
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for field in fields:
+            find_most_derived_interface(field, sch_interfaces.IField)
+    return pyperf.perf_counter() - t0
+
+
+def bench_choice_field(loops, field, cache=False):
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        get_data_from_choice_field(field, cache=cache)
+    return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner()
+    component.provideUtility(negotiator, INegotiator)
+    component.provideUtility(
+        SimpleTranslationDomain('bench', {
+            ('de', u'name'): u'Name',
+            ('de', u'name_desc'): u'Der vollst\xe4ndige Name',
+            ('de', u'city'): u'Stadt',
+            ('de', u'age'): u'Alter',
+        }),
+        ITranslationDomain, 'bench')
+    runner.bench_time_func('make_schema', bench_make_schema, IProfile)
+    runner.bench_time_func('make_schema (%d fields)' % len(IWide.names()),
+                           bench_make_schema, IWide)
+    runner.bench_time_func('make_schema translated', bench_make_schema, ITranslated,
+                           JsonSchemafier, Request())
+    runner.bench_time_func('make_schema translated (translation cache)',
+                           bench_make_schema, ITranslated,
+                           TranslationCachingJsonSchemafier, Request())
+    message = ITranslated['first'].description
+    runner.bench_time_func('_translate', bench_translate,
+                           JsonSchemafier(ITranslated, context=Request()), message)
+    runner.bench_time_func('_translate (translation cache)', bench_translate,
+                           TranslationCachingJsonSchemafier(ITranslated, context=Request()),
+                           message)
+    runner.bench_time_func('make_schema cached', bench_make_schema, IProfile,
+                           CachingJsonSchemafier)
+    fields = [IProfile[name] for name in IProfile]
+    runner.bench_time_func('find_most_derived_interface (%d fields)' % len(fields),
+                           bench_find_most_derived, fields)
+
+    # About the size of the Countries vocabulary.
+    vocabulary = SimpleVocabulary([SimpleTerm(i, 'c%d' % i, u'Country %d' % i)
+                                   for i in range(250)])
+    runner.bench_time_func('get_data_from_choice_field (250 terms)',
+                           bench_choice_field, Choice(vocabulary=vocabulary))
+    runner.bench_time_func('get_data_from_choice_field (250 terms, cached)',
+                           bench_choice_field, Choice(vocabulary=vocabulary), True)
+
+
+if __name__ == '__main__':
+    main()
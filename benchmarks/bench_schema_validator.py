@@ -0,0 +1,76 @@
+"""
+Compare validating an object against its schema with
+``zope.schema.getValidationErrors`` to using ``SchemaValidator``.
+
+Run with ``python bench_schema_validator.py``.
+"""
+from __future__ import print_function, absolute_import
+import pyperf
+
+from zope.interface import Interface
+from zope.interface import implementer
+from zope.schema import getValidationErrors
+
+from nti.schema.field import Bool
+from nti.schema.field import Float
+from nti.schema.field import Int
+from nti.schema.field import ValidChoice
+from nti.schema.field import ValidDatetime
+from nti.schema.field import ValidText
+from nti.schema.field import ValidTextLine
+from nti.schema.validation import SchemaValidator
+
+
+class IBase(Interface):
+    id = Int(min=0)
+    created = ValidDatetime(required=False)
+
+
+class IThing(IBase):
+    name = ValidTextLine(max_length=100)
+    description = ValidText(required=False)
+    price = Float(min=0.0)
+    quantity = Int(min=0, max=1000)
+    active = Bool()
+    kind = ValidChoice(values=(u'a', u'b', u'c'))
+
+
+@implementer(IThing)
+class Thing(object):
+    id = 1
+    created = None
+    name = u'A thing'
+    description = u'Described'
+    price = 1.5
+    quantity = 10
+    active = True
+    kind = u'b'
+
+
+def bench_zope(loops, obj):
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        getValidationErrors(IThing, obj)
+    return pyperf.perf_counter() - t0
+
+
+def bench_validator(loops, obj):
+    errors = SchemaValidator(IThing).getValidationErrors
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        errors(obj)
+    return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner()
+    invalid = Thing()
+    invalid.price = -1.0
+    invalid.name = None
+    for name, obj in (('valid', Thing()), ('invalid', invalid)):
+        runner.bench_time_func('getValidationErrors ' + name, bench_zope, obj)
+        runner.bench_time_func('SchemaValidator ' + name, bench_validator, obj)
+
+
+if __name__ == '__main__':
+    main()
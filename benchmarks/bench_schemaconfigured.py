@@ -54,6 +54,9 @@ WideInheritance = type(
 class SCWideInheritance(WideInheritance, SchemaConfigured):
     pass
 
+class SCCompiledWideInheritance(WideInheritance, SchemaConfigured):
+    SC_COMPILE_INIT = True
+
 @implementer(*shallow_ifaces)
 class ShallowInheritance(object):
     """
@@ -65,6 +68,15 @@ class ShallowInheritance(object):
 class SCShallowInheritance(ShallowInheritance, SchemaConfigured):
     pass
 
+class SCCompiledShallowInheritance(ShallowInheritance, SchemaConfigured):
+    SC_COMPILE_INIT = True
+
+class SCSchemasShallowInheritance(ShallowInheritance, SchemaConfigured):
+    """
+    Names its schema with ``SC_SCHEMAS`` instead of using what it provides.
+    """
+    SC_SCHEMAS = tuple(shallow_ifaces)
+
 
 def make_deep_ifaces():
     children = []
@@ -128,17 +140,77 @@ def bench_create(loops, cls):
 
 
 
+ALLOCATION_INSTANCES = 1000
+
+def count_allocated_blocks(cls):
+    """
+    Return the number of memory blocks allocated, and still in use,
+    for each instance of *cls* constructed, from the difference
+    between two tracemalloc snapshots.
+    """
+    import tracemalloc
+    cls() # Prime the caches
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(ignore)
+        instances = [cls() for _ in range(ALLOCATION_INSTANCES)]
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+    finally:
+        tracemalloc.stop()
+    del instances
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    return blocks / float(ALLOCATION_INSTANCES)
+
+
+def measure_peak_bytes(cls):
+    """
+    Return the peak number of bytes allocated while constructing
+    (and discarding) one instance of *cls*. Unlike
+    `count_allocated_blocks`, this includes temporary objects.
+    """
+    import tracemalloc
+    cls() # Prime the caches
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        cls()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
 runner = pyperf.Runner()
+runner.argparser.add_argument(
+    '--allocations',
+    action='store_true',
+    help="Print the blocks allocated and the peak bytes per construction "
+    "instead of timing."
+)
 
-for bench_cls in (
+bench_classes = (
         WideInheritance, # These have no field properties.
         SCWideInheritance,
+        SCCompiledWideInheritance,
         DeepestInheritance,
         SCDeepestInheritance,
         ShallowInheritance,
-        SCShallowInheritance
-):
+        SCShallowInheritance,
+        SCCompiledShallowInheritance,
+        SCSchemasShallowInheritance,
+)
+
+if runner.parse_args().allocations:
+    for bench_cls in bench_classes:
+        print('%-30s %6.1f blocks %6d peak bytes' % (
+            bench_cls.__name__,
+            count_allocated_blocks(bench_cls),
+            measure_peak_bytes(bench_cls)))
+    raise SystemExit
 
+for bench_cls in bench_classes:
     runner.bench_time_func(
         'Create ' + bench_cls.__name__,
         bench_create,
@@ -0,0 +1,46 @@
+"""
+Measure the peak memory (as measured by tracemalloc) used to convert
+a large list with ``TupleFromObject.fromObject``, and, if available,
+by consuming ``iterFromObject`` without keeping the results.
+
+Run with ``python bench_sequence_memory.py``.
+"""
+from __future__ import print_function, absolute_import
+
+import tracemalloc
+
+from nti.schema.field import Int
+from nti.schema.field import TupleFromObject
+
+ITEMS = 1000000
+
+
+def peak_bytes(func, *args):
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def consume(iterator):
+    for _ in iterator:
+        pass
+
+
+def main():
+    field = TupleFromObject(Int())
+    # Large enough not to be cached small ints.
+    values = [1000 + i for i in range(ITEMS)]
+    print('fromObject:     %6.1f MB peak' % (
+        peak_bytes(field.fromObject, values) / 1e6))
+    if hasattr(field, 'iterFromObject'):
+        print('iterFromObject: %6.1f MB peak' % (
+            peak_bytes(lambda: consume(field.iterFromObject(values))) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Compare the memory used by instances of dictionary-backed
+``SchemaConfigured`` classes with those created by
+``make_slotted_class``.
+
+Run with ``python bench_slotted_memory.py``. Prints the bytes
+per instance (as measured by tracemalloc) for several numbers of
+fields. Because ``SchemaConfigured`` does not declare ``__slots__``,
+the slotted instances still have an (empty) instance dictionary.
+"""
+from __future__ import print_function, absolute_import
+
+import tracemalloc
+
+from zope.interface import Interface
+from zope.interface import implementer
+from zope.interface.interface import InterfaceClass
+
+from nti.schema.field import Int
+from nti.schema.field import TextLine
+from nti.schema.schema import SchemaConfigured
+from nti.schema.fieldproperty import createFieldProperties
+from nti.schema.fieldproperty import make_slotted_class
+
+INSTANCES = 10000
+FIELD_COUNTS = (2, 6, 20)
+
+
+def make_schema(field_count):
+    attrs = {}
+    for i in range(field_count):
+        if i % 2:
+            attrs['field_' + str(i)] = Int(required=False)
+        else:
+            attrs['field_' + str(i)] = TextLine(required=False)
+    return InterfaceClass('ISchema' + str(field_count), (Interface,), attrs)
+
+
+def make_dict_class(schema):
+
+    @implementer(schema)
+    class DictBacked(SchemaConfigured):
+        createFieldProperties(schema)
+
+    return DictBacked
+
+
+def make_values(schema):
+    return {
+        name: (u'value' if isinstance(field, TextLine) else 42)
+        for name, field in schema.namesAndDescriptions()
+    }
+
+
+def bytes_per_instance(cls, values):
+    cls(**values) # Prime caches
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        instances = [cls(**values) for _ in range(INSTANCES)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del instances
+    return (after - before) / float(INSTANCES)
+
+
+def main():
+    for field_count in FIELD_COUNTS:
+        schema = make_schema(field_count)
+        values = make_values(schema)
+        for kind, cls in (
+                ('dict', make_dict_class(schema)),
+                ('slots', make_slotted_class(schema, bases=(SchemaConfigured,))),
+        ):
+            print('%2d fields %-5s: %6.1f bytes/instance' % (
+                field_count, kind, bytes_per_instance(cls, values)))
+
+
+if __name__ == '__main__':
+    main()
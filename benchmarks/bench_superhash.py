@@ -0,0 +1,55 @@
+"""
+Compare the time to hash ``EqHash`` objects that have a dictionary
+attribute using ``superhash=True`` (which sorts the dictionary) and
+``superhash='unordered'``.
+
+Run with ``python bench_superhash.py``.
+"""
+from __future__ import print_function, absolute_import
+import pyperf
+
+from nti.schema.eqhash import EqHash
+
+DICT_SIZES = (10, 1000, 100000)
+
+
+@EqHash('a', 'b', superhash=True)
+class Ordered(object):
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+@EqHash('a', 'b', superhash='unordered')
+class Unordered(Ordered):
+    pass
+
+
+def make_dict(size):
+    # Insert the keys out of order so sorting them has
+    # real work to do.
+    return {'key' + str(i * 7919 % size): [i] for i in range(size)}
+
+
+def bench_hash(loops, thing):
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        hash(thing)
+    return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner()
+    for size in DICT_SIZES:
+        value = make_dict(size)
+        for cls in Ordered, Unordered:
+            runner.bench_time_func(
+                'hash %s %d items' % (cls.__name__, size),
+                bench_hash,
+                cls(1, value),
+            )
+
+
+if __name__ == '__main__':
+    main()
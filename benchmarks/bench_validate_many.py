@@ -0,0 +1,55 @@
+"""
+Compare validating a column of values one at a time with
+``field.validate`` to using ``validate_many``.
+
+Run with ``python bench_validate_many.py``.
+"""
+from __future__ import print_function, absolute_import
+import pyperf
+
+from zope.schema import Bool
+from zope.schema import ValidationError
+
+from nti.schema.field import Float
+from nti.schema.field import Int
+from nti.schema.field import ValidTextLine
+from nti.schema.validation import validate_many
+
+VALUES = 100000
+
+
+def bench_each(loops, field, values):
+    validate = field.validate
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        errors = []
+        for i, value in enumerate(values):
+            try:
+                validate(value)
+            except ValidationError as e:
+                errors.append((i, e))
+    return pyperf.perf_counter() - t0
+
+
+def bench_many(loops, field, values):
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        validate_many(field, values)
+    return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner()
+    columns = (
+        ('Int', Int(min=0), list(range(VALUES))),
+        ('Float', Float(), [float(i) for i in range(VALUES)]),
+        ('TextLine', ValidTextLine(max_length=10), [u'v' + str(i % 1000) for i in range(VALUES)]),
+        ('Bool', Bool(), [bool(i % 2) for i in range(VALUES)]),
+    )
+    for name, field, values in columns:
+        runner.bench_time_func('validate %s' % name, bench_each, field, values)
+        runner.bench_time_func('validate_many %s' % name, bench_many, field, values)
+
+
+if __name__ == '__main__':
+    main()
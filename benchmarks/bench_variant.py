@@ -0,0 +1,121 @@
+"""
+Benchmarks for validating and converting values with a
+``Variant`` field that has several child fields.
+
+Run with ``python bench_variant.py``. Each operation is measured
+when a late field accepts the value, and when no field does.
+Converting a long list of values with a ``ListOrTupleFromObject``
+whose ``value_type`` is the variant is also measured, as is
+``set`` with values of several types (with assignment events
+suppressed, so that choosing the event is most of the work).
+"""
+from __future__ import print_function, absolute_import
+import pyperf
+
+from zope.interface import Interface
+from zope.interface import implementer
+
+from nti.schema.field import Bool
+from nti.schema.field import Float
+from nti.schema.field import Int
+from nti.schema.field import ListOrTuple
+from nti.schema.field import ListOrTupleFromObject
+from nti.schema.field import Object
+from nti.schema.field import ValidTextLine
+from nti.schema.field import Variant
+from nti.schema.field import suppressed_assignment_events
+from nti.schema.interfaces import VariantValidationError
+
+
+LIST_LENGTH = 50000
+
+
+class IFirst(Interface):
+    pass
+
+
+class ISecond(Interface):
+    pass
+
+
+@implementer(ISecond)
+class Second(object):
+    pass
+
+
+class Context(object):
+    pass
+
+
+def make_variant():
+    return Variant((
+        Object(IFirst),
+        Int(),
+        Float(),
+        Bool(),
+        ListOrTuple(Int()),
+        ValidTextLine(),
+        Object(ISecond),
+    ))
+
+
+def bench_validate(loops, field, value):
+    validate = field.validate
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        try:
+            validate(value)
+        except VariantValidationError:
+            pass
+    return pyperf.perf_counter() - t0
+
+
+def bench_fromObject(loops, field, value):
+    fromObject = field.fromObject
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        try:
+            fromObject(value)
+        except VariantValidationError:
+            pass
+    return pyperf.perf_counter() - t0
+
+
+def bench_set(loops, field, value):
+    context = Context()
+    set_ = field.set
+    with suppressed_assignment_events():
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            set_(context, value)
+        return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner()
+    field = make_variant()
+    for name, value in (('late field', Second()),
+                        ('all miss', object())):
+        runner.bench_time_func('validate ' + name, bench_validate,
+                               field, value)
+    # Most fields can convert text, so use a value only the sequence
+    # field can convert.
+    for name, value in (('late field', (1, 2)),
+                        ('all miss', {})):
+        runner.bench_time_func('fromObject ' + name, bench_fromObject,
+                               field, value)
+
+    list_field = ListOrTupleFromObject(field)
+    runner.bench_time_func('fromObject list of %d' % LIST_LENGTH, bench_fromObject,
+                           list_field, [True] * LIST_LENGTH)
+
+    field.__name__ = 'value'
+    for name, value in (('str', u'abc'),
+                        ('dict', {}),
+                        ('list', []),
+                        ('object', Second())):
+        runner.bench_time_func('set ' + name, bench_set, field, value)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Measure binding and validating a ``Choice`` field that uses the
+``Countries`` vocabulary, which looks the vocabulary up each time it
+is bound.
+
+Run with ``python bench_vocabulary.py``.
+"""
+from __future__ import print_function, absolute_import
+import pyperf
+
+from zope.configuration import xmlconfig
+from zope.schema import Choice
+
+import nti.schema
+
+
+class Context(object):
+    pass
+
+
+def bench_bind_validate(loops, field, value):
+    context = Context()
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        field.bind(context).validate(value)
+    return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner()
+    xmlconfig.file('configure.zcml', package=nti.schema)
+    field = Choice(vocabulary='Countries')
+    field.__name__ = 'country'
+    # The vocabulary contains tokens, not values.
+    runner.bench_time_func('Countries bind and validate', bench_bind_validate,
+                           field, 'us')
+
+
+if __name__ == '__main__':
+    main()
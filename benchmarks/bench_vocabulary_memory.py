@@ -0,0 +1,46 @@
+"""
+Measure the memory (as measured by tracemalloc) used by the terms of
+the ``Countries`` vocabulary, and the memory allocated by
+externalizing all of them again after they have been externalized
+once.
+
+Run with ``python bench_vocabulary_memory.py``.
+"""
+from __future__ import print_function, absolute_import
+
+import tracemalloc
+
+from nti.i18n.locales.countries import CountryAvailability
+
+from nti.schema.vocabulary import CountryTerm
+
+
+def allocated_bytes(func, *args):
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, result
+
+
+def make_terms(items):
+    return [CountryTerm.fromItem(item) for item in items]
+
+
+def externalize(terms):
+    return [term.toExternalObject() for term in terms]
+
+
+def main():
+    items = list(CountryAvailability().getCountries().items())
+    size, terms = allocated_bytes(make_terms, items)
+    print('%d terms:         %6.1f KB' % (len(terms), size / 1e3))
+    externalize(terms)
+    size, _ = allocated_bytes(externalize, terms)
+    print('toExternalObject: %6.1f KB' % (size / 1e3))
+
+
+if __name__ == '__main__':
+    main()
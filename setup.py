@@ -2,7 +2,7 @@
 import codecs
 from setuptools import setup, find_packages
 
-version = '1.15.2.dev0'
+version = '1.16.0.dev0'
 
 entry_points = {
 }
@@ -69,6 +69,7 @@ setup(
             'nti.testing',
             'zope.testrunner',
             'zope.component >= 4.6.1', # consistent IRO
+            'zope.proxy',
         ],
         'docs': [
             'Sphinx',
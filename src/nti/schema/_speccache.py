@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Internal support for caching values computed from interface
+specifications.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+__docformat__ = "restructuredtext en"
+
+
+def _spec_attrs(spec):
+    # Return the dictionary that values computed from the single
+    # specification *spec* can be cached in, or None if there isn't
+    # one. The interface machinery clears this dictionary (actually,
+    # replaces it with None) when the spec changes.
+    try:
+        cache_in = spec._v_attrs # pylint:disable=protected-access
+    except AttributeError:
+        # As of zope.interface 5.0, these are always there, so
+        # this must be just an iterable. Arbitrary iterables might
+        # only be good for one iteration, so we can't cache them.
+        return None
+
+    if cache_in is None:
+        cache_in = spec._v_attrs = {}
+    return cache_in
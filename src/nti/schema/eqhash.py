@@ -12,6 +12,12 @@ from __future__ import print_function
 import operator
 
 import six
+from six.moves import copyreg
+
+from zope.schema import interfaces as sch_interfaces
+
+from nti.schema.schema import _spec_cache
+from nti.schema.schema import schemaitems
 
 __docformat__ = "restructuredtext en"
 
@@ -48,19 +54,181 @@ def _superhash(value):
     else:
         return value
 
+def _superhash_force_unordered(value):
+    # Like _superhash_force, but the hash of mappings and sets
+    # doesn't depend on their order, so they don't have to be sorted
+    # (and their keys don't have to be comparable). frozenset
+    # does the work of combining the hashes of the items.
+    # Raising exceptions is comparatively expensive, so check for
+    # the builtin types first.
+    if isinstance(value, (set, frozenset)):
+        # Set members are already hashable.
+        return frozenset(value)
+    if isinstance(value, list):
+        return tuple([_superhash_unordered(item)
+                      for item
+                      in value])
+
+    try:
+        items = value.items()
+    except AttributeError:
+        # mutable iterable, whose order matters
+        return tuple([_superhash_unordered(item)
+                      for item
+                      in value])
+
+    try:
+        return frozenset(items)
+    except TypeError:
+        return frozenset([(k, _superhash_unordered(v))
+                          for k, v
+                          in items])
+
+def _superhash_unordered(value):
+    """
+    Like `_superhash`, but mappings and sets are hashed
+    without regard to their order.
+    """
+    if isinstance(value, (dict, list, set)):
+        return _superhash_force_unordered(value)
+    try:
+        hash(value)
+    except TypeError:
+        return _superhash_force_unordered(value)
+    else:
+        return value
+
+#: The name of the instance attribute that stores the hash
+#: when ``cache_hash`` is used. The ``_v_`` prefix means persistent
+#: objects will not save it or be marked as changed when it is set.
+CACHED_HASH_ATTRIBUTE = '_v_eqhash_cached_hash'
+
+def _stale_cached_hash():
+    return None
+
+class _CachedHash(int):
+    # A hash value that doesn't survive being pickled or copied:
+    # the hash of a str, among other things, differs between processes.
+    __slots__ = ()
+
+    def __reduce__(self):
+        return _stale_cached_hash, ()
+
+def _without_cached_hash(state):
+    # Return *state*, as returned by ``__getstate__``, without the
+    # cached hash. Never modify it, it may be the instance dictionary.
+    if isinstance(state, dict) and CACHED_HASH_ATTRIBUTE in state:
+        state = dict(state)
+        del state[CACHED_HASH_ATTRIBUTE]
+    elif isinstance(state, tuple) and len(state) == 2:
+        # (dict, slots)
+        state = (_without_cached_hash(state[0]), _without_cached_hash(state[1]))
+    return state
+
+def _default_getstate(self): # pragma: no cover
+    # What object.__getstate__ does in Python 3.11 and later.
+    state = getattr(self, '__dict__', None) or None
+    slots = {}
+    for name in copyreg._slotnames(type(self)): # pylint:disable=protected-access
+        try:
+            slots[name] = getattr(self, name)
+        except AttributeError:
+            pass
+    return (state, slots) if slots else state
+
+def _add_getstate_without_cached_hash(cls):
+    # ``copy.copy`` copies the instance dictionary (or slots) as-is,
+    # so the copy would keep the cached hash even if it is then
+    # changed. Leave it out of the state used for copies (and pickles).
+    base_getstate = getattr(cls, '__getstate__', None)
+    if base_getstate is getattr(object, '__getstate__', None):
+        base_getstate = _default_getstate
+
+    def __getstate__(self):
+        return _without_cached_hash(base_getstate(self))
+    cls.__getstate__ = __getstate__
+
+def clear_cached_hash(obj):
+    """
+    Discard the hash value cached by *obj*, if any, so that it will
+    be computed again the next time it is needed.
+
+    This is only useful for classes decorated with ``EqHash(...,
+    cache_hash=True)``, and only safe if *obj* is not currently stored
+    in any set or dictionary (or other hashed container).
+
+    .. versionadded:: 1.16.0
+    """
+    if getattr(obj, CACHED_HASH_ATTRIBUTE, None) is not None:
+        try:
+            delattr(obj, CACHED_HASH_ATTRIBUTE)
+        except AttributeError: # pragma: no cover
+            # Concurrently cleared.
+            pass
+
+#: The relative cost of comparing the values of fields providing
+#: each interface. Fields not listed here have a cost of 2.
+_FIELD_COMPARISON_COSTS = (
+    (sch_interfaces.IBool, 0),
+    (sch_interfaces.INumber, 0),
+    (sch_interfaces.IDate, 0),
+    (sch_interfaces.IDatetime, 0),
+    (sch_interfaces.ITime, 0),
+    (sch_interfaces.ITimedelta, 0),
+    (sch_interfaces.IText, 1),
+    (sch_interfaces.IBytes, 1),
+    (sch_interfaces.ICollection, 3),
+    (sch_interfaces.IMapping, 3),
+    (sch_interfaces.IObject, 3),
+)
+
+def _field_comparison_cost(field):
+    for iface, cost in _FIELD_COMPARISON_COSTS:
+        if iface.providedBy(field):
+            return cost
+    return 2
+
+def _schema_names(schema):
+    # The names of the fields of *schema*, ordered so that
+    # the cheapest to compare come first. Ties keep the
+    # order of the schema.
+    cache_in = _spec_cache(schema)
+    if cache_in is not None:
+        try:
+            return cache_in['__nti_schema_eqhash_names']
+        except KeyError:
+            pass
+
+    # sorted() is stable, so ties keep their order.
+    result = tuple(str(name)
+                   for name, _
+                   in sorted(schemaitems(schema),
+                             key=lambda item: _field_comparison_cost(item[1])))
+
+    if cache_in is not None:
+        cache_in['__nti_schema_eqhash_names'] = result
+    return result
+
+def _schema_eq_hash(cls, schema, include_super, include_type, superhash, cache_hash):
+    names = _schema_names(schema)
+    if not names and not include_super and not include_type:
+        raise TypeError("Asking to hash/eq nothing, but not including super or type",
+                        schema)
+    return _eq_hash(cls, names, include_super, include_type, superhash, cache_hash)
+
 def EqHash(*names,
            **kwargs):
     """
-    EqHash(*names, include_super=False, superhash=False, include_type=False)
+    EqHash(*names, include_super=False, superhash=False, include_type=False, cache_hash=False, schema=None, order=False)
 
     A class decorator factory for the common pattern of writing
     ``__eq__``/``__ne__`` and ``__hash__`` methods that check the same
     list of attributes on a given object.
 
-    Right now, you must pass as individual arguments the property
-    names to check; in the future, you may be able to pass a schema
-    interface that defines the property names. Property names are compared
-    for equality in the order they are given, so place the cheapest first.
+    Either pass as individual arguments the property names to check,
+    or pass a *schema* interface that defines them. Property names
+    are compared for equality in the order they are given, so place
+    the cheapest first.
 
     Additional parameters are only available via keywords::
 
@@ -83,32 +251,107 @@ def EqHash(*names,
         then the hash function will be made to support certain
         mutable types (lists and dictionaries) that ordinarily cannot
         be hashed. Use this only when those items are functionally
-        treated as immutable.
+        treated as immutable. Dictionaries are sorted each time they
+        are hashed. If this is set to ``'unordered'``, then
+        dictionaries and sets are instead hashed in a way that
+        doesn't depend on the order of their items (like
+        :class:`frozenset`); this is faster for large dictionaries,
+        and allows their keys to be of types that can't be compared
+        to each other, but produces different hash values.
     :keyword include_type: If set to ``True`` (*not* the default),
         equality will only be true if the other object is an instance
         of the class this is declared on. Use this only when there are
         a series of subclasses who differ in no attributes but should not
         compare equal to each other. Note that this can lead to violating
         the commutative property.
-
+    :keyword cache_hash: If set to ``True`` (*not* the default), then
+        the hash value is computed only once for each instance and stored
+        in the instance attribute named by `CACHED_HASH_ATTRIBUTE`. This is
+        most useful with *superhash*. Use this only when the attributes
+        named are *immutable* once the object has been hashed. If they
+        might change, call `clear_cached_hash` afterwards (when a
+        ``FieldProperty`` sets the value, the subscriber
+        :func:`nti.schema.subscribers.clear_cached_hash_on_field_updated`
+        does this automatically). The cached value is not pickled or
+        copied, not even by :func:`copy.copy`: the class is given a
+        ``__getstate__`` method (wrapping any it already has) that
+        leaves it out. The value is only cached by the ``__hash__``
+        method of the object's class, not when that is called by a
+        subclass with *include_super*. Classes that use ``__slots__``
+        must include a slot with this name or the hash will not be
+        cached.
+    :keyword schema: If given, an interface (or a list or tuple of
+        interfaces) whose fields, as returned by
+        :func:`nti.schema.schema.schemaitems`, are the property names
+        to use. No *names* may be passed. The names are compared in order
+        of their expected cost: simple fields such as ``Bool``, ``Int``
+        and ``TextLine`` come first, and collections and ``Object``
+        fields come last, so that a mismatch is found as soon as
+        possible.
+    :keyword order: If set to ``True`` (*not* the default), then
+        ``__lt__``, ``__le__``, ``__gt__`` and ``__ge__`` methods are
+        also generated. They compare the property names one at a
+        time, in order, stopping at the first that differs (if
+        *include_super* is true, the superclass is compared first).
+        A ``sort_key`` classmethod is also added; it returns an
+        :func:`operator.attrgetter` for the same names, suitable for
+        the *key* argument to :func:`sorted`. When a *schema* is given,
+        its fields are compared in the order they are defined (as
+        returned by :func:`~nti.schema.schema.schemaitems`), not in
+        the order of their cost used for equality::
+
+          >>> @EqHash('a', order=True)
+          ... class Ordered(object):
+          ...   def __init__(self, a):
+          ...     self.a = a
+          >>> Ordered(1) < Ordered(2)
+          True
+          >>> [x.a for x in sorted([Ordered(2), Ordered(1)], key=Ordered.sort_key())]
+          [1, 2]
+
+    .. versionchanged:: 1.16.0
+       Add the *cache_hash*, *schema* and *order* keyword arguments.
+       Allow passing ``'unordered'`` for *superhash*.
     """
 
     _include_super = kwargs.pop('include_super', False)
     superhash = kwargs.pop("superhash", False)
     _include_type = kwargs.pop('include_type', False)
+    cache_hash = kwargs.pop('cache_hash', False)
+    schema = kwargs.pop('schema', None)
+    order = kwargs.pop('order', False)
 
     if kwargs:
         raise TypeError("Unexpected keyword args", kwargs)
-    if not names and not _include_super and not _include_type:
+    if isinstance(superhash, six.string_types) and superhash != 'unordered':
+        raise TypeError("Unexpected value for superhash", superhash)
+    if schema is not None and names:
+        raise TypeError("Cannot pass both names and a schema", names, schema)
+    if schema is None and not names and not _include_super and not _include_type:
         raise TypeError("Asking to hash/eq nothing, but not including super or type")
 
 
     def x(cls):
-        __eq__, __hash__, __ne__ = _eq_hash(cls, names,
-                                            _include_super, _include_type, superhash)
+        if schema is not None:
+            __eq__, __hash__, __ne__ = _schema_eq_hash(cls, schema,
+                                                       _include_super, _include_type,
+                                                       superhash, cache_hash)
+        else:
+            __eq__, __hash__, __ne__ = _eq_hash(cls, names,
+                                                _include_super, _include_type, superhash,
+                                                cache_hash)
         cls.__eq__ = __eq__
         cls.__hash__ = __hash__
         cls.__ne__ = __ne__
+        if cache_hash:
+            _add_getstate_without_cached_hash(cls)
+        if order:
+            if schema is not None:
+                # Order by declaration, not comparison cost.
+                order_names = tuple(str(name) for name, _ in schemaitems(schema))
+            else:
+                order_names = names
+            _add_order(cls, order_names, _include_super, _include_type)
         return cls
     return x
 
@@ -148,9 +391,122 @@ def _make_eq(cls, names, include_super, include_type):
 
     return lcls['__eq__']
 
-def _eq_hash(cls, names, include_super, include_type, superhash): # pylint:disable=I0011,W0622,R0912
+#: The key in a class dictionary where the names compared
+#: by ``EqHash(order=True)`` are stored.
+_ORDER_NAMES_KEY = '__EqHash_order_names'
+
+def _make_order(cls, names, include_super, include_type):
+    # Like __eq__, generate the code for each comparison. For
+    # __lt__ and __gt__, equal objects compare false, for __le__ and
+    # __ge__ they compare true.
+    methods = {}
+    for meth_name, op, if_equal in (('__lt__', '<', 'False'),
+                                    ('__le__', '<=', 'True'),
+                                    ('__gt__', '>', 'False'),
+                                    ('__ge__', '>=', 'True')):
+        stmt = 'def ' + meth_name + '(self, other'
+        if include_type or include_super:
+            stmt += ', cls=cls'
+        stmt += '):\n'
+        stmt += '    if self is other: return ' + if_equal + '\n'
+        if include_type:
+            stmt += '    if not isinstance(other, cls): return NotImplemented\n'
+        if include_super:
+            stmt += '    s = super(cls, self).__eq__(other)\n'
+            stmt += '    if s is NotImplemented: return s\n'
+            stmt += '    if not s: return super(cls, self).' + meth_name + '(other)\n'
+
+        for name in names:
+            stmt += '    a = self.' + name + '\n'
+            stmt += '    try:\n        b = other.' + name + '\n'
+            stmt += '    except AttributeError: return NotImplemented\n'
+            stmt += '    if a != b: return a ' + op + ' b\n\n'
+
+        stmt += '    return ' + if_equal
+
+        # Must use a custom dictionary under Py3
+        lcls = dict(locals())
+        six.exec_(stmt, globals(), lcls)
+        methods[meth_name] = lcls[meth_name]
+
+    return methods
+
+def _add_order(cls, names, include_super, include_type):
+    names = tuple(str(x) for x in names)
+    methods = _make_order(cls, names, include_super, include_type)
+    for meth_name, meth in methods.items():
+        setattr(cls, meth_name, meth)
+
+    if include_super:
+        names = getattr(cls.__mro__[1], _ORDER_NAMES_KEY, ()) + names
+    setattr(cls, _ORDER_NAMES_KEY, names)
+    # attrgetter requires at least one name.
+    key = operator.attrgetter(*names) if names else lambda _: ()
+
+    def sort_key(cls): # pylint:disable=unused-argument
+        return key
+    cls.sort_key = classmethod(sort_key)
+
+def _make_hash(cls, names, seed, include_super, superclass_hash, _hash, cache_hash):
+    # Like __eq__, generate the code so that there are no closure
+    # lookups, and no conditionals for options we already know about.
+    # The seed is a constant.
+    hash_stmt = 'def __hash__(self, _hash=_hash'
+    if include_super:
+        hash_stmt += ', superclass_hash=superclass_hash'
+    if cache_hash:
+        hash_stmt += ', _CachedHash=_CachedHash, this=this'
+    hash_stmt += '):\n'
+
+    # Only the __hash__ of the instance's class may use the cache; a
+    # subclass that includes our hash in its own shares the attribute.
+    this = []
+    if cache_hash:
+        hash_stmt += '    mine = type(self).__hash__ is this[0]\n'
+        if hasattr(cls, CACHED_HASH_ATTRIBUTE):
+            # Probably a slot, which raises AttributeError until set.
+            hash_stmt += '    h = getattr(self, %r, None) if mine else None\n' % (
+                CACHED_HASH_ATTRIBUTE,)
+        else:
+            # Install a class default so that looking it up is cheap.
+            setattr(cls, CACHED_HASH_ATTRIBUTE, None)
+            hash_stmt += '    h = self.' + CACHED_HASH_ATTRIBUTE + ' if mine else None\n'
+        hash_stmt += '    if h is not None: return h\n'
+
+    # If we or-equal for every attribute separately, we
+    # easily run the risk of saturating the integer. So we collect
+    # all attributes down to one tuple to hash.
+    # For compatibility with the hash values we produced when we used
+    # operator.attrgetter, a single name is not put in a tuple.
+    if len(names) == 1:
+        values = 'self.' + names[0]
+    else:
+        values = '(' + ''.join('self.' + name + ', ' for name in names) + ')'
+
+    hash_stmt += '    h = %d' % seed
+    if include_super:
+        hash_stmt += ' ^ (superclass_hash(self) << 2)'
+    hash_stmt += ' ^ _hash(' + values + ')\n'
+    if cache_hash:
+        # Without an instance dictionary or a slot, we can't
+        # cache.
+        hash_stmt += '    if mine:\n'
+        hash_stmt += '        try:\n'
+        hash_stmt += '            self.' + CACHED_HASH_ATTRIBUTE + ' = _CachedHash(h)\n'
+        hash_stmt += '        except AttributeError: pass\n'
+    hash_stmt += '    return h'
+
+    # Must use a custom dictionary under Py3
+    lcls = dict(locals())
+    six.exec_(hash_stmt, globals(), lcls)
+
+    this.append(lcls['__hash__'])
+    return lcls['__hash__']
+
+def _eq_hash(cls, names, include_super, include_type, superhash, cache_hash=False): # pylint:disable=I0011,W0622,R0912
     names = tuple((str(x) for x in names)) # make sure they're native strings, not unicode on Py2
     # We assume the class hierarchy of these objects does not change
+    superclass_hash = None
     if include_super:
         superclass = cls.__mro__[1]
         superclass_hash = superclass.__hash__
@@ -172,7 +528,21 @@ def _eq_hash(cls, names, include_super, include_type, superhash): # pylint:disab
     if include_type:
         seed += hash(cls)
 
-    if superhash:
+    if superhash == 'unordered':
+        superhash_one = _superhash_unordered
+        superhash_force = _superhash_force_unordered
+    else:
+        superhash_one = _superhash
+        superhash_force = _superhash_force
+
+    if superhash and len(names) == 1:
+        # We get passed the value itself, not a tuple of values.
+        def _hash(value):
+            try:
+                return hash(value)
+            except TypeError:
+                return hash(superhash_one(value))
+    elif superhash:
         # We assume that instances that use superhash will have
         # roughly the same shape, and not all attributes will need to be
         # super-hashed. When an attribute does need to be super-hashed, it will
@@ -206,25 +576,25 @@ def _eq_hash(cls, names, include_super, include_type, superhash): # pylint:disab
             except TypeError:
                 # Snap. Something changed.
                 for i, value in enumerate(values):
-                    if transformers[i] is _superhash:
+                    if transformers[i] is superhash_one:
                         # We've reached our limit. Nothing else to do
                         # for this one.
                         continue
 
-                    if transformers[i] is _superhash_force:
+                    if transformers[i] is superhash_force:
                         try:
-                            _superhash_force(value)
+                            superhash_force(value)
                         except TypeError:
                             # OK, this field alternates between
                             # being hashable and nat being hashable. Deal with that.
-                            transformers[i] = _superhash
+                            transformers[i] = superhash_one
 
                     try:
                         # We could check isinstance(value, collections.Hashable), but
                         # this is slightly more general, albeit probably slower.
                         hash(value)
                     except TypeError:
-                        transformers[i] = _superhash_force
+                        transformers[i] = superhash_force
 
             # Ok, good to go. Let's try it.
             return hash(tuple([transformer(value) if transformer is not None else value
@@ -236,28 +606,7 @@ def _eq_hash(cls, names, include_super, include_type, superhash): # pylint:disab
         # a tuple of values.
         _hash = hash
 
-    # Unlike __eq__, we use operator.attrgetter because we're always
-    # going to request all the names. In tests, this is ~30% faster than
-    # a manual loop (for two to three names).
-    if not names:
-        # Well, ok, nothing special in this class. We can't pass that to attrgetter,
-        # though, it needs at least one name. Make sure to return a tuple for
-        # consistency.
-        def attrgetter(_):
-            return ()
-    else:
-        # This will return a tuple of the values of the names.
-        attrgetter = operator.attrgetter(*names)
-
-    def __hash__(self):
-        h = seed
-        if include_super:
-            h ^= superclass_hash(self) << 2
-
-        # If we or-equal for every attribute separately, we
-        # easily run the risk of saturating the integer. So we callect
-        # all attributes down to one tuple to hash
-        h ^= _hash(attrgetter(self))
-        return h
+    __hash__ = _make_hash(cls, names, seed, include_super, superclass_hash, _hash,
+                          cache_hash)
 
     return __eq__, __hash__, __ne__
@@ -15,8 +15,12 @@ from __future__ import division
 from __future__ import print_function
 
 # stdlib imports
+from contextlib import contextmanager
 import numbers
 import re
+import sys
+import threading
+import weakref
 
 try:
     import collections.abc as abcs
@@ -24,14 +28,47 @@ except ImportError: # pragma: no cover
     # Python 2
     import collections as abcs
 
+try:
+    from abc import get_cache_token as _abc_cache_token
+except ImportError: # pragma: no cover
+    # Python 2
+    from abc import ABCMeta
+
+    def _abc_cache_token():
+        return ABCMeta._abc_invalidation_counter # pylint:disable=protected-access
+
+try:
+    from contextvars import ContextVar
+except ImportError: # pragma: no cover
+    # Python 2. The parts of ContextVar we need, per thread.
+    class ContextVar(threading.local):
+
+        def __init__(self, name, default=None):
+            super(ContextVar, self).__init__()
+            self.name = name
+            self.value = default
+
+        def get(self):
+            return self.value
+
+        def set(self, value):
+            token = self.value
+            self.value = value
+            return token
+
+        def reset(self, token):
+            self.value = token
+
+import six
 from six import string_types
 from six import text_type
 from zope import interface
 from zope import schema
+from zope.interface import providedBy
 from zope.deferredimport import deprecatedFrom
+import zope.event
 from zope.event import notify
 import zope.interface.common.idatetime
-from zope.cachedescriptors.property import Lazy
 
 from zope.schema import interfaces as sch_interfaces
 from zope.schema.interfaces import IFromBytes
@@ -73,6 +110,7 @@ from nti.schema.interfaces import BeforeSetAssignedEvent
 from nti.schema.interfaces import BeforeTextAssignedEvent
 from nti.schema.interfaces import BeforeTextLineAssignedEvent
 from nti.schema.interfaces import IFromObject
+from nti.schema.interfaces import IIterFromObject
 from nti.schema.interfaces import IListOrTuple
 from nti.schema.interfaces import InvalidValue
 from nti.schema.interfaces import IVariant
@@ -115,6 +153,7 @@ __all__ = [
     'Set',
     'Sequence',
     'StrippedValidTextLine',
+    'SuppressedAssignmentEvents',
     'Text',
     'TextLine',
     'Timedelta',
@@ -132,6 +171,7 @@ __all__ = [
     'ValidTextLine',
     'ValidURI',
     'Variant',
+    'suppressed_assignment_events',
 ]
 
 # BWC alias, not in __all__
@@ -144,11 +184,176 @@ deprecatedFrom(
 )
 
 
+class _EventSubscriberCache(object):
+    """
+    Whether events have subscribers, for one generation of an adapter
+    registry.
+
+    Like the caches of :class:`zope.interface.adapter.LookupBase`,
+    this subscribes to the specifications it uses so that it is
+    cleared when they change.
+    """
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.has_subscribers = {}
+
+    def watch(self, *specs):
+        for spec in specs:
+            spec.subscribe(self)
+
+    def changed(self, _originally_changed):
+        self.has_subscribers.clear()
+
+def _compute_event_has_subscribers(adapters, event_spec, value_spec, context_spec):
+    handlers = adapters.subscriptions((event_spec,), None)
+    if not handlers:
+        return False
+    dispatchers = sys.modules.get('nti.schema.subscribers')
+    dispatcher = getattr(dispatchers, 'before_object_assigned_event_dispatcher', None)
+    if any(handler is not dispatcher for handler in handlers):
+        return True
+    # The only handler re-dispatches the event with the value and context.
+    return bool(adapters.subscriptions((value_spec, context_spec, event_spec), None))
+
+# Instances of these exact types can't declare that they provide
+# anything beyond their type.
+_DECLARATIONLESS_TYPES = frozenset((
+    bool,
+    bytes,
+    dict,
+    float,
+    frozenset,
+    list,
+    set,
+    text_type,
+    tuple,
+    type(None),
+) + six.integer_types)
+
+def _event_has_subscribers(factory, value, context):
+    """
+    Would notifying an event created with *factory* for assigning
+    *value* to *context* have any effect?
+
+    This returns a false value only if all the event subscribers are
+    in the current component registry (that is, the only
+    :data:`zope.event.subscribers` is the dispatcher of
+    :mod:`zope.component`) and none of them handles such an event,
+    except possibly
+    :func:`nti.schema.subscribers.before_object_assigned_event_dispatcher`
+    when nothing handles what it re-dispatches. The answer is cached
+    until the registry or the interfaces involved change.
+    """
+    subscribers = zope.event.subscribers
+    if not subscribers:
+        return False
+    # Don't import zope.component ourself, it's optional; if it's not
+    # imported, its dispatcher can't be subscribed.
+    component_event = sys.modules.get('zope.component.event')
+    if (len(subscribers) != 1
+            or component_event is None
+            or subscribers[0] is not component_event.dispatch):
+        return True
+
+    adapters = sys.modules['zope.component'].getSiteManager().adapters
+    cache = adapters.__dict__.get('_v_nti_schema_event_subscribers')
+    # pylint:disable=protected-access
+    if cache is None or cache.generation != adapters._generation:
+        cache = adapters._v_nti_schema_event_subscribers = _EventSubscriberCache(
+            adapters._generation)
+
+    value_type = type(value)
+    context_spec = providedBy(context)
+    # providedBy() is slow for builtin values, but what they provide
+    # only depends on their type.
+    key = (factory,
+           value_type if value_type in _DECLARATIONLESS_TYPES else providedBy(value),
+           context_spec)
+    try:
+        return cache.has_subscribers[key]
+    except KeyError:
+        value_spec = providedBy(value)
+        event_spec = interface.implementedBy(factory)
+        result = cache.has_subscribers[key] = _compute_event_has_subscribers(
+            adapters, event_spec, value_spec, context_spec)
+        cache.watch(event_spec, value_spec, context_spec)
+        return result
+
+class SuppressedAssignmentEvents(object):
+    """
+    Counts the events that were not notified inside a
+    :func:`suppressed_assignment_events` block.
+
+    .. versionadded:: 1.16.0
+    """
+
+    def __init__(self):
+        #: The total number of events suppressed.
+        self.count = 0
+        #: A dictionary mapping the class of each suppressed
+        #: event to the number of them.
+        self.counts = {}
+
+    def _suppressed(self, factory):
+        self.count += 1
+        self.counts[factory] = self.counts.get(factory, 0) + 1
+
+    def _add(self, other):
+        self.count += other.count
+        for factory, count in other.counts.items():
+            self.counts[factory] = self.counts.get(factory, 0) + count
+
+    def __repr__(self):
+        return '<%s.%s count=%d>' % (type(self).__module__, type(self).__name__,
+                                     self.count)
+
+
+_SUPPRESSED_EVENTS = ContextVar('nti.schema.field.suppressed_assignment_events',
+                                default=None)
+
+@contextmanager
+def suppressed_assignment_events():
+    """
+    A context manager that stops fields from notifying any
+    :class:`~nti.schema.interfaces.IBeforeSchemaFieldAssignedEvent`
+    when they ``set`` a value. The values are assigned unchanged, as
+    if no subscriber was interested.
+
+    This is for bulk loads of trusted data, where nothing needs to
+    see or change the values. Other events, such as the
+    :class:`zope.schema.interfaces.IFieldUpdatedEvent` of a
+    ``FieldProperty``, are not affected.
+
+    The suppression applies only to the current thread and, on
+    Python 3, to the current :mod:`contextvars` context: asyncio tasks
+    started inside the block are affected, others are not. Blocks can
+    be nested.
+
+    This yields a :class:`SuppressedAssignmentEvents` counting the
+    events that were suppressed, including those in nested blocks.
+
+    .. versionadded:: 1.16.0
+    """
+    suppressed = SuppressedAssignmentEvents()
+    token = _SUPPRESSED_EVENTS.set(suppressed)
+    try:
+        yield suppressed
+    finally:
+        _SUPPRESSED_EVENTS.reset(token)
+        outer = _SUPPRESSED_EVENTS.get()
+        if outer is not None:
+            outer._add(suppressed) # pylint:disable=protected-access
+
 def _do_set(self, context, value, cls, factory):
     try:
-        event = factory(value, self.__name__, context)
-        notify(event)
-        value = event.object
+        suppressed = _SUPPRESSED_EVENTS.get()
+        if suppressed is not None:
+            suppressed._suppressed(factory) # pylint:disable=protected-access
+        elif _event_has_subscribers(factory, value, context):
+            event = factory(value, self.__name__, context)
+            notify(event)
+            value = event.object
         super(cls, self).set(context, value)
     except sch_interfaces.ValidationError as e: # pragma: no cover
         # This shouldn't happen, set() doesn't typically validate.
@@ -191,8 +396,9 @@ def _fixup_Object_field(field):
                 # Nothing we can do
                 pass
             else:
+                collection_converter = _SequenceFromObject(field)
                 def _collection_fromObject(value):
-                    return _SequenceFromObject(field).fromObject(value)
+                    return collection_converter.fromObject(value)
                 field.fromObject = _collection_fromObject
                 interface.alsoProvides(field, IFromObject)
         elif sch_interfaces.IMapping.providedBy(field):
@@ -205,8 +411,9 @@ def _fixup_Object_field(field):
                 # Nothing we can do
                 pass
             else:
+                map_converter = _MapFromObject(field)
                 def _map_fromObject(value):
-                    return _MapFromObject(field).fromObject(value)
+                    return map_converter.fromObject(value)
                 field.fromObject = _map_fromObject
                 interface.alsoProvides(field, IFromObject)
     return field
@@ -273,6 +480,18 @@ class FieldValidationMixin(object):
                   self.__fixup_name__,
                   value)
 
+    def validate_many(self, values):
+        """
+        Validate each of the *values*, returning a list of ``(index,
+        error)`` pairs for those that are not valid.
+
+        See :func:`nti.schema.validation.validate_many`.
+
+        .. versionadded:: 1.16.0
+        """
+        from nti.schema.validation import validate_many
+        return validate_many(self, values)
+
     def _validate(self, value):
         try:
             super(FieldValidationMixin, self)._validate(value)
@@ -330,21 +549,21 @@ class Object(FieldValidationMixin, _ObjectBase):
     """
 
 class _FieldConverter(object):
+    # Converters are reused for many values, so the methods
+    # are found just once.
+
+    __slots__ = (
+        'field',
+        'fromObject',
+        'fromUnicode',
+        'fromBytes',
+    )
 
     def __init__(self, field):
         self.field = field
-
-    @Lazy
-    def fromObject(self):
-        return getattr(self.field, 'fromObject', None)
-
-    @Lazy
-    def fromUnicode(self):
-        return getattr(self.field, 'fromUnicode', None)
-
-    @Lazy
-    def fromBytes(self):
-        return getattr(self.field, 'fromBytes', None)
+        self.fromObject = getattr(field, 'fromObject', None)
+        self.fromUnicode = getattr(field, 'fromUnicode', None)
+        self.fromBytes = getattr(field, 'fromBytes', None)
 
     def __call__(self, value):
         # pylint:disable=too-many-function-args
@@ -375,6 +594,88 @@ class _FieldConverter(object):
             raise
 
 
+def _wrong_type_error(field, value):
+    # The error that Field._validate raises.
+    return sch_interfaces.WrongType(
+        value, field._type, field.__name__ # pylint:disable=protected-access
+    ).with_field_and_value(field, value)
+
+# How Variant treats one of its fields for values of a particular type.
+#: The field must be asked.
+_VARIANT_TRY = 0
+#: The value is not an instance of the field's ``_type``.
+_VARIANT_WRONG_TYPE = 1
+#: Only if the value provides the field's ``schema`` must the field be asked.
+_VARIANT_CHECK_SCHEMA = 2
+
+_marker = object()
+
+_Field_validate = six.get_unbound_function(schema.Field.validate)
+_Field_constraint = six.get_unbound_function(schema.Field.constraint)
+
+# These implementations of ``_validate`` call the ``_validate`` of
+# their superclass before anything else, so the value is first checked
+# against the ``_type``, and only a ``WrongType`` error is raised for
+# values that aren't instances of it. Others, like that of ``Bool``,
+# may accept or convert such values.
+_TYPE_CHECKING_VALIDATES = frozenset(
+    six.get_unbound_function(cls._validate)
+    for cls in (
+        schema.Field,
+        schema.Orderable,
+        schema.MinMaxLen,
+        schema.Container,
+        schema.Iterable,
+        schema.Collection,
+        schema.Mapping,
+        FieldValidationMixin,
+    )
+)
+
+def _checks_type_first(field_type):
+    # Does every ``_validate`` that *field_type* can call check
+    # the ``_type`` first?
+    return all(six.get_unbound_function(cls.__dict__['_validate'])
+               in _TYPE_CHECKING_VALIDATES
+               for cls in field_type.__mro__
+               if '_validate' in cls.__dict__)
+
+def _variant_dispatch(field, kind, converting):
+    # Determine how to treat *field* for values (other than None) of
+    # type *kind*. We must be certain that the field would reject such
+    # values, and with exactly the error that we create instead.
+    if field.missing_value is not None:
+        # Field.validate accepts the missing value without checking it.
+        return _VARIANT_TRY
+    if converting:
+        # Otherwise, _FieldConverter calls validate().
+        if getattr(field, 'fromObject', None) is not None:
+            return _VARIANT_TRY
+        if issubclass(kind, bytes) and getattr(field, 'fromBytes', None) is not None:
+            return _VARIANT_TRY
+        if issubclass(kind, text_type) and getattr(field, 'fromUnicode', None) is not None:
+            return _VARIANT_TRY
+    if six.get_unbound_function(type(field).validate) is not _Field_validate:
+        return _VARIANT_TRY
+
+    if type(field) in (Object, _ObjectBase):
+        if ('constraint' in field.__dict__
+                or six.get_unbound_function(type(field).constraint) is not _Field_constraint):
+            return _VARIANT_TRY
+        return _VARIANT_CHECK_SCHEMA
+
+    if not _checks_type_first(type(field)):
+        return _VARIANT_TRY
+
+    # Things like ValidDatetime that have a schema raise
+    # a different error for the wrong type.
+    if (field._type is not None
+            and not hasattr(field, 'schema')
+            and not issubclass(kind, field._type)):
+        return _VARIANT_WRONG_TYPE
+    return _VARIANT_TRY
+
+
 @interface.implementer(IVariant)
 class Variant(FieldValidationMixin, schema.Field):
     """
@@ -389,10 +690,26 @@ class Variant(FieldValidationMixin, schema.Field):
         :class:`zope.schema.Dict`) will automatically be given a ``fromObject`` method
         when they are used as a field of this object *if* their *value_type* is an
         :class:`zope.schema.interfaces.IObject` (recursively).
+
+    .. versionchanged:: 1.16.0
+        ``validate`` and ``fromObject`` no longer ask fields that
+        certainly cannot accept the value because of its type (or,
+        for plain ``Object`` fields, because it does not provide the
+        schema). The error such a field would have raised is still
+        included in the `~.VariantValidationError`. What is known
+        about each type of value is cached until a class is registered
+        with an ABC; do not modify ``fields`` in place. Proxies
+        (values whose ``__class__`` is not their type) are given to
+        every field.
     """
 
     fields = ()
 
+    # (fields, ABC cache token, {(type, converting): (dispatch,...)})
+    _dispatch_table = (None, None, None)
+    # (fields, (_FieldConverter,...))
+    _field_converters = (None, ())
+
     def __init__(self, fields, variant_raise_when_schema_provided=False, **kwargs):
         """
         :param fields: A list or tuple of field instances.
@@ -451,10 +768,49 @@ class Variant(FieldValidationMixin, schema.Field):
             f.__parent__ = clone
         return clone
 
+    def _dispatch(self, value, converting):
+        fields = self.fields
+        kind = type(value)
+        if value is None or value.__class__ is not kind:
+            # Commonly the missing value; or a proxy of some sort,
+            # which the fields' isinstance() checks see through.
+            return (_VARIANT_TRY,) * len(fields)
+
+        # The answers only depend on the type, until a type is
+        # registered with an ABC (such as the _type of Sequence).
+        table_fields, token, table = self._dispatch_table
+        if table_fields is not fields or token != _abc_cache_token():
+            table = {}
+            self._dispatch_table = (fields, _abc_cache_token(), table)
+
+        key = (kind, converting)
+        try:
+            return table[key]
+        except KeyError:
+            pass
+        result = table[key] = tuple([_variant_dispatch(field, kind, converting)
+                                     for field in fields])
+        return result
+
+    def _converters(self):
+        fields = self.fields
+        converter_fields, converters = self._field_converters
+        if converter_fields is not fields:
+            converters = tuple([_FieldConverter(field) for field in fields])
+            self._field_converters = (fields, converters)
+        return converters
+
     def _validate(self, value):
         super(Variant, self)._validate(value)
         errors = []
-        for field in self.fields:
+        for field, dispatch in zip(self.fields, self._dispatch(value, False)):
+            if dispatch == _VARIANT_WRONG_TYPE:
+                errors.append(_wrong_type_error(field, value))
+                continue
+            if dispatch == _VARIANT_CHECK_SCHEMA and not field.schema.providedBy(value):
+                errors.append(sch_interfaces.SchemaNotProvided(
+                    field.schema, value).with_field_and_value(field, value))
+                continue
             try:
                 field.validate(value)
                 # one of them accepted, yay!
@@ -498,10 +854,13 @@ class Variant(FieldValidationMixin, schema.Field):
 
         errors = []
 
-        for field in self.fields:
+        for field, dispatch, converter in zip(self.fields,
+                                              self._dispatch(obj, True),
+                                              self._converters()):
+            if dispatch == _VARIANT_WRONG_TYPE:
+                errors.append(_wrong_type_error(field, obj))
+                continue
             try:
-                converter = _FieldConverter(field)
-
                 # Try to convert and validate. This calls fromXXX
                 # if defined, and otherwise validates. The fromXXX methods
                 # are also supposed to validate, so validation should be done
@@ -531,14 +890,49 @@ class Variant(FieldValidationMixin, schema.Field):
         (object, BeforeObjectAssignedEvent)
     )
 
-    def set(self, context, value):
+    #: The most types whose event factory is remembered.
+    _EVENT_FACTORY_CACHE_SIZE = 500
+    # (ABC cache token, _EVENT_TYPES, {weakref to type: factory})
+    _event_factories = (None, None, None)
+
+    def _find_event_factory(self, value):
         # Try to determine the most appropriate event to fire
         # Order matters. It would kind of be nice to direct this to the appropriate
         # field itself, but that's sort of hard.
         for kind, factory in self._EVENT_TYPES:
             if isinstance(value, kind):
-                _do_set(self, context, value, Variant, factory)
-                return
+                return factory
+        return None
+
+    def _cache_event_factory(self, key, value):
+        token, event_types, factories = self._event_factories
+        if (token != _abc_cache_token()
+                or event_types is not self._EVENT_TYPES
+                or len(factories) >= self._EVENT_FACTORY_CACHE_SIZE):
+            factories = {}
+            type(self)._event_factories = (_abc_cache_token(), self._EVENT_TYPES, factories)
+        factory = factories[key] = self._find_event_factory(value)
+        return factory
+
+    def set(self, context, value):
+        kind = type(value)
+        if value.__class__ is not kind:
+            # A proxy of some sort; isinstance() sees through it.
+            factory = self._find_event_factory(value)
+        else:
+            # The answer only depends on the type, until a type is
+            # registered with an ABC.
+            key = weakref.ref(kind)
+            token, event_types, factories = self._event_factories
+            if token == _abc_cache_token() and event_types is self._EVENT_TYPES:
+                factory = factories.get(key, _marker)
+            else:
+                factory = _marker
+            if factory is _marker:
+                factory = self._cache_event_factory(key, value)
+
+        if factory is not None:
+            _do_set(self, context, value, Variant, factory)
 
 class ObjectLen(FieldValidationMixin, schema.MinMaxLen, _ObjectBase):  # order matters
     """
@@ -755,7 +1149,7 @@ class ListOrTuple(IndexedIterable):
 
 
 
-@interface.implementer(IFromObject)
+@interface.implementer(IIterFromObject)
 class _SequenceFromObjectMixin(object):
     accept_types = None
     _default_type = list
@@ -775,18 +1169,55 @@ class _SequenceFromObjectMixin(object):
             raise sch_interfaces.SchemaNotProvided(IFromObject, field)
 
     def _converter_for(self, field):
-        return _FieldConverter(field)
+        # Reuse the converter for as long as we have the same
+        # field. Binding a copy of us also binds a copy of the
+        # value_type, so we must not change the cache in place: the
+        # copy shares our ``__dict__`` values.
+        cache = self.__dict__.get('_field_converters', ())
+        for converter in cache:
+            if converter.field is field:
+                return converter
+        converter = _FieldConverter(field)
+        # We need at most two, a key and a value converter.
+        self._field_converters = cache[-1:] + (converter,)
+        return converter
 
     def _do_fromObject(self, context):
+        # Return an iterable of the converted values. It's
+        # consumed by _do_convert_result, so it can be lazy.
         converter = self._converter_for(self.value_type)
-        result = [converter(x) for x in context]
-        return result
+        return (converter(x) for x in context)
 
     def _do_convert_result(self, result):
         if (isinstance(self._type, type)
                 and self._type is not self._default_type):  # single type is a factory
-            result = self._type(result)
-        return result
+            return self._type(result)
+        return list(result)
+
+    def _do_iterFromObject(self, iterable):
+        converter = self._converter_for(self.value_type)
+        for index, item in enumerate(iterable):
+            try:
+                value = converter(item)
+            except (TypeError, sch_interfaces.ValidationError) as ex:
+                ex.index = index
+                raise
+            yield value
+
+    def iterFromObject(self, iterable):
+        """
+        Return an iterator that converts each item of *iterable*
+        only as it is needed. *iterable* can be any iterable,
+        including a generator; unlike :meth:`fromObject`, its type is
+        not checked, nor is anything else about the collection as a
+        whole.
+
+        If an item cannot be converted, the error raised has its
+        ``index`` attribute set to the position of the item.
+
+        .. versionadded:: 1.16.0
+        """
+        return self._do_iterFromObject(iterable)
 
     def fromObject(self, context):
         if context == self.missing_value:
@@ -831,6 +1262,32 @@ class _MapFromObjectMixin(_SequenceFromObjectMixin):
         value_converter = self._converter_for(self.value_type)
         return {key_converter(k): value_converter(v) for k, v in _iteritems(context)}
 
+    def _do_iterFromObject(self, iterable):
+        key_converter = self._converter_for(self.key_type)
+        value_converter = self._converter_for(self.value_type)
+        if hasattr(iterable, 'items'):
+            iterable = _iteritems(iterable)
+        for index, (k, v) in enumerate(iterable):
+            try:
+                item = key_converter(k), value_converter(v)
+            except (TypeError, sch_interfaces.ValidationError) as ex:
+                ex.index = index
+                raise
+            yield item
+
+    def iterFromObject(self, iterable):
+        """
+        Return an iterator that converts each ``(key, value)`` pair
+        of *iterable* (which may also be a mapping), yielding the
+        converted pairs, only as they are needed.
+
+        If a pair cannot be converted, the error raised has its
+        ``index`` attribute set to the position of the pair.
+
+        .. versionadded:: 1.16.0
+        """
+        return self._do_iterFromObject(iterable)
+
 
 class _MapFromObject(_MapFromObjectMixin):
 
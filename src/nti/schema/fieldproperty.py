@@ -14,9 +14,14 @@ import sys
 
 from Acquisition import aq_base
 from Acquisition.interfaces import IAcquirer
+from zope.event import notify
+from zope.interface import classImplements
+from zope.schema import NO_VALUE
+from zope.schema import getFieldsInOrder
 from zope.schema import interfaces as sch_interfaces
 from zope.schema.fieldproperty import FieldProperty
 from zope.schema.fieldproperty import FieldPropertyStoredThroughField
+from zope.schema.fieldproperty import FieldUpdatedEvent
 from zope.schema.fieldproperty import createFieldProperties
 
 __docformat__ = "restructuredtext en"
@@ -151,6 +156,143 @@ def createDirectFieldProperties(__schema, omit=(), adapting=False):
             __frame.f_locals[k] = v
 
 
+_marker = object()
+
+class SlotFieldProperty(FieldProperty):
+    """
+    A field property that stores its value in a slot (given
+    as the member descriptor created for the slot by the type)
+    instead of the instance dictionary.
+
+    Aside from that, this behaves exactly like
+    :class:`zope.schema.fieldproperty.FieldProperty`: values are
+    validated, readonly fields can only be set once, the field's
+    default is returned if no value has been set, and a
+    :class:`zope.schema.interfaces.IFieldUpdatedEvent` is sent.
+
+    Usually these are created by :func:`make_slotted_class`.
+
+    .. versionadded:: 1.16.0
+    """
+
+    def __init__(self, field, slot, name=None):
+        super(SlotFieldProperty, self).__init__(field, name=name)
+        self.__slot = slot
+
+    def __get__(self, inst, klass):
+        if inst is None:
+            return self
+
+        try:
+            return self.__slot.__get__(inst, klass)
+        except AttributeError:
+            pass
+
+        # pylint:disable=no-member
+        field = self._FieldProperty__field.bind(inst)
+        value = getattr(field, 'default', _marker)
+        if value is _marker: # pragma: no cover
+            raise AttributeError(self._FieldProperty__name)
+        return value
+
+    def queryValue(self, inst, default):
+        try:
+            return self.__slot.__get__(inst, type(inst))
+        except AttributeError:
+            pass
+        field = self._FieldProperty__field.bind(inst) # pylint:disable=no-member
+        return getattr(field, 'default', default)
+
+    def __set__(self, inst, value):
+        field = self._FieldProperty__field.bind(inst) # pylint:disable=no-member
+        field.validate(value)
+        oldvalue = self.queryValue(inst, NO_VALUE)
+        if field.readonly:
+            try:
+                self.__slot.__get__(inst, type(inst))
+            except AttributeError:
+                pass
+            else:
+                raise ValueError(self._FieldProperty__name, # pylint:disable=no-member
+                                 'field is readonly')
+        self.__slot.__set__(inst, value)
+        notify(FieldUpdatedEvent(inst, field, oldvalue, value))
+
+
+def make_slotted_class(schema, bases=(object,), name=None, omit=()):
+    """
+    Create and return a new class that implements *schema* and stores
+    the values of each of its fields (including inherited fields) in
+    ``__slots__`` instead of an instance dictionary.
+
+    Each field is accessed through a :class:`SlotFieldProperty`, so
+    values are validated and defaults are provided just as with
+    :func:`zope.schema.fieldproperty.createFieldProperties`. Because
+    those are ``FieldProperty`` objects, the results work efficiently
+    with :class:`nti.schema.schema.SchemaConfigured`; they also work
+    with :func:`nti.schema.eqhash.EqHash`::
+
+      >>> from zope import interface
+      >>> from nti.schema.field import TextLine
+      >>> from nti.schema.schema import SchemaConfigured
+      >>> class IA(interface.Interface):
+      ...    a = TextLine(title=u"a", default=u"default")
+      >>> A = make_slotted_class(IA, bases=(SchemaConfigured,))
+      >>> A.__name__
+      'A'
+      >>> A.__slots__
+      ('_slot_a',)
+      >>> IA.providedBy(A())
+      True
+      >>> A().a == u'default'
+      True
+      >>> A(a=u'value').a == u'value'
+      True
+
+    The instances of the returned class will only lack an instance
+    dictionary if all of the *bases* also declare ``__slots__``, as
+    :class:`object` does. ``SchemaConfigured`` does not, so the
+    instances above still have a ``__dict__`` (although the field
+    values are not stored in it)::
+
+      >>> hasattr(A(), '__dict__')
+      True
+      >>> A(a=u'value').__dict__
+      {}
+      >>> hasattr(make_slotted_class(IA)(), '__dict__')
+      False
+
+    :param schema: The interface whose fields should be stored.
+    :keyword bases: The base classes for the new class.
+    :keyword str name: The name of the new class. If not given,
+        this is derived from the name of *schema* by removing
+        a leading ``I``.
+    :keyword omit: Names of fields that should not get a slot.
+
+    .. versionadded:: 1.16.0
+    """
+    if name is None:
+        name = schema.__name__
+        if name.startswith('I') and len(name) > 1:
+            name = name[1:]
+
+    fields = [(field_name, field)
+              for field_name, field in getFieldsInOrder(schema)
+              if field_name not in omit]
+    slots = tuple('_slot_' + field_name for field_name, _ in fields)
+
+    cls = type(str(name), tuple(bases), {
+        '__slots__': slots,
+        # Like createFieldProperties, assume we're called from the module
+        # (or class body) that defines the class.
+        '__module__': sys._getframe(1).f_globals.get('__name__'), # pylint:disable=protected-access
+    })
+    for slot, (field_name, field) in zip(slots, fields):
+        setattr(cls, field_name, SlotFieldProperty(field, cls.__dict__[slot]))
+    classImplements(cls, schema)
+    return cls
+
+
 def field_name(field):
     """
     Produce a clean version of a field's name.
@@ -21,6 +21,9 @@ from zope.interface import Attribute
 from zope.interface import providedBy
 from zope.interface import implementer
 from zope.schema import interfaces as sch_interfaces
+
+from nti.schema._speccache import _spec_attrs
+
 try:
     from zope.schema._bootstrapfields import BeforeObjectAssignedEvent
 except ImportError: # pragma: no cover
@@ -184,6 +187,26 @@ class IFromObject(Interface):
         possible.
         """
 
+class IIterFromObject(IFromObject):
+    """
+    Something that converts collections of objects, and can do so
+    lazily, one item at a time.
+
+    .. versionadded:: 1.16.0
+    """
+
+    def iterFromObject(iterable):
+        """
+        Return an iterator that converts (and validates) each item of
+        *iterable* following the rules of this object only as it is
+        needed.
+
+        If an item cannot be converted, the iterator raises a
+        TypeError or :class:`zope.schema.interfaces.ValidationError`,
+        with its ``index`` attribute set to the position of the item
+        in *iterable*.
+        """
+
 class IVariant(sch_interfaces.IField, IFromObject):
     """
     Similar to :class:`zope.schema.interfaces.IObject`, but
@@ -240,6 +263,13 @@ class VariantValidationError(sch_interfaces.ValidationError):
 class IListOrTuple(sch_interfaces.IList):
     pass
 
+def _find_most_derived_interface(possibilities, iface_upper_bound):
+    _iface = iface_upper_bound
+    for iface in possibilities:
+        if iface.isOrExtends(_iface):
+            _iface = iface
+    return _iface
+
 def find_most_derived_interface(ext_self, iface_upper_bound, possibilities=None):
     """
     Search for the most derived version of the interface `iface_upper_bound`
@@ -247,14 +277,28 @@ def find_most_derived_interface(ext_self, iface_upper_bound, possibilities=None)
 
     :keyword possibilities: An iterable of schemas to consider. If not given,
         all the interfaces provided by ``ext_self`` will be considered.
+
+    .. versionchanged:: 1.16.0
+       If *possibilities* is not given, the result is cached with the
+       specification provided by *ext_self* (which is usually shared by
+       all instances of its class), using the usual interface caching rules,
+       like :func:`nti.schema.schema.schemadict`.
     """
-    if possibilities is None:
-        possibilities = providedBy(ext_self)
-    _iface = iface_upper_bound
-    for iface in possibilities:
-        if iface.isOrExtends(_iface):
-            _iface = iface
-    return _iface
+    if possibilities is not None:
+        return _find_most_derived_interface(possibilities, iface_upper_bound)
+
+    spec = providedBy(ext_self)
+    cache_in = _spec_attrs(spec)
+    if cache_in is None: # pragma: no cover
+        # Not a zope.interface specification.
+        return _find_most_derived_interface(spec, iface_upper_bound)
+
+    key = ('__nti_schema_most_derived_interface', iface_upper_bound)
+    try:
+        return cache_in[key]
+    except KeyError:
+        result = cache_in[key] = _find_most_derived_interface(spec, iface_upper_bound)
+        return result
 
 try:
     from dm.zope.schema.interfaces import ISchemaConfigured as _ISchemaConfigured
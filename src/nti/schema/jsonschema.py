@@ -14,7 +14,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from collections import OrderedDict
 from copy import copy
+import weakref
 
 try:
     from collections.abc import Sequence
@@ -29,6 +31,8 @@ from six import string_types
 from six import text_type
 
 from zope.i18n import translate
+from zope.i18n.interfaces import IUserPreferredLanguages
+from zope.i18nmessageid import Message
 
 from zope.interface.interfaces import IMethod
 from zope.interface.interfaces import IInterface
@@ -36,8 +40,10 @@ from zope.interface.interfaces import IInterface
 from zope.schema import interfaces as sch_interfaces
 from zope.schema import vocabulary as sch_vocabulary
 
+from nti.schema._readonly import _ReadOnlyDict
 from nti.schema.interfaces import IVariant
 from nti.schema.interfaces import find_most_derived_interface
+from nti.schema.schema import _spec_cache
 
 __docformat__ = "restructuredtext en"
 
@@ -138,48 +144,269 @@ def get_ui_types_from_field(field):
 
 _ui_type_from_field = ui_type_from_field = get_ui_types_from_field # BWC
 
-def get_data_from_choice_field(v, base_type=None):
+def _render_vocabulary(vocabulary, read_only=False):
+    # Return a list of the choices for the terms of *vocabulary*,
+    # and whether all their tokens are strings.
+    choices = []
+    tokens = []
+    for term in vocabulary:
+        # For BWC, we do different things depending on whether
+        # there is a title or not
+        if getattr(term, 'title', None):
+            try:
+                # like nti.externalization, but without the dependency
+                choice = term.toExternalObject()
+            except AttributeError:
+                choice = {
+                    'token': term.token,
+                    'value': term.value,
+                    'title': term.title
+                }
+            if read_only and type(choice) is dict:
+                choice = _ReadOnlyDict(choice)
+            choices.append(choice)
+        else:
+            choices.append(term.token)  # bare; ideally this would go away
+        tokens.append(term.token)
+
+    # common case, these will all be the same type
+    return choices, all((isinstance(x, string_types) for x in tokens))
+
+# {id(vocabulary): (weakref to vocabulary, choices, string_tokens)}.
+# Vocabularies are compared by identity; a vocabulary factory that
+# builds a new one each time it is called gets new choices, and
+# equality can be expensive.
+_rendered_vocabularies = {}
+
+def _rendered_vocabulary(vocabulary):
+    key = id(vocabulary)
+    entry = _rendered_vocabularies.get(key)
+    if entry is not None and entry[0]() is vocabulary:
+        return entry[1], entry[2]
+
+    choices, string_tokens = _render_vocabulary(vocabulary, True)
+    choices = tuple(choices)
+
+    def discard(ref):
+        if _rendered_vocabularies.get(key, (None,))[0] is ref:
+            del _rendered_vocabularies[key]
+    try:
+        ref = weakref.ref(vocabulary, discard)
+    except TypeError:
+        # Can't be cached.
+        pass
+    else:
+        _rendered_vocabularies[key] = (ref, choices, string_tokens)
+    return choices, string_tokens
+
+def get_data_from_choice_field(v, base_type=None, cache=False):
+    """
+    Return the list of choices for the vocabulary of the
+    ``Choice`` field *v*, and its base type.
+
+    :keyword bool cache: If true (*not* the default), the choices of
+        each vocabulary instance are computed once and shared, so
+        the dictionaries in the list can't be modified. Only use this
+        if the terms of the vocabularies don't change.
+
+    .. versionchanged:: 1.16.0
+       Add the *cache* argument.
+    """
     # Vocabulary could be a name or the vocabulary itself
     choices = ()
     vocabulary = None
-    if sch_interfaces.IVocabulary.providedBy(v.vocabulary): # pragma: no cover
+    if sch_interfaces.IVocabulary.providedBy(v.vocabulary):
         vocabulary = v.vocabulary
     elif isinstance(v.vocabularyName, string_types):
         name = v.vocabularyName
         vocabulary = sch_vocabulary.getVocabularyRegistry().get(None, name)
 
     if vocabulary is not None:
-        choices = []
-        tokens = []
-        for term in vocabulary:
-            # For BWC, we do different things depending on whether
-            # there is a title or not
-            if getattr(term, 'title', None):
-                try:
-                    # like nti.externalization, but without the dependency
-                    choice = term.toExternalObject()
-                except AttributeError: # pragma: no cover
-                    choice = {
-                        'token': term.token,
-                        'value': term.value,
-                        'title': term.title
-                    }
-
-                choices.append(choice)
-            else: # pragma: no cover
-                choices.append(term.token)  # bare; ideally this would go away
-            tokens.append(term.token)
-
-        # common case, these will all be the same type
-        if  not base_type \
-            and all((isinstance(x, string_types) for x in tokens)):
+        if cache:
+            rendered, string_tokens = _rendered_vocabulary(vocabulary)
+            choices = list(rendered)
+        else:
+            choices, string_tokens = _render_vocabulary(vocabulary)
+        if not base_type and string_tokens:
             base_type = 'string'
     return choices, base_type
 _process_choice_field = process_choice_field = get_data_from_choice_field
 
 
+class SchemaCacheStatistics(object):
+    """
+    Counts how often :meth:`JsonSchemafier.make_schema` found its
+    result in the cache.
+
+    .. versionadded:: 1.16.0
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self):
+        self.hits = self.misses = 0
+
+    def __repr__(self):
+        return '<%s.%s hits=%d misses=%d>' % (
+            type(self).__module__, type(self).__name__, self.hits, self.misses)
+
+
+_marker = object()
+
+_SCHEMA_ATOMS = frozenset(string_types + integer_types + (bytes, float, bool, type(None)))
+
+def _copy_schema(value):
+    # Copy the dictionaries and lists of a schema, which is all
+    # that make_schema itself creates, and (shallowly) anything else
+    # that isn't a primitive, as _make_field_schema does.
+    kind = type(value)
+    if kind in _SCHEMA_ATOMS:
+        return value
+    if kind is dict:
+        return {k: v if type(v) in _SCHEMA_ATOMS else _copy_schema(v)
+                for k, v in value.items()}
+    if kind is list:
+        return [_copy_schema(v) for v in value]
+    return copy(value)
+
+
+try:
+    _move_to_end = OrderedDict.move_to_end
+except AttributeError: # pragma: no cover
+    # Python 2
+    def _move_to_end(ordered_dict, key):
+        ordered_dict[key] = ordered_dict.pop(key)
+
+
+class TranslationCache(object):
+    """
+    A cache of the most recently used translations made by
+    :meth:`JsonSchemafier._translate`, holding at most *maxsize* of
+    them. The ``hits`` and ``misses`` attributes count how often a
+    translation was found in it.
+
+    It can be used by several threads at once, although the counts
+    may then be approximate.
+
+    See :attr:`JsonSchemafier.translation_cache`.
+
+    .. versionadded:: 1.16.0
+    """
+
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._translations = OrderedDict()
+
+    def get(self, key, default=None):
+        """
+        Return the translation cached for *key*, or *default*.
+        """
+        translations = self._translations
+        try:
+            value = translations[key]
+            # Now the most recently used.
+            _move_to_end(translations, key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """
+        Cache the translation *value* for *key*, discarding the least
+        recently used translations if there are too many.
+        """
+        translations = self._translations
+        translations[key] = value
+        _move_to_end(translations, key)
+        while len(translations) > self.maxsize:
+            try:
+                translations.popitem(last=False)
+            except KeyError: # pragma: no cover
+                # Another thread emptied it.
+                break
+
+    def clear(self):
+        """
+        Discard all the translations and reset the counts.
+        """
+        self._translations.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._translations)
+
+    def __repr__(self):
+        return '<%s.%s size=%d maxsize=%d hits=%d misses=%d>' % (
+            type(self).__module__, type(self).__name__,
+            len(self), self.maxsize, self.hits, self.misses)
+
+
+def _queryable_field_fields(field_iface, excluded):
+    # The (name, field) pairs of the fields of the field interface
+    # *field_iface*, except those named in *excluded*. These are the
+    # same for all fields of the same kind, so they are cached with it.
+    cache_in = _spec_cache(field_iface)
+    key = ('__nti_schema_jsonschema_field_fields', excluded)
+    try:
+        return cache_in[key]
+    except KeyError:
+        pass
+    result = cache_in[key] = tuple(
+        (name, field_field)
+        for name, field_field in field_iface.namesAndDescriptions(all=True)
+        if name not in excluded and sch_interfaces.IField.providedBy(field_field)
+    )
+    return result
+
+
 class JsonSchemafier(object):
 
+    #: If true, the results of `make_schema` are cached with the schema
+    #: until it changes (as for :func:`nti.schema.schema.schemadict`),
+    #: separately for each class of schemafier, *readonly_override*
+    #: and the languages returned by :meth:`get_context_languages`.
+    #: Each call returns a new copy of the result.
+    #:
+    #: Only enable this if the schema produced doesn't depend on
+    #: anything else, such as the current site or user.
+    #:
+    #: .. versionadded:: 1.16.0
+    cache_schemas = False
+
+    #: The `SchemaCacheStatistics` updated when `cache_schemas` is true.
+    #:
+    #: .. versionadded:: 1.16.0
+    schema_cache_statistics = SchemaCacheStatistics()
+
+    #: If not None, a `TranslationCache` used by `_translate`. Each
+    #: text is then translated once for each message id, domain,
+    #: default, mapping and the languages returned by
+    #: :meth:`get_context_languages`, instead of looking up the
+    #: translation domain and negotiating the language each time.
+    #: The cache can be shared between classes.
+    #:
+    #: Only use this if nothing else affects translations, such as
+    #: the current site, and the translations don't change.
+    #:
+    #: .. versionadded:: 1.16.0
+    translation_cache = None
+
+    #: If true, the choices for the vocabulary of each ``Choice``
+    #: field are computed once for each vocabulary instance and
+    #: shared (see :func:`get_data_from_choice_field`).
+    #:
+    #: Only enable this if the terms of the vocabularies don't
+    #: change, and nothing modifies the choices of a schema.
+    #:
+    #: .. versionadded:: 1.16.0
+    cache_vocabularies = False
+
     def __init__(self, schema, readonly_override=None, context=None):
         """
         Create a new schemafier.
@@ -227,8 +454,12 @@ class JsonSchemafier(object):
     def get_data_from_choice_field(self, field, base_type=None):
         """
         Return the choices and base type for the specified field
+
+        .. versionchanged:: 1.16.0
+           Use `cache_vocabularies`.
         """
-        return get_data_from_choice_field(field, base_type)
+        return get_data_from_choice_field(field, base_type,
+                                          cache=self.cache_vocabularies)
     process_choice_field = get_data_from_choice_field # BWC
 
     def post_process_field(self, name, field, item_schema):
@@ -250,7 +481,52 @@ class JsonSchemafier(object):
         :return: A dictionary consisting of dictionaries, one for each field. All the keys
             are strings and the values are strings, bools, numbers, or lists of primitives.
             Will be suitable for writing to JSON.
+
+        .. versionchanged:: 1.16.0
+           Cache the results if `cache_schemas` is true.
         """
+        if not self.cache_schemas:
+            return self._make_schema()
+
+        cache_in = _spec_cache(self.schema)
+        if cache_in is None:
+            # Not an interface, or anything else we can cache with.
+            return self._make_schema()
+        key = ('__nti_schema_jsonschema',
+               type(self),
+               self.readonly_override,
+               self.get_context_languages())
+        try:
+            ext_schema = cache_in[key]
+        except KeyError:
+            self.schema_cache_statistics.misses += 1
+            ext_schema = cache_in[key] = self._make_schema()
+        else:
+            self.schema_cache_statistics.hits += 1
+        return _copy_schema(ext_schema)
+
+    def get_context_languages(self):
+        """
+        Return the languages preferred by the translation context,
+        as a tuple, or None.
+
+        This is part of the keys used when `cache_schemas` is true,
+        so that schemas translated differently are cached separately,
+        and by the `translation_cache`.
+        By default, the context is adapted to
+        :class:`zope.i18n.interfaces.IUserPreferredLanguages`,
+        which is what the standard language negotiation uses.
+
+        .. versionadded:: 1.16.0
+        """
+        if self.context is None:
+            return None
+        languages = IUserPreferredLanguages(self.context, None)
+        if languages is None:
+            return None
+        return tuple(languages.getPreferredLanguages())
+
+    def _make_schema(self):
         ext_schema = {}
         for k, v in self._iter_names_and_descriptions():
             __traceback_info__ = k, v
@@ -270,7 +546,45 @@ class JsonSchemafier(object):
         return ext_schema
 
     def _translate(self, text):
-        return translate(text, context=self.context)
+        cache = self.translation_cache
+        if cache is None:
+            return translate(text, context=self.context)
+
+        languages = self._translation_languages()
+        if isinstance(text, Message):
+            # Messages carry their own domain and arguments; they
+            # compare equal to any text with the same message id.
+            mapping = text.mapping
+            if mapping:
+                try:
+                    mapping = tuple(sorted(mapping.items()))
+                except TypeError: # pragma: no cover
+                    # Keys that can't be sorted
+                    return translate(text, context=self.context)
+            key = (text, text.domain, text.default, mapping,
+                   text.msgid_plural, text.default_plural, text.number,
+                   languages)
+        else:
+            key = (text, languages)
+
+        try:
+            result = cache.get(key, _marker)
+        except TypeError:
+            # Something in the mapping can't be hashed.
+            return translate(text, context=self.context)
+        if result is _marker:
+            result = translate(text, context=self.context)
+            cache.set(key, result)
+        return result
+
+    def _translation_languages(self):
+        # get_context_languages() for the current context, remembered
+        # for the translation_cache key.
+        context = self.context
+        cached = self.__dict__.get('_v_translation_languages')
+        if cached is None or cached[0] is not context:
+            cached = self._v_translation_languages = (context, self.get_context_languages())
+        return cached[1]
 
     def _make_field_schema(self, field, name=None):
         name = name or field.__name__ or ''
@@ -352,16 +666,19 @@ class JsonSchemafier(object):
             return
 
         # Take anything it has as a primitive, query it, and put it in the schema.
-        for name, field_field in derived_field_iface.namesAndDescriptions(all=True):
-            if name in item_schema or name in _excluded:
+        for name, field_field in _queryable_field_fields(derived_field_iface, _excluded):
+            if name in item_schema:
                 # Cheap test first: if we've already got it, ignore it
                 continue
-            if not sch_interfaces.IField.providedBy(field_field):
-                continue
 
             # A few things we handle specially.
             value = field_field.query(field)
-            if sch_interfaces.IField.providedBy(value):
+            kind = type(value)
+            if kind in _SCHEMA_ATOMS:
+                # Most values; these can't be fields or interfaces.
+                if kind is text_type:
+                    value = self._translate(value)
+            elif sch_interfaces.IField.providedBy(value):
                 # It is another field, yay, like value_type or key_type,
                 # so we need to recurse
                 value = self._make_field_schema(value)
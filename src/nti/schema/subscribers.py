@@ -10,7 +10,9 @@ from __future__ import print_function
 
 from zope.component import adapter
 from zope.component import handle
+from zope.schema.interfaces import IFieldUpdatedEvent
 
+from nti.schema.eqhash import clear_cached_hash
 from nti.schema.interfaces import IBeforeSchemaFieldAssignedEvent
 
 __docformat__ = "restructuredtext en"
@@ -30,3 +32,17 @@ def before_object_assigned_event_dispatcher(event):
     :func:`zope.component.event.objectEventNotify`
     """
     handle(event.object, event.context, event)
+
+
+@adapter(IFieldUpdatedEvent)
+def clear_cached_hash_on_field_updated(event):
+    """
+    Listens for :class:`zope.schema.interfaces.IFieldUpdatedEvent`,
+    sent when a :class:`zope.schema.fieldproperty.FieldProperty` sets a
+    value, and discards any hash cached by
+    ``EqHash(..., cache_hash=True)`` for the object being updated.
+
+    .. seealso:: :func:`nti.schema.eqhash.clear_cached_hash`
+    .. versionadded:: 1.16.0
+    """
+    clear_cached_hash(event.object)
@@ -9,7 +9,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from ..eqhash import EqHash
+from nti.schema.eqhash import EqHash
 
 @EqHash('a', 'b')
 class Thing(object):
@@ -24,6 +24,10 @@ class Thing2(object):
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
 
+@EqHash('a', 'b', superhash=True, cache_hash=True)
+class CachedThing2(Thing2):
+    pass
+
 @EqHash('a', 'b', include_type=True)
 class NotThing(object):
     a = 'a'
@@ -50,8 +54,73 @@ class ManyThing(object):
     e = 'e'
     f = 'f'
 
+_TWENTY_NAMES = tuple('attr_' + str(i) for i in range(20))
+TwentyThing = EqHash(*_TWENTY_NAMES)(
+    type('TwentyThing', (object,), {name: name for name in _TWENTY_NAMES})
+)
+
+@EqHash('a', 'b', 'c', order=True)
+class OrderedThing(object):
+
+    def __init__(self, a, b, c):
+        self.a = a
+        self.b = b
+        self.c = c
+
 # pylint:disable=line-too-long
 
+def bench_pyperf(): # pragma: no cover
+    """
+    Run the hash and equality benchmarks for classes with 2, 6 and
+    20 names, and the sorting benchmarks, under pyperf.
+    """
+    import pyperf
+
+    def bench_hash_of(loops, thing):
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            hash(thing)
+        return pyperf.perf_counter() - t0
+
+    def bench_eq_of(loops, thing, thing2):
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            thing == thing2 # pylint:disable=pointless-statement
+        return pyperf.perf_counter() - t0
+
+    def make(cls, names):
+        # Real objects usually keep their values in the instance,
+        # not the class.
+        thing = cls()
+        for name in names:
+            setattr(thing, name, name)
+        return thing
+
+    runner = pyperf.Runner()
+    for cls, names in ((Thing, 'ab'), (ManyThing, 'abcdef'), (TwentyThing, _TWENTY_NAMES)):
+        runner.bench_time_func('hash %d names' % len(names), bench_hash_of,
+                               make(cls, names))
+        runner.bench_time_func('eq %d names' % len(names), bench_eq_of,
+                               make(cls, names), make(cls, names))
+    runner.bench_time_func('hash superhash', bench_hash_of, Thing2(a={}))
+    runner.bench_time_func('hash superhash cached', bench_hash_of,
+                           CachedThing2(a={}))
+
+    import random
+    rand = random.Random(42)
+    ordered_things = [OrderedThing(rand.randint(0, 10), rand.randint(0, 10), rand.random())
+                      for _ in range(10000)]
+
+    def bench_sort(loops, key):
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            sorted(ordered_things, key=key)
+        return pyperf.perf_counter() - t0
+
+    runner.bench_time_func('sort 10000 __lt__', bench_sort, None)
+    runner.bench_time_func('sort 10000 sort_key()', bench_sort, OrderedThing.sort_key())
+    runner.bench_time_func('sort 10000 lambda', bench_sort, lambda t: (t.a, t.b, t.c))
+
 def bench_hash(): # pragma: no cover
     import timeit
     import statistics
@@ -161,3 +230,5 @@ if __name__ == '__main__':
         bench_hash()
     elif '--timeeq' in sys.argv:
         bench_eq()
+    else:
+        bench_pyperf()
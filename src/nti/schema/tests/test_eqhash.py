@@ -15,11 +15,15 @@ import unittest
 
 from ..eqhash import EqHash
 
+from . import SchemaLayer
+
 from hamcrest import assert_that
 from hamcrest import calling
+from hamcrest import has_key
 from hamcrest import is_
 from hamcrest import is_not
 from hamcrest import raises
+from hamcrest import same_instance
 
 __docformat__ = "restructuredtext en"
 
@@ -174,12 +178,395 @@ class TestEqHash(unittest.TestCase):
         assert_that(thing1, is_not(thing2))
         assert_that(hash(thing1), is_not(hash(thing2)))
 
+    def test_hash_values(self):
+        # The generated hash functions produce the documented values.
+        assert_that(hash(ManyThing()),
+                    is_(hash(tuple('abcdef')) ^ hash(tuple('abcdef'))))
+        # A single name isn't wrapped in a tuple
+        assert_that(hash(ChildThingNoSuper()),
+                    is_(hash(('c',)) ^ hash('c')))
+        assert_that(hash(NotThing()),
+                    is_((hash(('a', 'b')) + hash(NotThing)) ^ hash(('a', 'b'))))
+        assert_that(hash(ChildThingNoNames()),
+                    is_(hash(()) ^ (hash(Thing()) << 2) ^ hash(())))
+        assert_that(hash(ChildThing()),
+                    is_(hash(('c',)) ^ (hash(Thing()) << 2) ^ hash('c')))
+
     def test_bad_construct(self):
         assert_that(calling(EqHash), raises(TypeError, "Asking to hash"))
         assert_that(calling(EqHash).with_args(foo=True),
                     raises(TypeError, "Unexpected keyword"))
 
 
+@EqHash('a', 'b', superhash=True, cache_hash=True)
+class CachedThing(object):
+    a = 'a'
+    b = 'b'
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+@EqHash('c', include_super=True, cache_hash=True)
+class CachedChildThing(CachedThing):
+    c = 'c'
+
+
+@EqHash('a', 'b', superhash=True)
+class UncachedThing(CachedThing):
+    pass
+
+
+class TestCacheHash(unittest.TestCase):
+
+    def test_cached(self):
+        from ..eqhash import CACHED_HASH_ATTRIBUTE
+        from ..eqhash import clear_cached_hash
+        thing = CachedThing(a=[1, 2])
+        self.assertNotIn(CACHED_HASH_ATTRIBUTE, thing.__dict__)
+        h = hash(thing)
+        assert_that(h, is_(hash(UncachedThing(a=[1, 2]))))
+        assert_that(thing.__dict__[CACHED_HASH_ATTRIBUTE], is_(h))
+
+        # Violating the contract shows that it's cached.
+        thing.a = [3, 4]
+        assert_that(hash(thing), is_(h))
+
+        clear_cached_hash(thing)
+        self.assertNotIn(CACHED_HASH_ATTRIBUTE, thing.__dict__)
+        assert_that(hash(thing), is_(hash(UncachedThing(a=[3, 4]))))
+
+        # Clearing something that never cached is fine
+        clear_cached_hash(Thing())
+
+    def test_include_super(self):
+        child = CachedChildThing()
+        h = hash(child)
+        assert_that(h, is_not(hash(CachedThing())))
+        assert_that(hash(child), is_(h))
+        assert_that(hash(CachedChildThing()), is_(h))
+
+    def test_not_pickled_or_copied(self):
+        import copy
+        import pickle
+        from ..eqhash import CACHED_HASH_ATTRIBUTE
+        thing = CachedThing(a=[1, 2])
+        h = hash(thing)
+
+        for clone in (copy.copy(thing),
+                      copy.deepcopy(thing),
+                      pickle.loads(pickle.dumps(thing))):
+            self.assertNotIn(CACHED_HASH_ATTRIBUTE, clone.__dict__)
+            assert_that(hash(clone), is_(h))
+        # The original still has it
+        assert_that(thing.__dict__[CACHED_HASH_ATTRIBUTE], is_(h))
+
+        # Copying, then changing the copy, is fine.
+        clone = copy.copy(thing)
+        clone.a = [3, 4]
+        assert_that(hash(clone), is_(hash(UncachedThing(a=[3, 4]))))
+        assert_that(hash(clone), is_not(h))
+
+    def test_cached_value_not_pickled(self):
+        # Even by classes whose own reduce methods ignore __getstate__
+        import pickle
+        from ..eqhash import _CachedHash
+        assert_that(pickle.loads(pickle.dumps(_CachedHash(42))), is_(None))
+
+    def test_copy_existing_getstate(self):
+        import copy
+        from ..eqhash import CACHED_HASH_ATTRIBUTE
+
+        @EqHash('a', cache_hash=True)
+        class WithGetState(object):
+            def __init__(self, a):
+                self.a = a
+                self.volatile = 42
+
+            def __getstate__(self):
+                state = dict(self.__dict__)
+                del state['volatile']
+                return state
+
+        thing = WithGetState(1)
+        hash(thing)
+        clone = copy.copy(thing)
+        assert_that(clone.__dict__, is_({'a': 1}))
+        assert_that(thing.__dict__, has_key(CACHED_HASH_ATTRIBUTE))
+
+    def test_copy_slots(self):
+        import copy
+        from ..eqhash import CACHED_HASH_ATTRIBUTE
+
+        @EqHash('a', cache_hash=True)
+        class WithSlot(object):
+            __slots__ = ('a', CACHED_HASH_ATTRIBUTE)
+
+        thing = WithSlot()
+        thing.a = 1
+        h = hash(thing)
+        clone = copy.copy(thing)
+        assert_that(getattr(clone, CACHED_HASH_ATTRIBUTE, None), is_(None))
+        clone.a = 2
+        assert_that(hash(clone), is_not(h))
+        assert_that(hash(thing), is_(h))
+
+    def test_include_super_called_first(self):
+        child = CachedChildThing()
+        base_hash = CachedThing.__hash__(child)
+        h = hash(child)
+        assert_that(h, is_not(base_hash))
+        assert_that(h, is_(hash(CachedChildThing())))
+        assert_that(hash(child), is_(h))
+        assert_that(CachedThing.__hash__(child), is_(base_hash))
+
+    def test_slots(self):
+        from ..eqhash import CACHED_HASH_ATTRIBUTE
+
+        @EqHash('a', cache_hash=True)
+        class WithSlot(object):
+            __slots__ = ('a', CACHED_HASH_ATTRIBUTE)
+
+            def __init__(self):
+                self.a = 1
+
+        @EqHash('a', cache_hash=True)
+        class WithoutSlot(object):
+            __slots__ = ('a',)
+
+            def __init__(self):
+                self.a = 1
+
+        with_slot = WithSlot()
+        h = hash(with_slot)
+        assert_that(getattr(with_slot, CACHED_HASH_ATTRIBUTE), is_(h))
+        assert_that(hash(with_slot), is_(h))
+
+        without_slot = WithoutSlot()
+        assert_that(hash(without_slot), is_(h))
+        assert_that(hash(without_slot), is_(h))
+
+
+class TestCacheHashConfigured(unittest.TestCase):
+
+    layer = SchemaLayer
+
+    def test_field_property_clears(self):
+        from zope.interface import Interface
+        from zope.schema.fieldproperty import createFieldProperties
+        from ..field import Int
+
+        class IThing(Interface):
+            a = Int()
+
+        @EqHash('a', cache_hash=True)
+        class FPThing(object):
+            createFieldProperties(IThing)
+
+        thing = FPThing()
+        thing.a = 1
+        h = hash(thing)
+        thing.a = 2
+        assert_that(hash(thing), is_not(h))
+
+
+class TestSchemaEqHash(unittest.TestCase):
+
+    def _makeSchema(self):
+        from zope.interface import Interface
+        from ..field import Bool
+        from ..field import Dict
+        from ..field import Int
+        from ..field import List
+        from ..field import Object
+        from ..field import TextLine
+        from ..field import Variant
+
+        class IThing(Interface):
+            things = List()
+            mapping = Dict()
+            obj = Object(Interface)
+            variant = Variant((Int(),))
+            title = TextLine()
+            count = Int()
+            flag = Bool()
+
+        return IThing
+
+    def _makeClass(self, schema, **kwargs):
+
+        class SThing(object):
+            def __init__(self, **kw):
+                self.__dict__.update(kw)
+
+        return EqHash(schema=schema, **kwargs)(SThing)
+
+    def _makeOne(self, cls, **kwargs):
+        values = dict(things=[1], mapping={}, obj=None, variant=1,
+                      title=u'title', count=1, flag=True)
+        values.update(kwargs)
+        return cls(**values)
+
+    def test_cost_order(self):
+        from ..eqhash import _schema_names
+        schema = self._makeSchema()
+        assert_that(_schema_names(schema),
+                    is_(('count', 'flag', 'title', 'variant', 'things', 'mapping', 'obj')))
+        # Cached
+        assert_that(_schema_names(schema), is_(same_instance(_schema_names(schema))))
+
+    def test_eq_hash(self):
+        cls = self._makeClass(self._makeSchema(), superhash=True)
+        thing = self._makeOne(cls)
+        assert_that(thing, is_(self._makeOne(cls)))
+        assert_that(hash(thing), is_(hash(self._makeOne(cls))))
+        assert_that(thing, is_not(self._makeOne(cls, things=[2])))
+        assert_that(thing, is_not(self._makeOne(cls, count=2)))
+
+    def test_mismatch_short_circuits(self):
+        cls = self._makeClass(self._makeSchema())
+
+        class Exploding(object):
+            def __eq__(self, other):
+                raise AssertionError("Should not compare")
+            __ne__ = __eq__
+
+        thing = self._makeOne(cls, obj=Exploding())
+        other = self._makeOne(cls, obj=Exploding(), count=42)
+        assert_that(thing == other, is_(False))
+
+    def test_sequence_schema(self):
+        from zope.interface import Interface
+        from ..field import Int
+
+        class IOther(Interface):
+            other = Int()
+
+        schema = [self._makeSchema(), IOther]
+        cls = self._makeClass(schema)
+        thing = self._makeOne(cls, other=1)
+        assert_that(thing, is_(self._makeOne(cls, other=1)))
+        assert_that(thing, is_not(self._makeOne(cls, other=2)))
+
+    def test_bad_arguments(self):
+        from zope.interface import Interface
+
+        class IEmpty(Interface):
+            pass
+
+        assert_that(calling(EqHash).with_args('a', schema=IEmpty),
+                    raises(TypeError))
+        assert_that(calling(EqHash(schema=IEmpty)).with_args(Thing),
+                    raises(TypeError))
+        # But that's fine if we include the type
+        EqHash(schema=IEmpty, include_type=True)(type('Empty', (object,), {}))
+
+
+@EqHash('a', 'b', order=True)
+class OrderedThing(object):
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+@EqHash('c', include_super=True, order=True)
+class OrderedChildThing(OrderedThing):
+
+    def __init__(self, a, b, c):
+        OrderedThing.__init__(self, a, b)
+        self.c = c
+
+@EqHash('a', 'b', include_type=True, order=True)
+class OrderedTypedThing(OrderedThing):
+    pass
+
+
+class TestOrder(unittest.TestCase):
+
+    def test_compare(self):
+        one = OrderedThing(1, 2)
+        two = OrderedThing(1, 3)
+        for x, y in ((one, two), (one, OrderedThing(2, 0))):
+            assert_that(x < y, same_instance(True))
+            assert_that(x <= y, same_instance(True))
+            assert_that(x > y, same_instance(False))
+            assert_that(x >= y, same_instance(False))
+            assert_that(y > x, same_instance(True))
+            assert_that(y >= x, same_instance(True))
+
+        # Comparisons return bools, not ints, including for
+        # the same object.
+        for x in (one, OrderedThing(1, 2)):
+            assert_that(one < x, same_instance(False))
+            assert_that(one <= x, same_instance(True))
+            assert_that(one > x, same_instance(False))
+            assert_that(one >= x, same_instance(True))
+
+    def test_short_circuits(self):
+        class Exploding(object):
+            def __ne__(self, other):
+                raise AssertionError("Should not compare")
+            __lt__ = __eq__ = __ne__
+
+        assert_that(OrderedThing(1, Exploding()) < OrderedThing(2, Exploding()),
+                    same_instance(True))
+
+    def test_not_implemented(self):
+        thing = OrderedThing(1, 2)
+        for meth in '__lt__', '__le__', '__gt__', '__ge__':
+            assert_that(getattr(thing, meth)(object()), is_(NotImplemented))
+            assert_that(getattr(OrderedTypedThing(1, 2), meth)(thing),
+                        is_(NotImplemented))
+        assert_that(calling(lambda: thing < object()), raises(TypeError))
+
+    def test_include_super(self):
+        assert_that(OrderedChildThing(1, 2, 3) < OrderedChildThing(1, 3, 0), same_instance(True))
+        assert_that(OrderedChildThing(1, 2, 3) < OrderedChildThing(1, 2, 4), same_instance(True))
+        assert_that(OrderedChildThing(1, 2, 3) >= OrderedChildThing(1, 2, 3), same_instance(True))
+        assert_that(OrderedChildThing(1, 2, 3).__lt__(OrderedThing(1, 2)),
+                    is_(NotImplemented))
+
+    def test_sort_key(self):
+        things = [OrderedChildThing(1, 2, 3),
+                  OrderedChildThing(0, 5, 5),
+                  OrderedChildThing(1, 2, 1)]
+        by_key = sorted(things, key=OrderedChildThing.sort_key())
+        assert_that(by_key, is_(sorted(things)))
+        assert_that([t.c for t in by_key], is_([5, 1, 3]))
+
+        assert_that(OrderedThing.sort_key()(things[0]), is_((1, 2)))
+        assert_that(OrderedChildThing.sort_key()(things[0]), is_((1, 2, 3)))
+
+    def test_schema_declaration_order(self):
+        from zope.interface import Interface
+        from ..field import Int
+        from ..field import TextLine
+
+        class IOrdered(Interface):
+            title = TextLine()
+            count = Int()
+
+        @EqHash(schema=IOrdered, order=True)
+        class Thing(object):
+            def __init__(self, title, count):
+                self.title = title
+                self.count = count
+
+        # The Int field is cheaper to compare for equality,
+        # but the TextLine is defined first.
+        assert_that(Thing(u'a', 2) < Thing(u'b', 1), same_instance(True))
+        assert_that(Thing(u'a', 1) < Thing(u'a', 2), same_instance(True))
+        assert_that(Thing.sort_key()(Thing(u'a', 1)), is_((u'a', 1)))
+
+    def test_type_only(self):
+
+        @EqHash(include_type=True, order=True)
+        class TypeOnly(object):
+            pass
+
+        assert_that(TypeOnly.sort_key()(TypeOnly()), is_(()))
+        assert_that(TypeOnly() <= TypeOnly(), same_instance(True))
+
+
 class TestSuperHash(unittest.TestCase):
 
     def superhash(self, arg):
@@ -216,6 +603,83 @@ class TestSuperHash(unittest.TestCase):
                     is_(hash(t)))
 
 
+class TestSuperHashSingleName(unittest.TestCase):
+
+    def test_eq_hash(self):
+
+        @EqHash('a', superhash=True)
+        class Single(object):
+            def __init__(self, a):
+                self.a = a
+
+        assert_that(hash(Single(1)), is_(hash(Single(1))))
+        assert_that(hash(Single([1, 2])), is_(hash(Single([1, 2]))))
+        assert_that(hash(Single([1, 2])), is_not(hash(Single([2, 1]))))
+        assert_that(hash(Single({'a': [1]})), is_not(hash(Single({'a': [2]}))))
+
+
+class TestUnorderedSuperHash(unittest.TestCase):
+
+    def superhash(self, arg):
+        from ..eqhash import _superhash_unordered
+        return _superhash_unordered(arg)
+
+    def test_hashable(self):
+        assert_that(self.superhash(1), is_(1))
+        assert_that(self.superhash((1, 2)), is_((1, 2)))
+
+    def test_dict_order_independent(self):
+        d1 = {}
+        d2 = {}
+        for i in range(100):
+            d1[i] = [i]
+            d2[99 - i] = [99 - i]
+        d1['mixed'] = d2['mixed'] = {1: 2}
+        assert_that(hash(self.superhash(d1)), is_(hash(self.superhash(d2))))
+        d2[0] = [1]
+        assert_that(self.superhash(d1), is_not(self.superhash(d2)))
+
+    def test_nested(self):
+        d = {
+            1: 1,
+            'two': [1, 2, 3],
+            3: {4: [4, 5, 6]},
+            5: {6, 7},
+        }
+        assert_that(self.superhash(d),
+                    is_(frozenset([
+                        (1, 1),
+                        ('two', (1, 2, 3)),
+                        (3, frozenset([(4, (4, 5, 6))])),
+                        (5, frozenset([6, 7])),
+                    ])))
+
+    def test_iterable_ordered(self):
+        assert_that(self.superhash([1, 2]), is_not(self.superhash([2, 1])))
+        assert_that(self.superhash([{1}]), is_((frozenset([1]),)))
+        from collections import deque
+        assert_that(self.superhash(deque([[1], 2])), is_(((1,), 2)))
+
+    def test_eq_hash(self):
+
+        @EqHash('a', superhash='unordered')
+        class Unordered(object):
+            def __init__(self, a):
+                self.a = a
+
+        # Keys that can't be sorted
+        assert_that(hash(Unordered({1: 1, 'a': 'a'})),
+                    is_(hash(Unordered({'a': 'a', 1: 1}))))
+        assert_that(hash(Unordered({1: 1, 'a': 'a'})),
+                    is_not(hash(Unordered({'a': 'b', 1: 1}))))
+        assert_that(hash(Unordered({1, 'a'})),
+                    is_(hash(Unordered({'a', 1}))))
+
+    def test_bad_value(self):
+        assert_that(calling(EqHash).with_args('a', superhash='sorted'),
+                    raises(TypeError))
+
+
 def test_suite():
     import doctest
     suite = unittest.defaultTestLoader.loadTestsFromName(__name__)
@@ -11,8 +11,12 @@ from __future__ import print_function
 # stdlib imports
 import unittest
 import warnings
+import weakref
 
+from zope import component
+from zope import interface
 from zope.component import eventtesting
+import zope.event
 
 from zope.interface.common import interfaces as cmn_interfaces
 from zope.schema import Dict
@@ -45,7 +49,14 @@ from nti.schema.field import ValidDatetime
 from nti.schema.field import ValidRegularExpression
 from nti.schema.field import Variant
 from nti.schema.field import ValidTextLine as TextLine
+from nti.schema.interfaces import BeforeDictAssignedEvent
+from nti.schema.interfaces import BeforeObjectAssignedEvent
+from nti.schema.interfaces import BeforeSequenceAssignedEvent
+from nti.schema.interfaces import BeforeTextAssignedEvent
+from nti.schema.interfaces import BeforeTextLineAssignedEvent
 from nti.schema.interfaces import IBeforeDictAssignedEvent
+from nti.schema.interfaces import IBeforeSchemaFieldAssignedEvent
+from nti.schema.interfaces import IBeforeTextLineAssignedEvent
 from nti.schema.interfaces import IBeforeSequenceAssignedEvent
 from nti.schema.interfaces import InvalidValue
 from nti.schema.interfaces import IVariant
@@ -68,12 +79,14 @@ from hamcrest import calling
 from hamcrest import contains
 from hamcrest import contains_string
 from hamcrest import equal_to
+from hamcrest import has_key
 from hamcrest import has_length
 from hamcrest import has_property
 from hamcrest import is_
 from hamcrest import is_not
 from hamcrest import none
 from hamcrest import raises
+from hamcrest import same_instance
 
 does_not = is_not
 
@@ -379,6 +392,252 @@ class TestVariant(unittest.TestCase):
         with self.assertRaises(VariantValidationError):
             variant.fromObject(None)
 
+    def _linear_errors(self, variant, value, converting):
+        from nti.schema.field import _FieldConverter
+        errors = []
+        for field in variant.fields:
+            try:
+                if converting:
+                    _FieldConverter(field)(value)
+                else:
+                    field.validate(value)
+            except (TypeError, ValidationError) as ex:
+                errors.append(ex)
+        return errors
+
+    def _dispatching_variant(self):
+        from zope.interface import Interface
+        from nti.schema.field import Bool
+
+        class IThing(Interface):
+            pass
+
+        constrained = Object(IThing, constraint=lambda value: False)
+        return Variant((
+            Object(IThing),
+            Object(IUnicode),
+            constrained,
+            Int(),
+            Bool(),
+            ListOrTuple(Int()),
+            TextLine(),
+            DecodingValidTextLine(),
+            ValidDatetime(),
+            Int(missing_value=-1, default=-1),
+        ))
+
+    def test_dispatch(self):
+        from nti.schema.field import _VARIANT_TRY as TRY
+        from nti.schema.field import _VARIANT_WRONG_TYPE as WRONG
+        from nti.schema.field import _VARIANT_CHECK_SCHEMA as SCHEMA
+
+        variant = self._dispatching_variant()
+        assert_that(variant._dispatch(b'abc', False),
+                    is_((SCHEMA, SCHEMA, TRY, WRONG,
+                         # Bool._validate accepts things that aren't bools
+                         TRY,
+                         WRONG, WRONG,
+                         # DecodingValidTextLine overrides validate()
+                         TRY,
+                         TRY, TRY)))
+        assert_that(variant._dispatch(1, False),
+                    is_((SCHEMA, SCHEMA, TRY, TRY, TRY, WRONG, WRONG,
+                         TRY, TRY, TRY)))
+        # Object and sequence fields get a fromObject method, and
+        # many fields have fromUnicode
+        assert_that(variant._dispatch(u'abc', True),
+                    is_((TRY,) * 10))
+        assert_that(variant._dispatch({}, True),
+                    is_((TRY, TRY, TRY, WRONG, TRY, TRY, WRONG, TRY, TRY, TRY)))
+        # None is often the missing value
+        assert_that(variant._dispatch(None, False),
+                    is_((TRY,) * 10))
+
+        # Cached
+        assert_that(variant._dispatch(1, False),
+                    is_(variant._dispatch(1, False)))
+
+        # But not if the fields change
+        table = variant._dispatch_table[2]
+        assert_that(variant.bind(self)._dispatch_table[2], is_(table))
+        clone = variant.bind(self)
+        clone._dispatch(1, False)
+        assert_that(clone._dispatch_table[2], is_not(table))
+
+        variant.fields = variant.fields[3:4]
+        assert_that(variant._dispatch(b'abc', False), is_((WRONG,)))
+
+    def test_dispatch_proxy(self):
+        from zope.proxy import ProxyBase
+
+        class IntLike(object):
+            @property
+            def __class__(self):
+                return int
+
+        variant = Variant((Int(), TextLine()))
+        for value in ProxyBase(5), ProxyBase(u'abc'), IntLike():
+            # The fields use isinstance(), which sees through these.
+            variant.validate(value)
+        # Nothing is remembered about the proxy types.
+        _, _, table = variant._dispatch_table
+        assert_that(table, does_not(has_key((ProxyBase, False))))
+        assert_that(table, does_not(has_key((IntLike, False))))
+
+    def test_dispatch_abc_registration(self):
+        from zope.schema import Sequence
+        from nti.schema.field import _VARIANT_WRONG_TYPE as WRONG
+
+        class Foo(object):
+            def __len__(self):
+                return 0
+
+            def __iter__(self):
+                return iter(())
+
+        variant = Variant((Int(), Sequence()))
+        assert_that(variant._dispatch(Foo(), False), is_((WRONG, WRONG)))
+        assert_that(calling(variant.validate).with_args(Foo()),
+                    raises(VariantValidationError))
+
+        # Sequence._type is collections.abc.Sequence
+        Sequence._type.register(Foo)
+        variant.validate(Foo())
+
+    def test_dispatch_custom_validate(self):
+        from nti.schema.field import Bool
+        from nti.schema.field import _VARIANT_TRY as TRY
+
+        class IntAcceptingTextLine(TextLine):
+            def _validate(self, value):
+                if isinstance(value, int):
+                    return
+                super(IntAcceptingTextLine, self)._validate(value)
+
+        variant = Variant((ListOrTuple(Int()), IntAcceptingTextLine()))
+        assert_that(variant._dispatch(1, False)[1], is_(TRY))
+        variant.validate(1)
+        variant.validate(u'abc')
+        assert_that(variant.fromObject(1), is_(1))
+
+        variant = Variant((Bool(), TextLine()))
+        variant.validate(1)
+        assert_that(variant.fromObject(1), is_(True))
+
+    def test_dispatch_errors_match(self):
+        import datetime
+        from nti.schema.field import Bool
+        variant = self._dispatching_variant()
+        values = (b'abc', 1, u'abc', {}, [1], object(), self, IUnicode,
+                  datetime.datetime.now(), True, -1)
+        self._check_errors_match(variant, values)
+        # Without an Int to accept it, Bool must still be asked about ints.
+        self._check_errors_match(Variant((Bool(), TextLine())),
+                                 (1, 0, 2, u'abc', b'abc', 1.5))
+
+    def _check_errors_match(self, variant, values):
+
+        def describe(ex):
+            # Sequence fields create a new wrapper field for each conversion.
+            return (type(ex), ex.args,
+                    type(getattr(ex, 'field', None)), getattr(ex, 'value', None))
+
+        for converting, meth in ((False, variant.validate), (True, variant.fromObject)):
+            for value in values:
+                expected = self._linear_errors(variant, value, converting)
+                if len(expected) < len(variant.fields):
+                    # Something accepted it
+                    meth(value)
+                    continue
+                with self.assertRaises(VariantValidationError) as exc:
+                    meth(value)
+                assert_that([describe(e) for e in exc.exception.errors],
+                            is_([describe(e) for e in expected]))
+
+    def test_converters_reused(self):
+        variant = Variant((Int(), TextLine()))
+        converters = variant._converters()
+        assert_that(converters, has_length(2))
+        assert_that(variant.fromObject(u'abc'), is_(u'abc'))
+        assert_that(variant._converters(), is_(same_instance(converters)))
+
+        clone = variant.bind(self)
+        assert_that(clone._converters(), is_not(same_instance(converters)))
+        assert_that([c.field for c in clone._converters()],
+                    is_(clone.fields))
+
+    def _set_events(self, variant, *values):
+        from nti.schema.field import suppressed_assignment_events
+        class Context(object):
+            pass
+        context = Context()
+        result = []
+        for value in values:
+            with suppressed_assignment_events() as suppressed:
+                variant.set(context, value)
+            result.extend(suppressed.counts)
+        return result
+
+    def test_set_event_factory_cached(self):
+        class Thing(object):
+            pass
+
+        variant = Variant((TextLine(),), __name__='v')
+        expected = [BeforeTextAssignedEvent, BeforeDictAssignedEvent,
+                    BeforeSequenceAssignedEvent, BeforeObjectAssignedEvent]
+        values = (u'abc', {}, [], Thing())
+        assert_that(self._set_events(variant, *values), is_(expected))
+        # Again, from the cache
+        _, _, factories = variant._event_factories
+        assert_that(factories[weakref.ref(Thing)], is_(same_instance(BeforeObjectAssignedEvent)))
+        assert_that(self._set_events(variant, *values), is_(expected))
+        assert_that(variant._event_factories[2], is_(same_instance(factories)))
+
+        # Registering with an ABC discards it.
+        from nti.schema.field import abcs
+        abcs.Sequence.register(Thing)
+        assert_that(self._set_events(variant, Thing()),
+                    is_([BeforeSequenceAssignedEvent]))
+        assert_that(variant._event_factories[2], is_not(same_instance(factories)))
+
+    def test_set_event_factory_cache_bounded(self):
+        variant = Variant((TextLine(),), __name__='v')
+        variant._EVENT_FACTORY_CACHE_SIZE = 2
+        self._set_events(variant, u'abc', {}, [], 1)
+        assert_that(variant._event_factories[2], has_length(2))
+
+    def test_set_event_factory_subclass(self):
+        class MyVariant(Variant):
+            _EVENT_TYPES = ((object, BeforeObjectAssignedEvent),)
+
+        assert_that(self._set_events(Variant((TextLine(),), __name__='v'), u'abc'),
+                    is_([BeforeTextAssignedEvent]))
+        assert_that(self._set_events(MyVariant((TextLine(),), __name__='v'), u'abc'),
+                    is_([BeforeObjectAssignedEvent]))
+
+        class NoEventVariant(Variant):
+            _EVENT_TYPES = ()
+
+        class Context(object):
+            pass
+        context = Context()
+        NoEventVariant((TextLine(),), __name__='v').set(context, u'abc')
+        assert_that(context, does_not(has_property('v')))
+
+    def test_set_event_factory_proxy(self):
+        class MappingProxy(object):
+            @property
+            def __class__(self):
+                return dict
+
+        variant = Variant((TextLine(),), __name__='v')
+        assert_that(self._set_events(variant, MappingProxy(), object()),
+                    is_([BeforeDictAssignedEvent, BeforeObjectAssignedEvent]))
+        _, _, factories = variant._event_factories
+        assert_that(factories, has_key(weakref.ref(object)))
+        assert_that(factories, does_not(has_key(weakref.ref(MappingProxy))))
+
+
 class TestConfiguredVariant(unittest.TestCase):
 
     layer = SchemaLayer
@@ -418,6 +677,194 @@ class TestConfiguredVariant(unittest.TestCase):
         assert_that(events, has_length(1))
         assert_that(events, contains(has_property('object', {'k': 'v'})))
 
+class TestSetEventFastPath(unittest.TestCase):
+
+    layer = SchemaLayer
+
+    class IContext(interface.Interface):
+        pass
+
+    def setUp(self):
+        @interface.implementer(self.IContext)
+        class Context(object):
+            pass
+
+        class Plain(object):
+            pass
+
+        self.context = Context()
+        self.plain = Plain()
+        self.handled = []
+        self.field = TextLine(__name__='text')
+        eventtesting.clearEvents()
+        # eventtesting registers a handler for every event.
+        gsm = component.getGlobalSiteManager()
+        self.assertTrue(gsm.unregisterHandler(eventtesting.events.append, (None,)))
+
+    def tearDown(self):
+        component.provideHandler(eventtesting.events.append, (None,))
+
+    def _has_subscribers(self, context=None):
+        from nti.schema.field import _event_has_subscribers
+        return _event_has_subscribers(BeforeTextLineAssignedEvent, u'abc',
+                                      context if context is not None else self.context)
+
+    def _handler(self, value, context, event):
+        self.handled.append((value, context))
+        event.object = u'changed'
+
+    def test_no_subscribers(self):
+        assert_that(self._has_subscribers(), is_(False))
+        self.field.set(self.context, u'abc')
+        assert_that(self.context.text, is_(u'abc'))
+
+        # Without the dispatcher from zope.component, nothing is listening.
+        with _replaced_event_subscribers([]):
+            assert_that(self._has_subscribers(), is_(False))
+
+    def test_other_event_subscribers(self):
+        events = []
+        with _replaced_event_subscribers(zope.event.subscribers + [events.append]):
+            assert_that(self._has_subscribers(), is_(True))
+            self.field.set(self.context, u'abc')
+        assert_that(events, has_length(1))
+
+    def test_registry_changes(self):
+        assert_that(self._has_subscribers(), is_(False))
+
+        gsm = component.getGlobalSiteManager()
+        gsm.registerHandler(self._handler,
+                            (IUnicode, self.IContext, IBeforeTextLineAssignedEvent))
+        try:
+            assert_that(self._has_subscribers(), is_(True))
+            # Not for other contexts.
+            assert_that(self._has_subscribers(self.plain), is_(False))
+            self.field.set(self.context, u'abc')
+            assert_that(self.context.text, is_(u'changed'))
+            assert_that(self.handled, is_([(u'abc', self.context)]))
+        finally:
+            gsm.unregisterHandler(self._handler,
+                                  (IUnicode, self.IContext, IBeforeTextLineAssignedEvent))
+        assert_that(self._has_subscribers(), is_(False))
+
+    def test_other_event_handlers(self):
+        events = []
+        def handler(event):
+            events.append(event)
+
+        gsm = component.getGlobalSiteManager()
+        gsm.registerHandler(handler, (IBeforeTextLineAssignedEvent,))
+        try:
+            assert_that(self._has_subscribers(), is_(True))
+            self.field.set(self.plain, u'abc')
+        finally:
+            gsm.unregisterHandler(handler, (IBeforeTextLineAssignedEvent,))
+        assert_that(events, has_length(1))
+
+    def test_interface_changes(self):
+        class IOtherContext(interface.Interface):
+            pass
+
+        class Context(object):
+            pass
+
+        context = Context()
+        gsm = component.getGlobalSiteManager()
+        gsm.registerHandler(self._handler,
+                            (IUnicode, IOtherContext, IBeforeTextLineAssignedEvent))
+        try:
+            assert_that(self._has_subscribers(context), is_(False))
+            interface.classImplements(Context, IOtherContext)
+            assert_that(self._has_subscribers(context), is_(True))
+        finally:
+            gsm.unregisterHandler(self._handler,
+                                  (IUnicode, IOtherContext, IBeforeTextLineAssignedEvent))
+
+
+class TestSuppressedAssignmentEvents(unittest.TestCase):
+
+    layer = SchemaLayer
+
+    class Context(object):
+        pass
+
+    def setUp(self):
+        eventtesting.clearEvents()
+
+    def _events(self):
+        return eventtesting.getEvents(IBeforeSchemaFieldAssignedEvent)
+
+    def test_suppressed(self):
+        from nti.schema.field import suppressed_assignment_events
+        context = self.Context()
+        text = TextLine(__name__='text')
+        variant = Variant((TextLine(), ListOrTuple()), __name__='variant')
+        tuple_field = TupleFromObject(__name__='tuple')
+
+        with suppressed_assignment_events() as suppressed:
+            text.set(context, u'abc')
+            variant.set(context, [1])
+            variant.set(context, u'abc')
+            tuple_field.set(context, (1,))
+
+        assert_that(self._events(), is_([]))
+        assert_that(context, has_property('text', u'abc'))
+        assert_that(context, has_property('tuple', (1,)))
+        assert_that(suppressed, has_property('count', 4))
+        assert_that(suppressed.counts, is_({
+            BeforeTextLineAssignedEvent: 1,
+            BeforeTextAssignedEvent: 1,
+            BeforeSequenceAssignedEvent: 2,
+        }))
+        assert_that(repr(suppressed), contains_string('count=4'))
+
+        # Afterwards, events are notified again.
+        text.set(context, u'def')
+        assert_that(self._events(), has_length(1))
+
+    def test_nested(self):
+        from nti.schema.field import suppressed_assignment_events
+        context = self.Context()
+        text = TextLine(__name__='text')
+        with suppressed_assignment_events() as outer:
+            text.set(context, u'abc')
+            with suppressed_assignment_events() as inner:
+                text.set(context, u'abc')
+                text.set(context, u'abc')
+            text.set(context, u'abc')
+            assert_that(inner, has_property('count', 2))
+            assert_that(outer, has_property('count', 4))
+        assert_that(outer.counts, is_({BeforeTextLineAssignedEvent: 4}))
+        assert_that(self._events(), is_([]))
+
+    def test_thread_local(self):
+        import threading
+        from nti.schema.field import suppressed_assignment_events
+        context = self.Context()
+        text = TextLine(__name__='text')
+
+        with suppressed_assignment_events() as suppressed:
+            thread = threading.Thread(target=text.set, args=(context, u'abc'))
+            thread.start()
+            thread.join()
+        assert_that(suppressed, has_property('count', 0))
+        assert_that(self._events(), has_length(1))
+
+
+class _replaced_event_subscribers(object):
+
+    def __init__(self, subscribers):
+        self.subscribers = subscribers
+        self.old = None
+
+    def __enter__(self):
+        self.old = zope.event.subscribers[:]
+        zope.event.subscribers[:] = self.subscribers
+
+    def __exit__(self, *args):
+        zope.event.subscribers[:] = self.old
+
+
 class TestValidSet(unittest.TestCase):
 
     def _getTargetClass(self):
@@ -482,6 +929,97 @@ class SequenceFromObjectMixinMixin(object):
         assert_that(field.fromObject(self), is_(self))
 
 
+class TestSequenceConverters(unittest.TestCase):
+
+    def test_converters_reused(self):
+        field = ListOrTupleFromObject(Int())
+        assert_that(field.fromObject([u'1', 2]), is_([1, 2]))
+        converter = field._converter_for(field.value_type)
+        assert_that(converter.field, is_(same_instance(field.value_type)))
+        assert_that(field._converter_for(field.value_type), is_(same_instance(converter)))
+
+        # Binding binds the value_type too, and the clone
+        # doesn't disturb the original.
+        clone = field.bind(self)
+        assert_that(clone.fromObject([u'3']), is_([3]))
+        clone_converter = clone._converter_for(clone.value_type)
+        assert_that(clone_converter.field, is_(same_instance(clone.value_type)))
+        assert_that(field._converter_for(field.value_type), is_(same_instance(converter)))
+
+    def test_map_converters(self):
+        from nti.schema.field import DictFromObject
+        field = DictFromObject(key_type=TextLine(), value_type=Int())
+        assert_that(field.fromObject({u'a': u'1'}), is_({u'a': 1}))
+        assert_that(field._field_converters, has_length(2))
+        assert_that(field.fromObject({u'b': u'2'}), is_({u'b': 2}))
+        assert_that([c.field for c in field._field_converters],
+                    is_([field.key_type, field.value_type]))
+
+
+class TestIterFromObject(unittest.TestCase):
+
+    def test_interfaces(self):
+        from nti.schema.field import DictFromObject
+        from nti.schema.interfaces import IIterFromObject
+        assert_that(ListOrTupleFromObject(Int()), verifiably_provides(IIterFromObject))
+        assert_that(DictFromObject(key_type=TextLine(), value_type=Int()),
+                    verifiably_provides(IIterFromObject))
+
+    def test_lazy(self):
+        field = ListOrTupleFromObject(Int())
+        consumed = []
+
+        def items():
+            for x in (u'1', u'2', u'x', u'4'):
+                consumed.append(x)
+                yield x
+
+        it = field.iterFromObject(items())
+        assert_that(consumed, is_([]))
+        assert_that(next(it), is_(1))
+        assert_that(consumed, is_([u'1']))
+        assert_that(next(it), is_(2))
+        with self.assertRaises(ValidationError) as exc:
+            next(it)
+        assert_that(exc.exception, has_property('index', 2))
+        assert_that(consumed, is_([u'1', u'2', u'x']))
+
+    def test_type_error_index(self):
+        from zope.interface import Interface
+
+        class IThing(Interface):
+            pass
+
+        field = ListOrTupleFromObject(Variant((Object(IThing),)))
+        with self.assertRaises(VariantValidationError) as exc:
+            list(field.iterFromObject([object()]))
+        assert_that(exc.exception, has_property('index', 0))
+
+        field = ListOrTupleFromObject(Object(IThing))
+        with self.assertRaises(TypeError) as exc:
+            list(field.iterFromObject(iter([object()])))
+        assert_that(exc.exception, has_property('index', 0))
+
+    def test_map(self):
+        from nti.schema.field import DictFromObject
+        field = DictFromObject(key_type=TextLine(), value_type=Int())
+        assert_that(list(field.iterFromObject({u'a': u'1'})),
+                    is_([(u'a', 1)]))
+        assert_that(dict(field.iterFromObject(iter([(u'a', u'1'), (u'b', 2)]))),
+                    is_({u'a': 1, u'b': 2}))
+        with self.assertRaises(ValidationError) as exc:
+            list(field.iterFromObject([(u'a', u'1'), (u'b', u'x')]))
+        assert_that(exc.exception, has_property('index', 1))
+
+    def test_fromObject_result_types(self):
+        from nti.schema.field import UniqueIterable
+        from nti.schema.field import ValidSet
+        assert_that(TupleFromObject(Int()).fromObject([u'1', 2]), is_((1, 2)))
+        assert_that(ValidSet(value_type=Int()).fromObject({u'1', 1}), is_({1}))
+        assert_that(UniqueIterable(value_type=Int()).fromObject([u'1', 1]), is_({1}))
+        assert_that(ListOrTupleFromObject(Int()).fromObject((u'1', 2)), is_([1, 2]))
+
+
 class TestTupleFromObject(SequenceFromObjectMixinMixin,
                           unittest.TestCase):
 
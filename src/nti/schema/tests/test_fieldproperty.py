@@ -159,6 +159,107 @@ class TestAdaptingFieldProperty(unittest.TestCase):
             obj.ob = Conforms()
             assert_that(obj.ob, is_(Baz))
 
+class TestMakeSlottedClass(unittest.TestCase):
+
+    def _makeSchema(self):
+        from nti.schema.field import Int
+
+        class IBase(Interface):
+            base = Int(required=False, default=1)
+
+        class IThing(IBase):
+            text = TextLine(required=False)
+            ro = Int(readonly=True, required=False, default=2)
+
+        return IThing
+
+    def test_class(self):
+        from nti.schema.fieldproperty import SlotFieldProperty
+        from nti.schema.fieldproperty import make_slotted_class
+        IThing = self._makeSchema()
+        Thing = make_slotted_class(IThing)
+
+        assert_that(Thing, has_property('__name__', 'Thing'))
+        assert_that(Thing, has_property('__module__', __name__))
+        assert_that(Thing, has_property('__slots__',
+                                        ('_slot_base', '_slot_text', '_slot_ro')))
+        assert_that(Thing.base, is_(SlotFieldProperty))
+        assert_that(IThing.implementedBy(Thing), is_(True))
+
+        Thing = make_slotted_class(IThing, name='Other', omit=('text',))
+        assert_that(Thing, has_property('__name__', 'Other'))
+        assert_that(Thing, has_property('__slots__', ('_slot_base', '_slot_ro')))
+
+    def test_values(self):
+        from zope.schema.interfaces import ValidationError
+        from nti.schema.fieldproperty import make_slotted_class
+        thing = make_slotted_class(self._makeSchema())()
+
+        assert_that(thing, does_not(has_property('__dict__')))
+        assert_that(thing, has_property('base', 1))
+        assert_that(thing, has_property('text', none()))
+        assert_that(type(thing).base.queryValue(thing, None), is_(1))
+
+        thing.base = 3
+        assert_that(thing, has_property('base', 3))
+        assert_that(type(thing).base.queryValue(thing, None), is_(3))
+        assert_that(calling(setattr).with_args(thing, 'base', u'abc'),
+                    raises(ValidationError))
+
+        assert_that(thing, has_property('ro', 2))
+        thing.ro = 4
+        assert_that(thing, has_property('ro', 4))
+        assert_that(calling(setattr).with_args(thing, 'ro', 5),
+                    raises(ValueError, 'readonly'))
+
+    def test_events(self):
+        import zope.event
+        from nti.schema.fieldproperty import make_slotted_class
+
+        class IThing(Interface):
+            text = TextLine(required=False)
+
+        Thing = make_slotted_class(IThing)
+
+        events = []
+        zope.event.subscribers.append(events.append)
+        try:
+            thing = Thing()
+            thing.text = u'abc'
+            thing.text = u'def'
+        finally:
+            zope.event.subscribers.remove(events.append)
+
+        assert_that(events, has_length(2))
+        assert_that(events[0], has_property('field', has_property('__name__', 'text')))
+        assert_that(events[0], has_property('old_value', none()))
+        assert_that(events[0], has_property('new_value', u'abc'))
+        assert_that(events[1], has_property('old_value', u'abc'))
+
+    def test_schema_configured_and_eqhash(self):
+        from nti.schema.eqhash import EqHash
+        from nti.schema.fieldproperty import make_slotted_class
+        from nti.schema.schema import SchemaConfigured
+        IThing = self._makeSchema()
+
+        Thing = EqHash('base', 'text')(
+            make_slotted_class(IThing, bases=(SchemaConfigured,)))
+
+        thing = Thing(base=5, text=u'abc')
+        # SchemaConfigured has no __slots__, but the values
+        # are kept out of the dict.
+        assert_that(thing, has_property('__dict__', {}))
+        assert_that(thing, has_property('base', 5))
+        assert_that(thing, has_property('ro', 2))
+        # All the fields are handled by the properties.
+        _, items = Thing.__dict__['__SchemaConfigured_elide_fieldproperty']
+        assert_that(items, is_(()))
+
+        assert_that(thing, is_(Thing(base=5, text=u'abc')))
+        assert_that(hash(thing), is_(hash(Thing(base=5, text=u'abc'))))
+        assert_that(thing, is_not(Thing(base=5)))
+
+
 def test_suite():
     return unittest.TestSuite((
         unittest.defaultTestLoader.loadTestsFromName(__name__),
@@ -69,3 +69,75 @@ class TestInvalidValue(unittest.TestCase):
     def test_alias(self):
         from zope.schema import interfaces as sch_interfaces
         self.assertIs(InvalidValue, sch_interfaces.InvalidValue)
+
+
+class TestFindMostDerivedInterface(unittest.TestCase):
+
+    def _makeClasses(self):
+        from zope import interface
+
+        class IDerivedBase(interface.Interface):
+            pass
+
+        class IDerivedMiddle(IDerivedBase):
+            pass
+
+        class IDerivedUnrelated(interface.Interface):
+            pass
+
+        @interface.implementer(IDerivedMiddle, IDerivedUnrelated)
+        class Derived(object):
+            pass
+
+        return IDerivedBase, IDerivedMiddle, Derived
+
+    def _callFUT(self, *args, **kwargs):
+        from ..interfaces import find_most_derived_interface
+        return find_most_derived_interface(*args, **kwargs)
+
+    def test_find(self):
+        from zope.interface import Interface
+        IDerivedBase, IDerivedMiddle, Derived = self._makeClasses()
+        assert_that(self._callFUT(Derived(), IDerivedBase), is_(IDerivedMiddle))
+        assert_that(self._callFUT(Derived(), IDerivedMiddle), is_(IDerivedMiddle))
+
+        class IOther(Interface):
+            pass
+        assert_that(self._callFUT(Derived(), IOther), is_(IOther))
+        assert_that(self._callFUT(Derived(), IDerivedBase, possibilities=()),
+                    is_(IDerivedBase))
+
+    def test_cached_and_invalidated(self):
+        from zope.interface import implementedBy
+        from zope.interface import classImplements
+        IDerivedBase, IDerivedMiddle, Derived = self._makeClasses()
+        spec = implementedBy(Derived)
+        key = ('__nti_schema_most_derived_interface', IDerivedBase)
+
+        assert_that(self._callFUT(Derived(), IDerivedBase), is_(IDerivedMiddle))
+        assert_that(spec._v_attrs[key], is_(IDerivedMiddle))
+
+        # Changing what the class implements is noticed.
+        class IDerivedMost(IDerivedMiddle):
+            pass
+        classImplements(Derived, IDerivedMost)
+        assert_that(self._callFUT(Derived(), IDerivedBase), is_(IDerivedMost))
+
+        # As is changing the bases of an interface.
+        class IDerivedLeaf(IDerivedBase):
+            pass
+        IDerivedMost.__bases__ = (IDerivedLeaf,)
+        assert_that(self._callFUT(Derived(), IDerivedLeaf), is_(IDerivedMost))
+        assert_that(self._callFUT(Derived(), IDerivedMiddle), is_(IDerivedMiddle))
+
+    def test_directly_provides(self):
+        from zope.interface import alsoProvides
+        IDerivedBase, IDerivedMiddle, Derived = self._makeClasses()
+
+        class IDerivedInstance(IDerivedMiddle):
+            pass
+
+        derived = Derived()
+        alsoProvides(derived, IDerivedInstance)
+        assert_that(self._callFUT(derived, IDerivedBase), is_(IDerivedInstance))
+        assert_that(self._callFUT(Derived(), IDerivedBase), is_(IDerivedMiddle))
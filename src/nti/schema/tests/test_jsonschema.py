@@ -15,6 +15,7 @@ from zope.interface import Interface
 from zope.interface import Attribute
 
 from .. import jsonschema
+from . import SchemaLayer
 from ..field import DecodingValidTextLine
 from ..field import ListOrTuple
 from ..field import Dict
@@ -34,13 +35,18 @@ from ..field import MutableMapping
 
 
 from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import contains_string
 from hamcrest import has_entry
+from hamcrest import has_item
+from hamcrest import has_properties
 from hamcrest import is_
 from hamcrest import has_length
 from hamcrest import has_key
 from hamcrest import is_not
 from hamcrest import same_instance
 from hamcrest import none
+from hamcrest import raises
 does_not = is_not
 
 
@@ -249,3 +255,458 @@ class TestJsonSchemafier(unittest.TestCase):
         assert_that(schema['list_field'], has_entry('value_type', None))
         assert_that(schema['dict_field'], has_entry('value_type', None))
         assert_that(schema['dict_field'], has_entry('key_type', None))
+
+
+class TestSchemaCache(unittest.TestCase):
+
+    def _makeClass(self, base=jsonschema.JsonSchemafier):
+        class CachingSchemafier(base):
+            cache_schemas = True
+            schema_cache_statistics = jsonschema.SchemaCacheStatistics()
+        return CachingSchemafier
+
+    def _makeSchema(self):
+        from zope.schema import Object
+        from zope.schema import TextLine
+
+        class ICachedNested(Interface):
+            text = TextLine(title=u'Text')
+
+        class ICached(Interface):
+            field = Attribute("A field")
+            field.setTaggedValue(jsonschema.TAG_APPLICATION_INFO,
+                                 {'list_key': [42], 'set_key': {1}})
+            nested = Object(ICachedNested)
+
+        return ICached
+
+    def test_cached(self):
+        kind = self._makeClass()
+        stats = kind.schema_cache_statistics
+        ICached = self._makeSchema()
+
+        schema = kind(ICached).make_schema()
+        # The nested schema is made, and cached, too.
+        assert_that(stats, has_properties(hits=0, misses=2))
+        assert_that(schema, is_(jsonschema.JsonSchemafier(ICached).make_schema()))
+
+        again = kind(ICached).make_schema()
+        assert_that(stats, has_properties(hits=1, misses=2))
+        assert_that(again, is_(schema))
+
+        # Each result is a copy.
+        assert_that(again, is_not(same_instance(schema)))
+        app_info = schema['field']['application_info']
+        again_info = again['field']['application_info']
+        assert_that(again_info['list_key'], is_not(same_instance(app_info['list_key'])))
+        assert_that(again_info['set_key'], is_not(same_instance(app_info['set_key'])))
+        assert_that(again['nested']['schema'],
+                    is_not(same_instance(schema['nested']['schema'])))
+        schema['field']['name'] = 'changed'
+        assert_that(kind(ICached).make_schema()['field'], has_entry('name', 'field'))
+
+        assert_that(repr(stats), contains_string('hits=2 misses=2'))
+        stats.reset()
+        assert_that(stats, has_properties(hits=0, misses=0))
+
+    def test_not_cached_by_default(self):
+        ICached = self._makeSchema()
+        stats = jsonschema.JsonSchemafier.schema_cache_statistics
+        hits, misses = stats.hits, stats.misses
+        jsonschema.JsonSchemafier(ICached).make_schema()
+        jsonschema.JsonSchemafier(ICached).make_schema()
+        assert_that(stats, has_properties(hits=hits, misses=misses))
+
+    def test_keys(self):
+        kind = self._makeClass()
+        stats = kind.schema_cache_statistics
+        ICached = self._makeSchema()
+        kind(ICached).make_schema()
+        stats.reset()
+
+        readonly = kind(ICached, readonly_override=True).make_schema()
+        assert_that(readonly['field'], has_entry('readonly', True))
+        # Including the nested schema
+        assert_that(stats, has_properties(hits=0, misses=2))
+
+        # Subclasses have their own entries
+        subclass = self._makeClass(kind)
+        subclass(ICached).make_schema()
+        assert_that(subclass.schema_cache_statistics, has_properties(hits=0, misses=2))
+
+    def test_languages(self):
+        from zope.i18n.interfaces import IUserPreferredLanguages
+        from zope.interface import implementer
+
+        @implementer(IUserPreferredLanguages)
+        class Request(object):
+            def __init__(self, *languages):
+                self.languages = languages
+
+            def getPreferredLanguages(self):
+                return list(self.languages)
+
+        class ICached(Interface):
+            field = Attribute("A field")
+            field.setTaggedValue(jsonschema.TAG_APPLICATION_INFO, {'text': u'text'})
+
+        class LanguageSchemafier(jsonschema.JsonSchemafier):
+            def _translate(self, text):
+                return text + ' ' + self.get_context_languages()[0]
+
+        kind = self._makeClass(LanguageSchemafier)
+        stats = kind.schema_cache_statistics
+        for languages in (('en',), ('de', 'en'), ('en',)):
+            schema = kind(ICached, context=Request(*languages)).make_schema()
+            assert_that(schema['field']['application_info'],
+                        has_entry('text', 'text ' + languages[0]))
+        assert_that(stats, has_properties(hits=1, misses=2))
+
+        # Contexts that don't specify languages are all the same.
+        assert_that(kind(ICached, context=object()).get_context_languages(), is_(none()))
+        assert_that(kind(ICached).get_context_languages(), is_(none()))
+
+    def test_invalidated(self):
+        kind = self._makeClass()
+        stats = kind.schema_cache_statistics
+        ICached = self._makeSchema()
+        kind(ICached).make_schema()
+        ICached.changed(ICached)
+        kind(ICached).make_schema()
+        # The nested schema didn't change
+        assert_that(stats, has_properties(hits=1, misses=3))
+
+    def test_not_interface(self):
+        class IterSchemafier(jsonschema.JsonSchemafier):
+            def _iter_names_and_descriptions(self):
+                return self.schema
+
+        kind = self._makeClass(IterSchemafier)
+        field = Attribute("A field")
+        schema = kind(iter([('field', field)])).make_schema()
+        assert_that(schema, has_key('field'))
+        assert_that(kind.schema_cache_statistics, has_properties(hits=0, misses=0))
+
+
+class TestChoiceData(unittest.TestCase):
+
+    layer = SchemaLayer
+
+    def _vocabulary(self):
+        from zope.schema.vocabulary import SimpleTerm
+        from zope.schema.vocabulary import SimpleVocabulary
+        return SimpleVocabulary([SimpleTerm(1, 'one', u'One'),
+                                 SimpleTerm(2, 'two', u'Two')])
+
+    def test_values(self):
+        from zope.schema import Choice
+        choices, base_type = jsonschema.get_data_from_choice_field(
+            Choice(values=(u'a', u'b')))
+        assert_that(choices, is_([u'a', u'b']))
+        assert_that(base_type, is_('string'))
+
+        choices, base_type = jsonschema.get_data_from_choice_field(
+            Choice(values=(1, 2)), 'int')
+        assert_that(choices, is_(['1', '2']))
+        assert_that(base_type, is_('int'))
+
+        class IChoices(Interface):
+            field = Choice(values=(u'a', u'b'))
+
+        schema = jsonschema.JsonSchemafier(IChoices).make_schema()
+        assert_that(schema['field'], has_entry('choices', [u'a', u'b']))
+
+    def test_not_weakly_referenceable(self):
+        from zope.interface import implementer
+        from zope.schema import Choice
+        from zope.schema.interfaces import IVocabulary
+
+        terms = list(self._vocabulary())
+
+        @implementer(IVocabulary)
+        class Vocabulary(object):
+            __slots__ = ()
+
+            def __iter__(self):
+                return iter(terms)
+
+        field = Choice(vocabulary=self._vocabulary())
+        field.vocabulary = Vocabulary()
+        choices, _ = jsonschema.get_data_from_choice_field(field, cache=True)
+        assert_that(choices, has_length(2))
+        assert_that(jsonschema.get_data_from_choice_field(field, cache=True)[0],
+                    is_(choices))
+
+    def test_not_cached_by_default(self):
+        from zope.schema import Choice
+        from zope.schema.vocabulary import SimpleTerm
+        vocabulary = self._vocabulary()
+        field = Choice(vocabulary=vocabulary)
+        choices, _ = jsonschema.get_data_from_choice_field(field)
+        # The dictionaries are new and can be modified.
+        choices[0]['token'] = 'three'
+        assert_that(jsonschema.get_data_from_choice_field(field)[0][0],
+                    has_entry('token', 'one'))
+        assert_that(jsonschema._rendered_vocabularies,
+                    is_not(has_key(id(vocabulary))))
+
+        # Changes to the terms are seen.
+        vocabulary._terms.append(SimpleTerm(3, 'three', u'Three'))
+        assert_that(jsonschema.get_data_from_choice_field(field)[0],
+                    has_length(3))
+
+    def test_schemafier_cache_vocabularies(self):
+        from zope.schema import Choice
+        vocabulary = self._vocabulary()
+
+        class IChoices(Interface):
+            field = Choice(vocabulary=vocabulary)
+
+        class CachingJsonSchemafier(jsonschema.JsonSchemafier):
+            cache_vocabularies = True
+
+        schema = jsonschema.JsonSchemafier(IChoices).make_schema()
+        assert_that(schema['field']['choices'][0], is_(dict))
+        schema['field']['choices'][0]['token'] = 'three'
+
+        schema = CachingJsonSchemafier(IChoices).make_schema()
+        assert_that(schema['field']['choices'][0], has_entry('token', 'one'))
+        assert_that(jsonschema._rendered_vocabularies, has_key(id(vocabulary)))
+
+    def test_shared_and_read_only(self):
+        import copy
+        import pickle
+        from zope.schema import Choice
+        field = Choice(vocabulary=self._vocabulary())
+        choices, _ = jsonschema.get_data_from_choice_field(field, cache=True)
+        assert_that(choices, is_([{'token': 'one', 'value': 1, 'title': u'One'},
+                                  {'token': 'two', 'value': 2, 'title': u'Two'}]))
+        again, _ = jsonschema.get_data_from_choice_field(field, cache=True)
+        assert_that(again, is_not(same_instance(choices)))
+        assert_that(again[0], is_(same_instance(choices[0])))
+
+        choice = choices[0]
+        for func, args in ((choice.__setitem__, ('token', 'three')),
+                           (choice.__delitem__, ('token',)),
+                           (choice.update, ({},)),
+                           (choice.pop, ('token',)),
+                           (choice.clear, ())):
+            assert_that(calling(func).with_args(*args), raises(TypeError))
+        assert_that(copy.copy(choice), is_(same_instance(choice)))
+        assert_that(copy.deepcopy(choice), is_(same_instance(choice)))
+        assert_that(pickle.loads(pickle.dumps(choice)), is_(choice))
+
+    def test_named_vocabulary(self):
+        from zope import component
+        from zope.schema import Choice
+        from zope.schema.interfaces import IVocabularyFactory
+
+        vocabularies = [self._vocabulary()]
+        def factory(_context):
+            return vocabularies[-1]
+
+        gsm = component.getGlobalSiteManager()
+        gsm.registerUtility(factory, IVocabularyFactory, 'nti.schema.tests.Numbers')
+        try:
+            field = Choice(vocabulary='nti.schema.tests.Numbers')
+            choices, base_type = jsonschema.get_data_from_choice_field(field, cache=True)
+            assert_that(choices, has_length(2))
+            assert_that(base_type, is_('string'))
+            assert_that(jsonschema.get_data_from_choice_field(field, cache=True)[0][0],
+                        is_(same_instance(choices[0])))
+
+            # A new vocabulary is rendered again.
+            vocabularies.append(self._vocabulary())
+            again, _ = jsonschema.get_data_from_choice_field(field, cache=True)
+            assert_that(again, is_(choices))
+            assert_that(again[0], is_not(same_instance(choices[0])))
+
+            # And the old one is discarded.
+            key = id(vocabularies[0])
+            assert_that(jsonschema._rendered_vocabularies, has_key(key))
+            del vocabularies[0]
+            assert_that(jsonschema._rendered_vocabularies, is_not(has_key(key)))
+        finally:
+            gsm.unregisterUtility(factory, IVocabularyFactory, 'nti.schema.tests.Numbers')
+
+
+class TestTranslationCache(unittest.TestCase):
+
+    layer = SchemaLayer
+
+    domain_name = 'nti.schema.tests.translation_cache'
+
+    def setUp(self):
+        from zope import component
+        from zope.i18n.interfaces import ITranslationDomain
+        from zope.interface import implementer
+
+        @implementer(ITranslationDomain)
+        class Domain(object):
+            calls = 0
+            def translate(self, msgid, mapping=None, context=None,
+                          target_language=None, default=None, *_args):
+                self.calls += 1
+                language = context.getPreferredLanguages()[0]
+                return u'%s %s %s' % (default, language, sorted((mapping or {}).items()))
+
+        self.domain = Domain()
+        component.getGlobalSiteManager().registerUtility(
+            self.domain, ITranslationDomain, self.domain_name)
+
+    def tearDown(self):
+        from zope import component
+        from zope.i18n.interfaces import ITranslationDomain
+        component.getGlobalSiteManager().unregisterUtility(
+            self.domain, ITranslationDomain, self.domain_name)
+
+    def _makeContext(self, *languages):
+        from zope.i18n.interfaces import IUserPreferredLanguages
+        from zope.interface import implementer
+
+        @implementer(IUserPreferredLanguages)
+        class Request(object):
+            def getPreferredLanguages(self):
+                return list(languages)
+
+        return Request()
+
+    def _makeClass(self, cache):
+        class CachingSchemafier(jsonschema.JsonSchemafier):
+            translation_cache = cache
+        return CachingSchemafier
+
+    def test_cached(self):
+        from zope.i18nmessageid import Message
+        cache = jsonschema.TranslationCache()
+        kind = self._makeClass(cache)
+        message = Message(u'msg', self.domain_name, u'Default')
+        en = kind(Interface, context=self._makeContext('en'))
+        de = kind(Interface, context=self._makeContext('de'))
+
+        assert_that(en._translate(message), is_(u'Default en []'))
+        assert_that(kind(Interface, context=self._makeContext('en'))._translate(message),
+                    is_(u'Default en []'))
+        assert_that(de._translate(message), is_(u'Default de []'))
+        assert_that(self.domain.calls, is_(2))
+        assert_that(cache, has_properties(hits=1, misses=2))
+
+        # Everything about the message is part of the key.
+        for other in (Message(u'msg', self.domain_name, u'Other'),
+                      Message(u'msg', self.domain_name, u'Default', {'n': 1}),
+                      Message(u'msg', self.domain_name, u'Default', {'n': 2}),
+                      Message(u'msg', 'other.domain', u'Default'),
+                      u'msg'):
+            en._translate(other)
+        assert_that(en._translate(Message(u'msg', self.domain_name, u'Default', {'n': 1})),
+                    is_(u"Default en [('n', 1)]"))
+        assert_that(cache, has_properties(hits=2, misses=7))
+        assert_that(cache, has_length(7))
+        assert_that(repr(cache), contains_string('size=7 maxsize=1000 hits=2 misses=7'))
+
+        # Changing the context changes the languages.
+        en.context = self._makeContext('de')
+        assert_that(en._translate(message), is_(u'Default de []'))
+
+        # Not cached by default
+        self.domain.calls = 0
+        jsonschema.JsonSchemafier(Interface, context=self._makeContext('en'))._translate(message)
+        jsonschema.JsonSchemafier(Interface, context=self._makeContext('en'))._translate(message)
+        assert_that(self.domain.calls, is_(2))
+
+        cache.clear()
+        assert_that(cache, has_length(0))
+        assert_that(cache, has_properties(hits=0, misses=0))
+
+    def test_unhashable_mapping(self):
+        from zope.i18nmessageid import Message
+        cache = jsonschema.TranslationCache()
+        kind = self._makeClass(cache)
+        message = Message(u'msg', self.domain_name, u'Default', {'n': []})
+        schemafier = kind(Interface, context=self._makeContext('en'))
+        assert_that(schemafier._translate(message), is_(u"Default en [('n', [])]"))
+        assert_that(schemafier._translate(message), is_(u"Default en [('n', [])]"))
+        assert_that(cache, has_length(0))
+        assert_that(self.domain.calls, is_(2))
+
+    def test_least_recently_used_discarded(self):
+        cache = jsonschema.TranslationCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert_that(cache.get('a'), is_(1))
+        cache.set('c', 3)
+        assert_that(cache.get('b'), is_(none()))
+        assert_that(cache.get('a'), is_(1))
+        assert_that(cache.get('c'), is_(3))
+        cache.set('c', 4)
+        assert_that(cache, has_length(2))
+        assert_that(cache.get('c'), is_(4))
+
+    def test_make_schema(self):
+        from zope.i18nmessageid import MessageFactory
+        from zope.schema import TextLine
+        _ = MessageFactory(self.domain_name)
+
+        class ITranslated(Interface):
+            first = TextLine(title=_(u'title', default=u'Title'))
+            second = TextLine(title=_(u'title', default=u'Title'))
+
+        cache = jsonschema.TranslationCache()
+        kind = self._makeClass(cache)
+        schema = kind(ITranslated, context=self._makeContext('en')).make_schema()
+        assert_that(schema['first'], has_entry('title', u'Title en []'))
+        assert_that(schema['second'], has_entry('title', u'Title en []'))
+        assert_that(self.domain.calls, is_(1))
+
+
+class TestQueryableFieldFields(unittest.TestCase):
+
+    def _makeField(self):
+        from zope.interface import implementer
+        from zope.schema import Field
+        from zope.schema import TextLine
+        from zope.schema.interfaces import IField
+
+        class IExtraField(IField):
+            extra = TextLine(title=u'Extra')
+            not_a_field = Attribute("Not a field")
+
+        @implementer(IExtraField)
+        class ExtraField(Field):
+            extra = u'extra'
+            not_a_field = u'not a field'
+
+        return IExtraField, ExtraField
+
+    def test_make_schema(self):
+        IExtraField, ExtraField = self._makeField()
+
+        class IHasExtra(Interface):
+            first = ExtraField(title=u'First')
+            second = ExtraField(title=u'Second')
+
+        schema = jsonschema.JsonSchemafier(IHasExtra).make_schema()
+        for name in 'first', 'second':
+            assert_that(schema[name], has_entry('extra', u'extra'))
+            assert_that(schema[name], is_not(has_key('not_a_field')))
+            assert_that(schema[name], is_not(has_key('missing_value')))
+
+        excluded = ('missing_value', 'default', 'validate_invariants')
+        pairs = jsonschema._queryable_field_fields(IExtraField, excluded)
+        names = [name for name, _ in pairs]
+        assert_that(names, has_item('extra'))
+        assert_that(names, has_item('title'))
+        assert_that(names, is_not(has_item('not_a_field')))
+        assert_that(names, is_not(has_item('missing_value')))
+
+    def test_cached_until_changed(self):
+        IExtraField, _ = self._makeField()
+        pairs = jsonschema._queryable_field_fields(IExtraField, ())
+        assert_that(jsonschema._queryable_field_fields(IExtraField, ()),
+                    is_(same_instance(pairs)))
+        assert_that(jsonschema._queryable_field_fields(IExtraField, ('extra',)),
+                    has_length(len(pairs) - 1))
+
+        IExtraField.changed(IExtraField)
+        assert_that(jsonschema._queryable_field_fields(IExtraField, ()),
+                    is_not(same_instance(pairs)))
@@ -73,6 +73,14 @@ class TestSchemaConfigured(unittest.TestCase):
         a = A(field=1)
         assert_that(a, has_property('field', 1))
 
+    def test_direct_instances_have_dict(self):
+        import weakref
+        for kind in SchemaConfigured, PermissiveSchemaConfigured:
+            inst = kind()
+            inst.x = 1
+            assert_that(inst, has_property('__dict__', {'x': 1}))
+            assert_that(weakref.ref(inst)(), is_(inst))
+
     def test_changed(self):
         class IA(interface.Interface):
             field = Number()
@@ -87,6 +95,85 @@ class TestSchemaConfigured(unittest.TestCase):
         A.sc_changed()
         self.assertNotIn('__SchemaConfigured_elide_fieldproperty', A.__dict__)
 
+    def test_elided_cache_tracks_schema(self):
+        from nti.schema.fieldproperty import createDirectFieldProperties
+
+        class IBase(interface.Interface):
+            pass
+
+        class IA(IBase):
+            field = Number(required=False, default=1)
+            other = Number(required=False, default=2)
+
+        @interface.implementer(IA)
+        class A(SchemaConfigured):
+            createDirectFieldProperties(IA, omit=('other',))
+
+        a = A()
+        schema, items = A.__dict__['__SchemaConfigured_elide_fieldproperty']
+        self.assertIs(schema, schemadict(interface.providedBy(a)))
+        self.assertEqual(items, (('other', IA['other']),))
+        self.assertEqual(a.__dict__, {'other': 2})
+
+        class IB(interface.Interface):
+            third = Number(required=False, default=3)
+        IA.__bases__ = (IBase, IB)
+
+        a = A()
+        self.assertEqual(a.__dict__, {'other': 2, 'third': 3})
+        _, items = A.__dict__['__SchemaConfigured_elide_fieldproperty']
+        self.assertEqual(sorted(items),
+                         [('other', IA['other']), ('third', IB['third'])])
+
+    def test_elided_cache_iterable_schema(self):
+        class IA(interface.Interface):
+            field = Number(required=False, default=1)
+
+        class A(SchemaConfigured):
+            SC_SCHEMAS = (IA,)
+
+        A()
+        _, items = A.__dict__['__SchemaConfigured_elide_fieldproperty']
+        a = A()
+        self.assertIs(A.__dict__['__SchemaConfigured_elide_fieldproperty'][1], items)
+        assert_that(a, has_property('field', 1))
+
+    def test_elided_cache_equal_schema(self):
+        class IA(interface.Interface):
+            field = Number(required=False, default=1)
+
+        @interface.implementer(IA)
+        class A(SchemaConfigured):
+            pass
+
+        A()
+        schema, items = A.__dict__['__SchemaConfigured_elide_fieldproperty']
+        # A new, but equal, schemadict keeps the items.
+        IA.changed(IA)
+        a = A()
+        new_schema, new_items = A.__dict__['__SchemaConfigured_elide_fieldproperty']
+        self.assertIsNot(new_schema, schema)
+        self.assertIs(new_items, items)
+        assert_that(a, has_property('field', 1))
+
+    def test_no_optimize_field_property(self):
+        from nti.schema.fieldproperty import createDirectFieldProperties
+        class IA(interface.Interface):
+            field = Number(required=False, default=1)
+
+        @interface.implementer(IA)
+        class A(SchemaConfigured):
+            SC_OPTIMIZE_FIELD_PROPERTY = False
+            createDirectFieldProperties(IA)
+
+        class B(A):
+            SC_COMPILE_INIT = True
+
+        for kind in A, B:
+            a = kind()
+            assert_that(a, has_property('field', 1))
+            self.assertNotIn('__SchemaConfigured_elide_fieldproperty', kind.__dict__)
+
     def test_readonly(self):
         from nti.schema.fieldproperty import createDirectFieldProperties
         class IA(interface.Interface):
@@ -119,6 +206,109 @@ class TestSchemaConfigured(unittest.TestCase):
         assert_that(calling(A), raises(ValueError, "bad field"))
 
 
+class TestSchemaConfiguredCompiledInit(unittest.TestCase):
+
+    _KEY = '__SchemaConfigured_compiled_init'
+
+    def _makeClass(self):
+        from nti.schema.fieldproperty import createDirectFieldProperties
+
+        class IBase(interface.Interface):
+            pass
+
+        class IA(IBase):
+            field = Number(required=False, default=1)
+            listy = interface.Attribute("Not a field")
+
+        class IB(IA):
+            other = Number(required=False, default=2)
+            factory = Number(required=False, defaultFactory=lambda: 3)
+
+        @interface.implementer(IB)
+        class A(SchemaConfigured):
+            SC_COMPILE_INIT = True
+            createDirectFieldProperties(IB, omit=('factory',))
+
+        return IA, IB, A
+
+    def test_defaults_and_kwargs(self):
+        _, _, A = self._makeClass()
+        a = A()
+        assert_that(a, has_property('field', 1))
+        assert_that(a, has_property('other', 2))
+        assert_that(a, has_property('factory', 3))
+        self.assertNotIn('other', a.__dict__)
+        self.assertIn('factory', a.__dict__)
+
+        a = A(field=4, other=5, factory=6)
+        assert_that(a, has_property('field', 4))
+        assert_that(a, has_property('other', 5))
+        assert_that(a, has_property('factory', 6))
+
+        assert_that(calling(A).with_args(listy=1),
+                    raises(TypeError, 'non schema keyword'))
+
+    def test_cached_and_invalidated(self):
+        IA, _, A = self._makeClass()
+        self.assertNotIn(self._KEY, A.__dict__)
+        A()
+        compiled = A.__dict__[self._KEY]
+        A()
+        self.assertIs(A.__dict__[self._KEY], compiled)
+
+        A.sc_changed()
+        self.assertNotIn(self._KEY, A.__dict__)
+        A()
+        self.assertIsNot(A.__dict__[self._KEY], compiled)
+        compiled = A.__dict__[self._KEY]
+
+        # Changing the interfaces produces a new schemadict,
+        # and hence a new function.
+        class IC(interface.Interface):
+            third = Number(required=False, default=7)
+        IA.__bases__ = (IA.__bases__[0], IC)
+        a = A()
+        self.assertIsNot(A.__dict__[self._KEY], compiled)
+        assert_that(a, has_property('third', 7))
+
+    def test_equal_schema(self):
+        IA, _, A = self._makeClass()
+        A()
+        schema, init = A.__dict__[self._KEY]
+        IA.changed(IA)
+        A()
+        new_schema, new_init = A.__dict__[self._KEY]
+        self.assertIsNot(new_schema, schema)
+        self.assertIs(new_init, init)
+
+    def test_sc_schemas_iterable(self):
+        class IA(interface.Interface):
+            field = Number(required=False, default=1)
+
+        class A(SchemaConfigured):
+            SC_COMPILE_INIT = True
+            SC_SCHEMAS = (IA,)
+
+        A()
+        compiled = A.__dict__[self._KEY]
+        a = A()
+        # Equal, though not identical, schemas reuse the function
+        self.assertIs(A.__dict__[self._KEY][1], compiled[1])
+        assert_that(a, has_property('field', 1))
+
+    def test_permissive(self):
+        class IA(interface.Interface):
+            field = Number()
+
+        @interface.implementer(IA)
+        class A(PermissiveSchemaConfigured):
+            SC_COMPILE_INIT = True
+
+        a = A(field=1, thing='abc')
+        assert_that(a, has_property('field', 1))
+        assert_that(A(), has_property('field', None))
+
+
 class TestConfigured(unittest.TestCase):
 
     layer = SchemaLayer
@@ -160,11 +350,37 @@ class TestSchemaitems(unittest.TestCase):
 
         self.assertEqual(
             items,
-            [('field1', IA['field1']),
+            (('field1', IA['field1']),
              ('field2', IA['field2']),
-             ('field3', IB['field3'])]
+             ('field3', IB['field3']))
         )
 
+    def test_caching(self):
+        class IA(interface.Interface):
+            field2 = Number()
+            field1 = Number()
+
+        items = schemaitems(IA)
+        self.assertEqual(items, (('field2', IA['field2']),
+                                 ('field1', IA['field1'])))
+        self.assertIs(items, schemaitems(IA))
+        self.assertIs(items, IA._v_attrs['__nti_schema_schemaitems'])
+
+        IA.changed(IA)
+        items2 = schemaitems(IA)
+        self.assertIsNot(items, items2)
+        self.assertEqual(items, items2)
+
+    def test_custom_key(self):
+        class IA(interface.Interface):
+            field2 = Number()
+            field1 = Number()
+
+        items = schemaitems(IA, lambda item: item[0])
+        self.assertEqual(items, [('field1', IA['field1']),
+                                 ('field2', IA['field2'])])
+        self.assertNotIn('__nti_schema_schemaitems', IA._v_attrs)
+
 class TestSchemadict(unittest.TestCase):
 
     def test_single_interface(self):
@@ -270,6 +486,73 @@ class TestSchemadict(unittest.TestCase):
             ])
         ))
 
-        # This can't be cached.
-        items2 = schemadict(schema)
+        # Lists and tuples are cached, and are interchangeable.
+        self.assertIs(items, schemadict(schema))
+        self.assertIs(items, schemadict(tuple(schema)))
+
+        # But other iterables can't be cached.
+        items2 = schemadict(iter(schema))
         self.assertIsNot(items, items2)
+        self.assertEqual(items, items2)
+
+    def test_iterable_caching(self):
+        class IBase(interface.Interface):
+            pass
+
+        class IA(IBase):
+            field1 = Number()
+
+        class IB(interface.Interface):
+            field2 = Number()
+
+        spec = (IA, IB)
+        schema = schemadict(spec)
+        self.assertIs(schema, schemadict(spec))
+        self.assertIs(schemaitems(spec), schemaitems(spec))
+
+        # Changing any member, directly or through its bases,
+        # invalidates the cache.
+        IB.changed(IB)
+        schema2 = schemadict(spec)
+        self.assertIsNot(schema, schema2)
+        self.assertEqual(schema, schema2)
+
+        class IC(interface.Interface):
+            field3 = Number()
+        IA.__bases__ = (IBase, IC)
+        schema3 = schemadict(spec)
+        self.assertIsNot(schema2, schema3)
+        self.assertEqual(schema2, schema3)
+
+    def test_iterable_caching_bounded(self):
+        from .. import schema as schema_module
+        class IA(interface.Interface):
+            field1 = Number()
+
+        class IB(interface.Interface):
+            field2 = Number()
+
+        orig_size = schema_module.SEQUENCE_SPEC_CACHE_SIZE
+        schema_module.SEQUENCE_SPEC_CACHE_SIZE = 1
+        try:
+            schema = schemadict((IA,))
+            self.assertIs(schema, schemadict((IA,)))
+            schemadict((IA, IB))
+            self.assertIsNot(schema, schemadict((IA,)))
+        finally:
+            schema_module.SEQUENCE_SPEC_CACHE_SIZE = orig_size
+
+    def test_iterable_not_specifications(self):
+        class IA(interface.Interface):
+            field1 = Number()
+
+        class NotASpec(object):
+            def namesAndDescriptions(self):
+                return [('field2', IA['field1'])]
+
+        self.assertEqual(schemadict(()), {})
+
+        for spec in [NotASpec()], [IA, NotASpec()]:
+            items = schemadict(spec)
+            self.assertIn('field2', items)
+            self.assertIsNot(items, schemadict(spec))
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Tests for validation.py
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import unittest
+
+from zope import interface
+from zope import schema
+from zope.schema.interfaces import SchemaNotCorrectlyImplemented
+
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import contains_string
+from hamcrest import has_length
+from hamcrest import is_
+from hamcrest import is_not
+from hamcrest import raises
+from hamcrest import same_instance
+
+from ..field import Bool
+from ..field import Float
+from ..field import Int
+from ..field import Number
+from ..field import Object
+from ..field import ValidChoice
+from ..field import ValidTextLine
+from ..validation import SchemaValidator
+from ..validation import validate_many
+
+__docformat__ = "restructuredtext en"
+
+# pylint:disable=protected-access
+
+
+class TestValidateMany(unittest.TestCase):
+
+    def _check(self, field, values):
+        # The results are the same as validating one at a time
+        expected = []
+        for i, value in enumerate(values):
+            try:
+                field.validate(value)
+            except schema.ValidationError as e:
+                expected.append((i, type(e), e.args))
+
+        result = validate_many(field, iter(values))
+        assert_that([(i, type(e), e.args) for i, e in result],
+                    is_(expected))
+        return result
+
+    def test_int(self):
+        for field in (Int(), schema.Int(), Int(min=0, max=10),
+                      Int(required=False), Int(missing_value=-1, default=-1),
+                      Int(constraint=lambda v: v != 5)):
+            self._check(field, [0, 5, 10, 11, -1, None, 1.0, True, u'1', 2 ** 70])
+
+        result = self._check(Int(min=0, max=10), [0, 5, 11, u'1'])
+        assert_that([i for i, _ in result], is_([2, 3]))
+
+    def test_float(self):
+        for field in (Float(), schema.Float(), Float(min=0.0, max=1.0), Number()):
+            self._check(field, [0.0, 0.5, 1.0, 1.5, -0.5, 1, None, float('nan')])
+
+    def test_text_line(self):
+        for field in (ValidTextLine(), schema.TextLine(),
+                      ValidTextLine(min_length=1, max_length=3),
+                      ValidTextLine(required=False, min_length=None)):
+            self._check(field, [u'', u'a', u'abc', u'abcd', u'a\nb', u'a\rb',
+                                b'abc', None, 1])
+
+    def test_bool(self):
+        self._check(schema.Bool(), [True, False, 0, 1, None, u'True'])
+
+    def test_other(self):
+        self._check(schema.Choice(values=(1, 2)), [1, 2, 3])
+        self._check(schema.Text(), [u'a\nb', b'a'])
+
+    def test_fast_path_selection(self):
+        from ..validation import _fast_path_for
+        assert_that(_fast_path_for(Int()), is_not(None))
+        assert_that(_fast_path_for(schema.Bool()), is_not(None))
+        assert_that(_fast_path_for(Int(missing_value=-1, default=-1)), is_(None))
+        assert_that(_fast_path_for(Int(constraint=bool)), is_(None))
+        assert_that(_fast_path_for(Number()), is_(None))
+
+    def test_method(self):
+        result = ValidTextLine(max_length=1).validate_many([u'a', u'ab'])
+        assert_that([i for i, _ in result], is_([1]))
+
+
+class IValidatorBase(interface.Interface):
+    count = Int(min=0, max=100)
+    ratio = Float(required=False)
+
+
+class IValidated(IValidatorBase):
+    name = ValidTextLine(min_length=1, max_length=5)
+    flag = Bool()
+    kind = ValidChoice(values=(u'a', u'b'))
+    other = Object(IValidatorBase, required=False)
+    plain = schema.Int(constraint=lambda v: v != 3)
+
+    def method(): # pylint:disable=no-method-argument
+        "Not validated"
+
+
+class IValidatedWithInvariant(IValidated):
+
+    @interface.invariant
+    def count_under_ten(obj): # pylint:disable=no-self-argument
+        if obj.count >= 10:
+            raise interface.Invalid("count too large")
+
+
+class IValidatedNode(interface.Interface):
+    size = Int()
+    parent = Object(interface.Interface, required=False)
+    child = Object(interface.Interface, required=False)
+
+IValidatedNode['parent'].schema = IValidatedNode
+IValidatedNode['child'].schema = IValidatedNode
+
+
+@interface.implementer(IValidatedWithInvariant)
+class Validated(object):
+    count = 1
+    ratio = None
+    name = u'abc'
+    flag = True
+    kind = u'a'
+    other = None
+    plain = 1
+
+
+@interface.implementer(IValidatedNode)
+class ValidatedNode(object):
+    parent = None
+    child = None
+
+    def __init__(self, size=1):
+        self.size = size
+
+
+class TestSchemaValidator(unittest.TestCase):
+
+    def _check(self, iface, obj, expected_names):
+        expected = schema.getValidationErrors(iface, obj)
+        result = SchemaValidator(iface).getValidationErrors(obj)
+        # Exceptions in the args don't compare equal.
+        assert_that([(name, type(e), repr(e.args)) for name, e in result],
+                    is_([(name, type(e), repr(e.args)) for name, e in expected]))
+        assert_that([name for name, _ in result], is_(expected_names))
+        return result
+
+    def test_valid(self):
+        self._check(IValidated, Validated(), [])
+        self._check(IValidatedWithInvariant, Validated(), [])
+        SchemaValidator(IValidatedWithInvariant).validate(Validated())
+
+    def test_interface(self):
+        self._check(interface.Interface, object(), [])
+
+    def test_field_errors(self):
+        obj = Validated()
+        obj.count = -1
+        obj.ratio = u'1.0'
+        obj.name = u'abcdef'
+        obj.flag = None
+        obj.kind = u'c'
+        obj.other = 42
+        obj.plain = 3
+        # Fields of the derived interface come first.
+        self._check(IValidatedWithInvariant, obj,
+                    ['name', 'flag', 'kind', 'other', 'plain', 'count', 'ratio'])
+
+        obj.count = 1
+        obj.name = u'a\nb'
+        self._check(IValidated, obj,
+                    ['name', 'flag', 'kind', 'other', 'plain', 'ratio'])
+
+        obj.count = 101
+        obj.name = u''
+        self._check(IValidated, obj,
+                    ['name', 'flag', 'kind', 'other', 'plain', 'count', 'ratio'])
+
+    def test_missing_attribute(self):
+        obj = type('Partial', (object,), {'name': u'a'})()
+        result = self._check(IValidated, obj,
+                             ['flag', 'kind', 'other', 'plain', 'count', 'ratio'])
+        assert_that(result[-1][1].field, is_(same_instance(IValidated['ratio'])))
+
+    def test_invariants(self):
+        obj = Validated()
+        obj.count = 10
+        self._check(IValidatedWithInvariant, obj, [None])
+        validator = SchemaValidator(IValidatedWithInvariant)
+        assert_that(validator.getValidationErrors(obj, validate_invariants=False),
+                    is_([]))
+        # Invariants aren't checked when there are field errors.
+        obj.flag = None
+        self._check(IValidatedWithInvariant, obj, ['flag'])
+
+    def test_validate_raises(self):
+        obj = Validated()
+        obj.count = 10
+        validator = SchemaValidator(IValidatedWithInvariant)
+        assert_that(calling(validator.validate).with_args(obj),
+                    raises(SchemaNotCorrectlyImplemented))
+        try:
+            validator.validate(obj)
+        except SchemaNotCorrectlyImplemented as e:
+            assert_that(e.schema_errors, is_({}))
+            assert_that(e.invariant_errors, has_length(1))
+            assert_that(e.value, is_(same_instance(obj)))
+
+        obj.count = -1
+        try:
+            validator.validate(obj)
+        except SchemaNotCorrectlyImplemented as e:
+            assert_that(list(e.schema_errors), is_(['count']))
+            assert_that(e.errors, has_length(1))
+            assert_that(e.invariant_errors, is_([]))
+
+    def test_cycle(self):
+        parent = ValidatedNode()
+        child = ValidatedNode(u'not an int')
+        parent.child = child
+        child.parent = parent
+        self._check(IValidatedNode, parent, ['child'])
+        self._check(IValidatedNode, child, ['size'])
+
+    def test_shares_zope_schema_cycle_guard(self):
+        # We rely on the (private) shape of this function; if this
+        # fails, zope.schema changed and cycles are no longer
+        # shared with Object fields.
+        from zope.schema._bootstrapfields import get_schema_validation_errors
+        from ..validation import _OBJECTS_BEING_VALIDATED
+        assert_that(_OBJECTS_BEING_VALIDATED,
+                    same_instance(get_schema_validation_errors.__defaults__[0]))
+
+    def test_cycle_guard_fallback(self):
+        from ..validation import _ObjectsBeingValidated
+        from ..validation import _find_objects_being_validated
+
+        def no_defaults(schema, value):
+            "Does nothing"
+
+        def other_defaults(schema, value, other=None):
+            "Does nothing"
+
+        for func in None, no_defaults, other_defaults:
+            guard = _find_objects_being_validated(func)
+            assert_that(guard, is_(_ObjectsBeingValidated))
+            assert_that(guard.ids_being_validated, is_(set()))
+
+    def test_plan_cached_until_changed(self):
+        class IValidatorCached(interface.Interface):
+            count = Int()
+
+        validator = SchemaValidator(IValidatorCached)
+        plan = validator._validate_fields()
+        assert_that(SchemaValidator(IValidatorCached)._validate_fields(),
+                    is_(same_instance(plan)))
+        IValidatorCached.changed(IValidatorCached)
+        assert_that(validator._validate_fields(), is_not(same_instance(plan)))
+
+    def test_repr(self):
+        assert_that(repr(SchemaValidator(IValidated)),
+                    contains_string('IValidated'))
@@ -14,13 +14,18 @@ from nti.schema.jsonschema import JsonSchemafier
 from . import SchemaLayer
 
 from hamcrest import assert_that
+from hamcrest import calling
 from hamcrest import has_entry
 from hamcrest import has_item
+from hamcrest import has_properties
 from hamcrest import has_property
 from hamcrest import is_
 from hamcrest import is_in
 from hamcrest import is_not
+from hamcrest import none
 from hamcrest import not_none
+from hamcrest import raises
+from hamcrest import same_instance
 
 # disable: accessing protected members, too many methods
 # pylint: disable=W0212,R0904,inherit-non-class
@@ -54,6 +59,138 @@ class TestConfiguredVocabulary(unittest.TestCase):
         schema = JsonSchemafier(IA).make_schema()
         assert_that(schema, has_entry('choice', has_entry('choices', has_item(ext))))
 
+class TestCountryTerm(unittest.TestCase):
+
+    def _makeOne(self, *args, **kwargs):
+        from nti.schema.vocabulary import CountryTerm
+        return CountryTerm(*args, **kwargs)
+
+    def test_provides(self):
+        from zope.interface.verify import verifyObject
+        from zope.schema.interfaces import ITitledTokenizedTerm
+        term = self._makeOne(u'Nowhere', 'xx', u'Nowhere', flag=u'xx.gif')
+        assert_that(verifyObject(ITitledTokenizedTerm, term), is_(True))
+        assert_that(term, does_not(has_property('__dict__')))
+
+    def test_from_item(self):
+        from nti.schema.vocabulary import CountryTerm
+        term = CountryTerm.fromItem(('xx', {'name': u'Nowhere', 'flag': u'xx.gif'}))
+        assert_that(term, has_properties(value=u'Nowhere', token='xx',
+                                         title=u'Nowhere', flag=u'xx.gif'))
+
+    def test_tokens(self):
+        assert_that(self._makeOne(1).token, is_('1'))
+        assert_that(self._makeOne(u'Nowhere').token, is_('Nowhere'))
+        assert_that(self._makeOne(u'\xe9').token, is_('\\xe9'))
+        assert_that(self._makeOne(u'x', b'xx').token, is_('xx'))
+        # Like SimpleTerm, there is no default title
+        assert_that(self._makeOne(u'Nowhere').title, is_(none()))
+
+    def test_choice_data_like_simple_term(self):
+        from zope.schema.vocabulary import SimpleTerm
+        from zope.schema.vocabulary import SimpleVocabulary
+        from nti.schema.field import Choice
+        from nti.schema.jsonschema import get_data_from_choice_field
+
+        def choices(term):
+            field = Choice(vocabulary=SimpleVocabulary([term]))
+            return get_data_from_choice_field(field)[0]
+
+        # Without a title, both render as the bare token.
+        assert_that(choices(self._makeOne(u'Nowhere', 'xx')),
+                    is_(choices(SimpleTerm(u'Nowhere', 'xx'))))
+        assert_that(choices(self._makeOne(u'Nowhere', 'xx')), is_(['xx']))
+
+    def test_external_cached(self):
+        term = self._makeOne(u'Nowhere', 'xx', u'Nowhere', flag=u'xx.gif')
+        ext = term.toExternalObject()
+        assert_that(ext, is_({'token': 'xx', 'title': u'Nowhere',
+                              'value': u'Nowhere', 'flag': u'xx.gif'}))
+        assert_that(term.toExternalObject(), is_(same_instance(ext)))
+        assert_that(calling(ext.__setitem__).with_args('flag', None),
+                    raises(TypeError))
+
+    def test_eq_hash(self):
+        term = self._makeOne(u'Nowhere', 'xx', u'Nowhere', flag=u'xx.gif')
+        same = self._makeOne(u'Nowhere', 'xx', u'Nowhere')
+        other = self._makeOne(u'Somewhere', 'yy', u'Somewhere')
+        assert_that(term, is_(term))
+        assert_that(term, is_(same))
+        assert_that(hash(term), is_(hash(same)))
+        assert_that(term, is_not(other))
+        assert_that(term != other, is_(True))
+        assert_that(term, is_not(u'Nowhere'))
+
+    def test_not_simple_term(self):
+        from zope.schema.vocabulary import SimpleTerm
+        term = self._makeOne(u'Nowhere', 'xx', u'Nowhere')
+        assert_that(term, is_not(SimpleTerm(u'Nowhere', 'xx', u'Nowhere')))
+        assert_that(calling(setattr).with_args(term, 'extra', 1),
+                    raises(AttributeError))
+
+
+class TestCountryVocabularyFactory(unittest.TestCase):
+
+    layer = SchemaLayer
+
+    def _callFUT(self, context=None):
+        from nti.schema.vocabulary import CountryVocabularyFactory
+        return CountryVocabularyFactory(context)
+
+    def _makeCountries(self, slots=False):
+        from zope.interface import implementer
+        from nti.i18n.locales.interfaces import ICountryAvailability
+
+        @implementer(ICountryAvailability)
+        class Countries(object):
+            if slots:
+                __slots__ = ()
+
+            def getCountries(self):
+                return {'xx': {'name': u'Nowhere', 'flag': u'xx.gif'}}
+
+        return Countries()
+
+    def _registered(self, utility):
+        from contextlib import contextmanager
+        from zope import component
+        from nti.i18n.locales.interfaces import ICountryAvailability
+
+        @contextmanager
+        def registered():
+            gsm = component.getGlobalSiteManager()
+            original = gsm.getUtility(ICountryAvailability)
+            gsm.registerUtility(utility, ICountryAvailability)
+            try:
+                yield
+            finally:
+                gsm.registerUtility(original, ICountryAvailability)
+
+        return registered()
+
+    def test_built_once(self):
+        vocabulary = self._callFUT()
+        assert_that('us', is_in(vocabulary))
+        assert_that(self._callFUT(object()), is_(same_instance(vocabulary)))
+
+    def test_keyed_on_utility(self):
+        vocabulary = self._callFUT()
+        with self._registered(self._makeCountries()):
+            replaced = self._callFUT()
+            assert_that('xx', is_in(replaced))
+            assert_that('us', is_not(is_in(replaced)))
+            assert_that(self._callFUT(), is_(same_instance(replaced)))
+        assert_that(self._callFUT(), is_(same_instance(vocabulary)))
+
+    def test_not_weakly_referenceable(self):
+        with self._registered(self._makeCountries(slots=True)):
+            vocabulary = self._callFUT()
+            assert_that('xx', is_in(vocabulary))
+            again = self._callFUT()
+            assert_that(again, is_not(same_instance(vocabulary)))
+            assert_that(again, is_(vocabulary))
+
+
 def test_suite():
     import doctest
     suite = unittest.defaultTestLoader.loadTestsFromName(__name__)
@@ -0,0 +1,376 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Validating many values at once, and validating objects against
+their schema.
+
+.. versionadded:: 1.16.0
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+import threading
+
+import six
+from six import text_type
+from zope import schema
+from zope.interface import Interface
+from zope.interface import Invalid
+from zope.interface.interfaces import IMethod
+from zope.schema import interfaces as sch_interfaces
+try:
+    from zope.schema._bootstrapfields import get_schema_validation_errors
+except ImportError: # pragma: no cover
+    get_schema_validation_errors = None
+
+from nti.schema import field as nti_field
+from nti.schema.schema import _spec_cache
+
+__docformat__ = "restructuredtext en"
+
+__all__ = [
+    'SchemaValidator',
+    'validate_many',
+]
+
+
+def _validate_each(field, values, errors):
+    validate = field.validate
+    for index, value in enumerate(values):
+        try:
+            validate(value)
+        except sch_interfaces.ValidationError as e:
+            errors.append((index, e))
+
+# The fast paths below only decide that values are certainly valid;
+# everything else is passed to ``field.validate()``, so the
+# errors are exactly the ones it would raise. They duplicate the
+# checks made by the ``_validate`` method of these exact classes,
+# in any order.
+
+def _validate_many_orderable(field, values, errors):
+    types = field._type # pylint:disable=protected-access
+    if not isinstance(types, tuple):
+        types = (types,)
+    low = field.min
+    high = field.max
+    validate = field.validate
+    for index, value in enumerate(values):
+        if (type(value) in types
+                and (low is None or value >= low)
+                and (high is None or value <= high)):
+            continue
+        try:
+            validate(value)
+        except sch_interfaces.ValidationError as e:
+            errors.append((index, e))
+
+def _validate_many_text_line(field, values, errors):
+    min_length = field.min_length or 0
+    max_length = field.max_length
+    if max_length is None:
+        max_length = sys.maxsize
+    validate = field.validate
+    for index, value in enumerate(values):
+        # TextLine.constraint forbids newlines.
+        if (type(value) is text_type
+                and min_length <= len(value) <= max_length
+                and '\n' not in value
+                and '\r' not in value):
+            continue
+        try:
+            validate(value)
+        except sch_interfaces.ValidationError as e:
+            errors.append((index, e))
+
+def _validate_many_bool(field, values, errors):
+    validate = field.validate
+    for index, value in enumerate(values):
+        if type(value) is bool:
+            continue
+        try:
+            validate(value)
+        except sch_interfaces.ValidationError as e:
+            errors.append((index, e))
+
+_FAST_KINDS = {
+    nti_field.Int: 'orderable',
+    schema.Int: 'orderable',
+    nti_field.Float: 'orderable',
+    schema.Float: 'orderable',
+    nti_field.ValidTextLine: 'text_line',
+    schema.TextLine: 'text_line',
+    schema.Bool: 'bool',
+}
+
+_FAST_PATHS = {
+    'orderable': _validate_many_orderable,
+    'text_line': _validate_many_text_line,
+    'bool': _validate_many_bool,
+}
+
+def _fast_kind(field):
+    kind = _FAST_KINDS.get(type(field))
+    if kind is None:
+        return None
+    if field.missing_value is not None:
+        # Field.validate accepts the missing value without further checks
+        # (or rejects it if required), so every value must be compared
+        # with it.
+        return None
+    if 'constraint' in field.__dict__:
+        # An instance-specific constraint was given to the constructor.
+        return None
+    return kind
+
+def _fast_path_for(field):
+    return _FAST_PATHS.get(_fast_kind(field))
+
+def validate_many(field, values):
+    """
+    Validate each of the *values* (an iterable) with *field*.
+
+    This is equivalent to, but faster than, calling
+    ``field.validate(value)`` for each value and collecting the
+    ``ValidationError`` exceptions raised, especially for instances
+    of the exact classes ``Int``, ``Float``, ``TextLine`` (or
+    ``ValidTextLine``) and ``Bool``. The type, bounds and
+    constraint checks for those fields are done inline, and
+    ``validate`` is only called for values that might not be valid.
+
+    :return: A list of ``(index, error)`` pairs, one for each
+        value that is not valid, in order. If all the values are
+        valid, the list is empty.
+    """
+    errors = []
+    fast_path = _fast_path_for(field)
+    if fast_path is not None:
+        fast_path(field, values, errors)
+    else:
+        _validate_each(field, values, errors)
+    return errors
+
+
+# Fields of these exact classes don't use their ``context``
+# when validating, so they don't have to be bound first.
+_CONTEXT_FREE_FIELD_TYPES = frozenset((
+    schema.ASCII,
+    schema.ASCIILine,
+    schema.Bool,
+    schema.Bytes,
+    schema.BytesLine,
+    schema.Complex,
+    schema.Date,
+    schema.Datetime,
+    schema.Decimal,
+    schema.DottedName,
+    schema.Float,
+    schema.Id,
+    schema.Int,
+    schema.Integral,
+    schema.NativeString,
+    schema.NativeStringLine,
+    schema.Number,
+    schema.PythonIdentifier,
+    schema.Rational,
+    schema.Real,
+    schema.Text,
+    schema.TextLine,
+    schema.Time,
+    schema.Timedelta,
+    schema.URI,
+    nti_field.DecodingValidTextLine,
+    nti_field.Float,
+    nti_field.HTTPURL,
+    nti_field.Int,
+    nti_field.Number,
+    nti_field.StrippedValidTextLine,
+    nti_field.ValidBytes,
+    nti_field.ValidBytesLine,
+    nti_field.ValidDatetime,
+    nti_field.ValidRegularExpression,
+    nti_field.ValidText,
+    nti_field.ValidTextLine,
+    nti_field.ValidURI,
+))
+
+def _fast_check_source(field, fname, namespace):
+    # Return the source of an expression that is true only if the
+    # value ``v`` is certainly valid for *field*, or None.
+    # Anything it needs is added to *namespace*.
+    kind = _fast_kind(field)
+    if kind == 'orderable':
+        types = field._type # pylint:disable=protected-access
+        namespace[fname + '_types'] = types if isinstance(types, tuple) else (types,)
+        source = 'type(v) in %s_types' % fname
+        if field.min is not None:
+            namespace[fname + '_min'] = field.min
+            source += ' and v >= %s_min' % fname
+        if field.max is not None:
+            namespace[fname + '_max'] = field.max
+            source += ' and v <= %s_max' % fname
+        return source
+    if kind == 'text_line':
+        source = "type(v) is text_type and '\\n' not in v and '\\r' not in v"
+        if field.min_length:
+            source += ' and len(v) >= %d' % field.min_length
+        if field.max_length is not None:
+            source += ' and len(v) <= %d' % field.max_length
+        return source
+    if kind == 'bool':
+        return 'type(v) is bool'
+    return None
+
+class _ObjectsBeingValidated(threading.local):
+    # Like ``zope.schema._bootstrapfields._ObjectsBeingValidated``.
+
+    def __init__(self):
+        super(_ObjectsBeingValidated, self).__init__()
+        self.ids_being_validated = set()
+
+
+def _find_objects_being_validated(func=get_schema_validation_errors):
+    # zope.schema keeps the objects that ``Object`` fields are
+    # currently validating, which it uses to break cycles, in a private
+    # default argument of *func*. We register in it too so that cyclic
+    # graphs produce the same errors. If that ever changes, use our own;
+    # cycles are still broken, but may be traversed one extra time.
+    for default in getattr(func, '__defaults__', None) or ():
+        if isinstance(getattr(default, 'ids_being_validated', None), set):
+            return default
+    return _ObjectsBeingValidated()
+
+_OBJECTS_BEING_VALIDATED = _find_objects_being_validated()
+
+def _compile_schema_validator(iface):
+    # Generate a function that validates each field of *iface*
+    # in one pass, like
+    # ``zope.schema._bootstrapfields.get_schema_validation_errors``.
+    namespace = {
+        'ValidationError': sch_interfaces.ValidationError,
+        'SchemaNotFullyImplemented': sch_interfaces.SchemaNotFullyImplemented,
+        'text_type': text_type,
+    }
+    lines = []
+    needs_guard = False
+    if iface is not Interface:
+        for i, name in enumerate(iface.names(all=True)):
+            field = iface[name]
+            if (IMethod.providedBy(field)
+                    or not sch_interfaces.IValidatable.providedBy(field)):
+                continue
+            fname = 'f%d' % i
+            namespace[fname] = field
+            lines.append('try:')
+            lines.append('    v = getattr(obj, %r)' % name)
+            indent = '    '
+            fast_check = _fast_check_source(field, fname, namespace)
+            if fast_check:
+                lines.append('    if not (%s):' % fast_check)
+                indent += '    '
+            if type(field) in _CONTEXT_FREE_FIELD_TYPES:
+                namespace[fname + '_validate'] = field.validate
+                lines.append(indent + '%s_validate(v)' % fname)
+            else:
+                needs_guard = True
+                lines.append(indent + '%s.bind(obj).validate(v)' % fname)
+            lines.append('except ValidationError as e:')
+            lines.append('    errors.append((%r, e))' % name)
+            lines.append('except AttributeError as e:')
+            lines.append('    errors.append((%r, SchemaNotFullyImplemented(e)'
+                         '.with_field_and_value(%s, None)))' % (name, fname))
+    if needs_guard:
+        # Only fields that we bind can recurse.
+        namespace['being_validated'] = _OBJECTS_BEING_VALIDATED
+        lines = [
+            'ids = being_validated.ids_being_validated',
+            'id_obj = id(obj)',
+            'if id_obj in ids:',
+            '    return errors',
+            'ids.add(id_obj)',
+            'try:',
+        ] + ['    ' + line for line in lines] + [
+            'finally:',
+            '    ids.remove(id_obj)',
+        ]
+    lines.append('return errors')
+    lines = ['def validate_fields(obj, errors):'] + ['    ' + line for line in lines]
+
+    six.exec_('\n'.join(lines), namespace)
+    return namespace['validate_fields']
+
+
+class SchemaValidator(object):
+    """
+    Validates objects against all the fields of the interface
+    *schema*, and optionally its invariants.
+
+    The results are the same as those of
+    :func:`zope.schema.getValidationErrors`, but each field is
+    validated without the overhead of a loop and, when possible,
+    without making a bound copy of it. Simple values of common field
+    types are checked inline.
+
+    The code to do this is generated the first time it is needed
+    and cached with the *schema*. It is regenerated if the
+    *schema* changes (its bases, or when its ``changed`` method is
+    called); changes to the fields themselves are not otherwise
+    detected.
+    """
+
+    def __init__(self, schema): # pylint:disable=redefined-outer-name
+        self.schema = schema
+
+    def _validate_fields(self):
+        cache_in = _spec_cache(self.schema)
+        try:
+            return cache_in['__nti_schema_validate_fields']
+        except KeyError:
+            result = cache_in['__nti_schema_validate_fields'] = _compile_schema_validator(
+                self.schema)
+            return result
+
+    def getValidationErrors(self, obj, validate_invariants=True):
+        """
+        Validate *obj*, returning a list of ``(name, error)`` pairs
+        for each field (by name) that isn't valid.
+
+        Like :func:`zope.schema.getValidationErrors`, if all fields
+        are valid and *validate_invariants* is true, the invariants
+        of the schema are also checked, and their errors returned
+        with a name of None. Also like that function, this doesn't
+        check whether *obj* provides the schema.
+        """
+        errors = self._validate_fields()(obj, [])
+        if validate_invariants and not errors:
+            invariant_errors = []
+            try:
+                self.schema.validateInvariants(obj, invariant_errors)
+            except Invalid:
+                pass
+            errors.extend((None, e) for e in invariant_errors)
+        return errors
+
+    def validate(self, obj, validate_invariants=True):
+        """
+        Validate *obj*, raising a
+        :class:`zope.schema.interfaces.SchemaNotCorrectlyImplemented`
+        that has all the errors if it isn't valid.
+        """
+        errors = self.getValidationErrors(obj, validate_invariants)
+        if errors:
+            schema_errors = {name: e for name, e in errors if name is not None}
+            invariant_errors = [e for name, e in errors if name is None]
+            raise sch_interfaces.SchemaNotCorrectlyImplemented(
+                [e for _, e in errors],
+                None,
+                schema_errors,
+                invariant_errors,
+            ).with_field_and_value(None, obj)
+
+    def __repr__(self):
+        return '<%s.%s for %r>' % (type(self).__module__, type(self).__name__,
+                                   self.schema)
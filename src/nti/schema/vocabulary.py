@@ -18,25 +18,64 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import weakref
+
+from six import text_type
+
 from zope import component
-from zope.schema.vocabulary import SimpleTerm as _SimpleTerm
+from zope.interface import implementer
+from zope.schema.interfaces import ITitledTokenizedTerm
 from zope.schema.vocabulary import SimpleVocabulary as _SimpleVocabulary
 
 from nti.i18n.locales.interfaces import ICountryAvailability
 
+from nti.schema._readonly import _ReadOnlyDict
+
 __docformat__ = "restructuredtext en"
 
 
-class CountryTerm(_SimpleTerm):
+@implementer(ITitledTokenizedTerm)
+class CountryTerm(object):
     """
     A titled, tokenized term representing a country. The
     token is the ISO3166 country code. The ``flag`` value is a
     browserresource path to an icon representing the country.
+
+    Terms are created like :class:`zope.schema.vocabulary.SimpleTerm`
+    and compare equal to each other the same way, using the value,
+    token and title. As with ``SimpleTerm``, the title is ``None`` if
+    it is not given.
+
+    .. versionchanged:: 1.16.0
+       This class uses ``__slots__`` and is no longer a subclass of
+       ``SimpleTerm``; it never compares equal to a ``SimpleTerm``,
+       and other attributes can't be set on instances. The result of
+       :meth:`toExternalObject` is computed once and can't be
+       modified. All instances provide ``ITitledTokenizedTerm``, even
+       those without a title.
     """
 
-    def __init__(self, *args, **kwargs):
-        self.flag = kwargs.pop('flag', None)
-        super(CountryTerm, self).__init__(*args, **kwargs)
+    __slots__ = (
+        'value',
+        'token',
+        'title',
+        'flag',
+        '_external',
+    )
+
+    def __init__(self, value, token=None, title=None, flag=None):
+        self.value = value
+        if token is None:
+            token = value
+        # Like SimpleTerm, the token is a native string with any
+        # non-ASCII characters escaped.
+        if isinstance(token, bytes):
+            token = token.decode('raw_unicode_escape')
+        elif not isinstance(token, text_type):
+            token = text_type(token)
+        self.token = str(token.encode('ascii', 'backslashreplace').decode('ascii'))
+        self.title = title
+        self.flag = flag
 
     @classmethod
     def fromItem(cls, item):
@@ -48,12 +87,31 @@ class CountryTerm(_SimpleTerm):
         return cls(value, token, title, flag=flag)
 
     def toExternalObject(self):
-        return {
+        try:
+            return self._external
+        except AttributeError:
+            pass
+        external = self._external = _ReadOnlyDict({
             'token': self.token,
             'title': self.title,
             'value': self.value,
             'flag': self.flag
-        }
+        })
+        return external
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if not isinstance(other, CountryTerm):
+            return False
+        return (self.value == other.value and self.token == other.token
+                and self.title == other.title)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.value, self.token, self.title))
 
 class _CountryVocabulary(_SimpleVocabulary):
     """
@@ -63,11 +121,31 @@ class _CountryVocabulary(_SimpleVocabulary):
     def __contains__(self, token):
         return token in self.by_token
 
+# {ICountryAvailability utility: _CountryVocabulary}
+_country_vocabularies = weakref.WeakKeyDictionary()
+
 def CountryVocabularyFactory(context):
     """
     A vocabulary factory.
+
+    .. versionchanged:: 1.16.0
+       The vocabulary is built once for each ``ICountryAvailability``
+       utility, and the same vocabulary is returned while that
+       utility is registered.
     """
     countries = component.getUtility(ICountryAvailability)
-    return _CountryVocabulary([CountryTerm.fromItem(item)
-                               for item
-                               in countries.getCountries().items()])
+    try:
+        return _country_vocabularies[countries]
+    except (KeyError, TypeError):
+        # Not yet built, or the utility can't be weakly referenced
+        # (or hashed); then it's built each time.
+        pass
+
+    vocabulary = _CountryVocabulary([CountryTerm.fromItem(item)
+                                     for item
+                                     in countries.getCountries().items()])
+    try:
+        _country_vocabularies[countries] = vocabulary
+    except TypeError:
+        pass
+    return vocabulary